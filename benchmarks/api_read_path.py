@@ -0,0 +1,86 @@
+"""
+Requests/sec per read endpoint: ORM + response_model (legacy) vs lean column read path.
+
+Needs a migrated and seeded database:
+    python -m benchmarks.api_read_path --requests 500
+
+Both apps run in-process over httpx.ASGITransport, so the numbers show
+handler + serialization cost without network noise. The price cache is
+bypassed to measure the read path itself.
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from src import schemas
+from src.api.dependencies import get_price_cache
+from src.db.database import get_db
+from src.db.models import Item, Location, MarketPrice, TrackedItem
+from src.main import app as lean_app
+from src.services.price_cache import PriceCache
+
+# --- Legacy handlers (ORM entities + Pydantic response_model) ---
+legacy = APIRouter()
+
+
+@legacy.get("/locations", response_model=list[schemas.LocationRead])
+async def legacy_locations(db: AsyncSession = Depends(get_db)):
+    return (await db.execute(select(Location))).scalars().all()
+
+
+@legacy.get("/items", response_model=list[schemas.ItemRead])
+async def legacy_items(q: str, limit: int = 20, db: AsyncSession = Depends(get_db)):
+    query = select(Item).where(Item.unique_name.ilike(f"%{q}%") | Item.display_name.ilike(f"%{q}%")).limit(limit)
+    return (await db.execute(query)).scalars().all()
+
+
+@legacy.get("/prices/{item_unique_name}", response_model=list[schemas.MarketPriceRead])
+async def legacy_prices(item_unique_name: str, db: AsyncSession = Depends(get_db)):
+    item = (await db.execute(select(Item).where(Item.unique_name == item_unique_name))).scalar_one_or_none()
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return (await db.execute(select(MarketPrice).where(MarketPrice.item_id == item.id))).scalars().all()
+
+
+@legacy.get("/tracked-items", response_model=list[schemas.TrackedItemRead])
+async def legacy_tracked(limit: int = 100, db: AsyncSession = Depends(get_db)):
+    query = select(TrackedItem).options(joinedload(TrackedItem.item), joinedload(TrackedItem.location)).limit(limit)
+    return (await db.execute(query)).scalars().all()
+
+
+legacy_app = FastAPI()
+legacy_app.include_router(legacy)
+
+
+async def requests_per_sec(app: FastAPI, url: str, total: int) -> float:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        (await client.get(url)).raise_for_status()  # warm up
+        start = time.perf_counter()
+        for _ in range(total):
+            await client.get(url)
+        return total / (time.perf_counter() - start)
+
+
+async def main(total: int, item: str):
+    lean_app.dependency_overrides[get_price_cache] = lambda: PriceCache()  # inactive: always miss
+
+    endpoints = ["/locations", "/items?q=bag&limit=50", f"/prices/{item}", "/tracked-items?limit=100"]
+    print(f"{'endpoint':<28}{'legacy rps':>12}{'lean rps':>12}{'gain':>8}")
+    for url in endpoints:
+        before = await requests_per_sec(legacy_app, url, total)
+        after = await requests_per_sec(lean_app, url, total)
+        print(f"{url:<28}{before:>12.0f}{after:>12.0f}{after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--item", default="T4_BAG")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.item))
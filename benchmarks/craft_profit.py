@@ -0,0 +1,103 @@
+"""
+Craft-profit evaluation: per-recipe Python loop vs one vectorized NumPy pass.
+
+Runs over the full ao-bin-dumps recipe set with random prices, no database needed:
+    python -m benchmarks.craft_profit                      # downloads SEED_RECIPES_URL
+    python -m benchmarks.craft_profit --dump items.json    # local copy of the raw dump
+    python -m benchmarks.craft_profit --synthetic 20000    # generated recipes, offline
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import numpy as np
+
+from src.services.crafting import Recipe, RecipeBook, evaluate, parse_recipes
+from src.services.crafting.recipes import Material
+
+LOCATIONS = 7
+RETURN_RATE = 0.152
+TAX_RATE = 0.065
+
+
+async def load_recipes(dump_path: str | None) -> list[Recipe]:
+    if dump_path:
+        with open(dump_path, encoding="utf-8") as f:
+            return parse_recipes(json.load(f))
+
+    from src.config import get_settings
+    from src.seeding.providers.albion_api import AlbionApiProvider
+    return parse_recipes(await AlbionApiProvider(get_settings().SEED_RECIPES_URL).fetch())
+
+
+def synthetic_recipes(count: int, seed: int = 1) -> list[Recipe]:
+    rng = np.random.default_rng(seed)
+    materials = [f"T{t}_RES{r}" for t in range(4, 9) for r in range(40)]
+    return [
+        Recipe(
+            product_names=(f"T4_PRODUCT_{i}",),
+            materials=tuple(
+                Material(materials[m], float(rng.integers(1, 33)), bool(rng.random() > 0.1))
+                for m in rng.choice(len(materials), size=rng.integers(1, 5), replace=False)
+            ),
+            amount=float(rng.choice([1, 1, 1, 5, 10])),
+        )
+        for i in range(count)
+    ]
+
+
+def loop_evaluate(book: RecipeBook, prices: np.ndarray) -> np.ndarray:
+    """Reference implementation: what a straightforward per-item calculator does."""
+    profit = np.empty((book.size, prices.shape[1]))
+    for r in range(book.size):
+        start, end = book.indptr[r], book.indptr[r + 1]
+        for loc in range(prices.shape[1]):
+            cost = book.silver[r]
+            for m in range(start, end):
+                rate = RETURN_RATE if book.material_returnable[m] else 0.0
+                cost += prices[book.material_index[m], loc] * book.material_count[m] * (1 - rate)
+            value = prices[book.products[r], loc] * (1 - TAX_RATE)
+            profit[r, loc] = value - cost / book.amounts[r]
+    return profit
+
+
+def report(label: str, timings: list[float]) -> None:
+    print(f"{label:<22} mean={statistics.mean(timings):9.2f} ms  min={min(timings):9.2f} ms")
+
+
+async def main(dump_path: str | None, synthetic: int, rounds: int):
+    recipes = synthetic_recipes(synthetic) if synthetic else await load_recipes(dump_path)
+
+    names = sorted({n for r in recipes for n in r.product_names} | {m.unique_name for r in recipes for m in r.materials})
+    book = RecipeBook.build(recipes, {name: i + 1 for i, name in enumerate(names)})
+
+    rng = np.random.default_rng(7)
+    prices = rng.integers(10, 100_000, size=(len(book.names), LOCATIONS)).astype(np.float64)
+    prices[rng.random(prices.shape) < 0.2] = np.nan  # unknown prices
+    print(f"recipes: {book.size}, items: {len(book.names)}, locations: {LOCATIONS}, rounds: {rounds}")
+
+    loop, vectorized = [], []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        expected = loop_evaluate(book, prices)
+        loop.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        result = evaluate(book, prices, RETURN_RATE, TAX_RATE)
+        vectorized.append((time.perf_counter() - start) * 1000)
+
+    assert np.allclose(result.profit, expected, equal_nan=True)
+    report("python loop", loop)
+    report("numpy (one pass)", vectorized)
+    print(f"speedup: x{statistics.mean(loop) / statistics.mean(vectorized):.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dump", help="Path to a local raw items.json")
+    parser.add_argument("--synthetic", type=int, default=0, help="Generate N recipes instead of the real dump")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.dump, args.synthetic, args.rounds))
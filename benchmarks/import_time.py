@@ -0,0 +1,52 @@
+"""
+Cold import time of the API and worker entry points, from `python -X importtime`.
+
+No database needed (DB_* settings are removed from the environment):
+    python -m benchmarks.import_time --runs 5
+
+Wall-clock numbers depend on the machine and its load, so they are reported
+here instead of asserted in the test suite; test/unit/test_import_time.py
+guards the lazy imports that keep them low.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Reference budgets, seconds (best of several runs)
+IMPORT_BUDGETS = {
+    "src.main": 2.5,
+    "src.worker": 1.5,
+}
+
+
+def import_time(module: str) -> float:
+    """Cumulative import time of `module`, seconds."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("DB_")}
+    env["PYTHONPATH"] = str(ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=60
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", result.stderr, re.M)
+    return int(match.group(1)) / 1e6
+
+
+def main(runs: int):
+    print(f"{'module':<14}{'best s':>8}{'budget s':>10}")
+    for module, budget in IMPORT_BUDGETS.items():
+        best = min(import_time(module) for _ in range(runs))
+        print(f"{module:<14}{best:>8.2f}{budget:>10.2f}{'' if best < budget else '  over budget'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    main(args.runs)
@@ -0,0 +1,75 @@
+"""
+Payload size and client decode time per negotiated response encoding.
+
+Needs a migrated and seeded database with prices:
+    python -m benchmarks.response_encoding --items 500
+
+"Full market snapshot" = POST /prices/bulk for the first N items, plus
+one page of 1000 tracked items. Runs in-process over httpx.ASGITransport,
+bodies are decoded by hand to time the client side.
+"""
+import argparse
+import asyncio
+import gzip
+import statistics
+import time
+
+import brotli
+import httpx
+import msgpack
+import orjson
+from sqlalchemy import select
+
+from src.api.dependencies import get_price_cache
+from src.db.database import async_session_maker
+from src.db.models import Item
+from src.main import app
+from src.services.price_cache import PriceCache
+
+VARIANTS = {
+    "json": ({"Accept": "application/json", "Accept-Encoding": "identity"}, orjson.loads),
+    "json + gzip": ({"Accept": "application/json", "Accept-Encoding": "gzip"}, lambda b: orjson.loads(gzip.decompress(b))),
+    "json + br": ({"Accept": "application/json", "Accept-Encoding": "br"}, lambda b: orjson.loads(brotli.decompress(b))),
+    "msgpack": ({"Accept": "application/msgpack", "Accept-Encoding": "identity"}, msgpack.unpackb),
+    "msgpack + br": ({"Accept": "application/msgpack", "Accept-Encoding": "br"}, lambda b: msgpack.unpackb(brotli.decompress(b))),
+}
+
+
+async def measure(client: httpx.AsyncClient, method: str, url: str, payload, rounds: int) -> None:
+    print(f"\n{method} {url}")
+    print(f"{'variant':<16}{'bytes':>12}{'ratio':>8}{'request ms':>12}{'decode ms':>11}")
+    baseline = None
+    for label, (headers, decode) in VARIANTS.items():
+        request_ms, decode_ms = [], []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            async with client.stream(method, url, json=payload, headers=headers) as response:
+                response.raise_for_status()
+                raw = b"".join([chunk async for chunk in response.aiter_raw()])
+            request_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            decode(raw)
+            decode_ms.append((time.perf_counter() - start) * 1000)
+
+        baseline = baseline or len(raw)
+        print(f"{label:<16}{len(raw):>12}{baseline / len(raw):>7.1f}x"
+              f"{statistics.median(request_ms):>12.2f}{statistics.median(decode_ms):>11.2f}")
+
+
+async def main(items: int, rounds: int):
+    app.dependency_overrides[get_price_cache] = lambda: PriceCache()  # inactive: always miss
+    async with async_session_maker() as db:
+        names = list((await db.execute(select(Item.unique_name).order_by(Item.id).limit(items))).scalars())
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        await measure(client, "POST", "/prices/bulk", {"unique_names": names}, rounds)
+        await measure(client, "GET", "/tracked-items?limit=1000", None, rounds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.rounds))
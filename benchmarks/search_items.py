@@ -0,0 +1,70 @@
+"""
+Item search latency: legacy ILIKE seq scan vs pg_trgm GIN search.
+
+Needs a migrated and seeded database (full ao-bin-dumps catalog):
+    python -m src.scripts.seed_db
+    python -m benchmarks.search_items --rounds 20
+
+"Before" runs the original query with index scans disabled,
+which is what Postgres did before the trigram indexes existed.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import select, func, text
+
+from src import queries
+from src.db.database import async_session_maker
+from src.db.models import Item
+
+TERMS = ["BAG", "bag", "sword", "T4_", "T8_MAIN", "Adept", "ore", "LEVEL2", "Elder's", "cape", "ROCK", "plate"]
+
+
+async def legacy_search(db, q: str, limit: int = 20):
+    query = select(Item).where(
+        Item.unique_name.ilike(f"%{q}%") | Item.display_name.ilike(f"%{q}%")
+    ).limit(limit)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def measure(db, search, rounds: int) -> list[float]:
+    timings = []
+    for _ in range(rounds):
+        for q in TERMS:
+            start = time.perf_counter()
+            await search(db, q)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label:<28} mean={statistics.mean(timings):7.2f} ms  p50={statistics.median(timings):7.2f} ms  p95={p95:7.2f} ms")
+
+
+async def main(rounds: int):
+    async with async_session_maker() as db:
+        total = (await db.execute(select(func.count()).select_from(Item))).scalar_one()
+    print(f"items: {total}, terms: {len(TERMS)}, rounds: {rounds}")
+
+    async with async_session_maker() as db, db.begin():
+        await db.execute(text("SET LOCAL enable_bitmapscan = off"))
+        await db.execute(text("SET LOCAL enable_indexscan = off"))
+        before = await measure(db, legacy_search, rounds)
+
+    async with async_session_maker() as db, db.begin():
+        after = await measure(db, queries.search_items, rounds)
+
+    report("before (ILIKE, seq scan)", before)
+    report("after (pg_trgm GIN)", after)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
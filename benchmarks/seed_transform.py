@@ -0,0 +1,81 @@
+"""
+ItemsSeeder transform: ItemDTO validation per entry (dicts) vs the precompiled
+one-pass fast path (tuples), over the full ao-bin-dumps formatted/items.json.
+
+    python -m benchmarks.seed_transform                      # downloads SEED_ITEMS_URL
+    python -m benchmarks.seed_transform --dump items.json    # local copy
+    python -m benchmarks.seed_transform --synthetic 12000    # generated entries, offline
+"""
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+from unittest.mock import MagicMock
+
+from src.seeding.config import SeedingConfig
+from src.seeding.seeders.items import ITEM_COLUMNS, ItemsSeeder
+
+LANGUAGES = ["EN-US", "DE-DE", "FR-FR", "RU-RU", "PL-PL", "ES-ES", "PT-BR", "IT-IT", "ZH-CN", "KO-KR", "JA-JP"]
+
+
+async def load_entries(dump_path: str | None) -> list[dict]:
+    if dump_path:
+        with open(dump_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    from src.config import get_settings
+    from src.seeding.providers.albion_api import AlbionApiProvider
+    return await AlbionApiProvider(get_settings().SEED_ITEMS_URL).fetch()
+
+
+def synthetic_entries(count: int) -> list[dict]:
+    return [
+        {
+            "UniqueName": f"T{i % 8 + 1}_ITEM_{i}" + (f"@{i % 4}" if i % 4 else ""),
+            "LocalizedNames": {lang: f"Item {i} ({lang})" for lang in LANGUAGES} if i % 10 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_transform(seeder: ItemsSeeder, entries: list[dict]) -> list[dict]:
+    """Pre-fast-path behaviour: ItemDTO per entry, dict rows."""
+    return [row for row in map(seeder.transform_item, entries) if row is not None]
+
+
+def report(label: str, timings: list[float], rows: int) -> None:
+    mean = statistics.mean(timings)
+    print(f"{label:<26} mean={mean:8.2f} ms  min={min(timings):8.2f} ms  {rows / mean * 1000:>12,.0f} rows/s")
+
+
+async def main(dump_path: str | None, synthetic: int, rounds: int):
+    logging.disable(logging.WARNING)  # invalid entries are logged per row
+    entries = synthetic_entries(synthetic) if synthetic else await load_entries(dump_path)
+    seeder = ItemsSeeder(MagicMock(), SeedingConfig(items_source_url="https://bench.local/items.json"), MagicMock())
+
+    legacy, fast = [], []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        expected = legacy_transform(seeder, entries)
+        legacy.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        rows = seeder.transform_data(entries)
+        fast.append((time.perf_counter() - start) * 1000)
+
+    assert rows == [tuple(row[c] for c in ITEM_COLUMNS) for row in expected], "fast path output differs"
+    print(f"entries: {len(entries)}, rows: {len(rows)}, rounds: {rounds}")
+    report("ItemDTO + dicts", legacy, len(rows))
+    report("one-pass + tuples", fast, len(rows))
+    print(f"speedup: x{statistics.mean(legacy) / statistics.mean(fast):.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dump", help="Path to a local formatted/items.json")
+    parser.add_argument("--synthetic", type=int, default=0, help="Generate N entries instead of the real dump")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.dump, args.synthetic, args.rounds))
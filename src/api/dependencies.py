@@ -0,0 +1,23 @@
+from fastapi import Request
+
+from src.services.crafting import CraftingService
+from src.services.price_cache import PriceCache
+from src.services.price_cube import PriceCube
+from src.services.price_feed import PriceFeed
+
+
+# Dependencies for FastAPI: process-wide services created in the app lifespan
+def get_price_cache(request: Request) -> PriceCache:
+    return request.app.state.price_cache
+
+
+def get_price_cube(request: Request) -> PriceCube:
+    return request.app.state.price_cube
+
+
+def get_price_feed(request: Request) -> PriceFeed:
+    return request.app.state.price_feed
+
+
+def get_crafting_service(request: Request) -> CraftingService:
+    return request.app.state.crafting
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     SEED_ITEMS_URL: str = "https://raw.githubusercontent.com/broderickhyman/ao-bin-dumps/master/formatted/items.json"
     SEED_MIN_TIER: int = 4
     SEED_MAX_TIER: int = 8
+    # Local items snapshot (seed_db.py --export-items); seeds items offline, a missing file is an error
+    SEED_ITEMS_SNAPSHOT: Optional[str] = None
+    # Raw dump with craftingrequirements (the formatted one has no recipes)
+    SEED_RECIPES_URL: str = "https://raw.githubusercontent.com/broderickhyman/ao-bin-dumps/master/items.json"
     ENABLE_TRACKING_SEEDING: bool = True
 
     # Albion API Settings
@@ -31,6 +35,18 @@ class Settings(BaseSettings):
     INGESTOR_RATE_LIMIT: float = 0.60
     INGESTOR_SLEEP_SEC: int = 30
 
+    # API Cache Settings
+    PRICE_CACHE_MAX_ITEMS: int = 5000
+    PRICE_CACHE_TTL_SEC: float = 300.0
+    # Load the in-memory price cube at startup (otherwise on first use)
+    PRICE_CUBE_PRELOAD: bool = True
+    # Market snapshot written by the worker, mapped by every API process
+    MARKET_SNAPSHOT_PATH: Optional[str] = None
+    MARKET_SNAPSHOT_MAX_AGE_SEC: float = 3600.0
+
+    # Crafting Settings
+    CRAFT_RETURN_RATE: float = 0.152  # royal city without focus
+
 
     @property
     def DATABASE_URL(self) -> str:
@@ -39,6 +55,13 @@ class Settings(BaseSettings):
         """
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASS.get_secret_value()}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def ASYNCPG_DSN(self) -> str:
+        """
+        Plain DSN for raw asyncpg connections (LISTEN/NOTIFY).
+        """
+        return f"postgresql://{self.DB_USER}:{self.DB_PASS.get_secret_value()}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
 
     # --- Start Settings ---
     model_config = SettingsConfigDict(
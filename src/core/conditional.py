@@ -0,0 +1,51 @@
+import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Mapping, Optional
+
+# Conditional GET helpers (RFC 9110: ETag / Last-Modified / 304 Not Modified)
+
+
+def make_etag(key: int, count: int, last_modified: Optional[datetime.datetime]) -> str:
+    """Weak validator from the size and newest last_updated of a result set."""
+    stamp = int(last_modified.timestamp() * 1_000_000) if last_modified else 0
+    return f'W/"{key}-{count}-{stamp:x}"'
+
+
+def http_date(value: datetime.datetime) -> str:
+    return format_datetime(value.astimezone(datetime.timezone.utc), usegmt=True)
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime.datetime]) -> dict:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def has_validators(headers: Mapping[str, str]) -> bool:
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def is_not_modified(headers: Mapping[str, str], etag: str, last_modified: Optional[datetime.datetime]) -> bool:
+    """If-None-Match wins over If-Modified-Since when both are sent."""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        # Weak comparison: W/"x" matches "x"
+        return "*" in candidates or _opaque(etag) in {_opaque(tag) for tag in candidates}
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=datetime.timezone.utc)
+        # HTTP dates have one second resolution
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
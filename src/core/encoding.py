@@ -0,0 +1,131 @@
+import gzip
+from typing import Optional
+
+import brotli
+import msgpack
+import orjson
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Response content negotiation: MessagePack via Accept, br / gzip via Accept-Encoding
+
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+COMPRESSIBLE_TYPES = ("application/json", "application/msgpack", "application/x-ndjson", "text/")
+# Server preference on equal q-values
+ENCODINGS = ("br", "gzip")
+
+
+def parse_qvalues(header: str) -> dict[str, float]:
+    """'br;q=1.0, gzip;q=0.5' -> {'br': 1.0, 'gzip': 0.5}"""
+    values = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        values[token.strip().lower()] = q
+    return values
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = parse_qvalues(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in ENCODINGS:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def wants_msgpack(accept: str) -> bool:
+    """MessagePack only when asked for explicitly and not ranked below JSON."""
+    accepted = parse_qvalues(accept)
+    msgpack_q = max(accepted.get(t, 0.0) for t in MSGPACK_TYPES)
+    json_q = accepted.get("application/json", accepted.get("application/*", accepted.get("*/*", 0.0)))
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+class ResponseEncodingMiddleware:
+    """
+    Re-encodes complete JSON responses as MessagePack and compresses bodies
+    of at least `minimum_size` bytes with brotli or gzip.
+
+    Streaming responses (SSE, NDJSON exports) pass through untouched:
+    buffering them would break incremental delivery.
+
+    Every complete 2xx response it could have re-encoded carries Vary, also
+    when this request got the plain body (no Accept-Encoding, below
+    minimum_size), so shared caches keep the representations apart.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        coding = negotiate_encoding(headers.get("accept-encoding", ""))
+        to_msgpack = wants_msgpack(headers.get("accept", ""))
+        start: Optional[Message] = None
+
+        async def send_encoded(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            response_start, start = start, None
+            if message.get("more_body", False):
+                await send(response_start)
+                await send(message)
+                return
+
+            body = self._encode(response_start, message.get("body", b""), coding, to_msgpack)
+            await send(response_start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_encoded)
+
+    def _encode(self, start: Message, body: bytes, coding: Optional[str], to_msgpack: bool) -> bytes:
+        headers = MutableHeaders(scope=start)
+        if not 200 <= start["status"] < 300 or "content-encoding" in headers:
+            return body
+        content_type = headers.get("content-type", "")
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return body
+
+        if content_type.startswith("application/json"):
+            headers.add_vary_header("Accept")
+        headers.add_vary_header("Accept-Encoding")
+
+        if to_msgpack and content_type.startswith("application/json"):
+            body = msgpack.packb(orjson.loads(body))
+            headers["content-type"] = MSGPACK_TYPES[0]
+            content_type = MSGPACK_TYPES[0]
+
+        if coding and len(body) >= self.minimum_size:
+            if coding == "br":
+                body = brotli.compress(body, quality=self.brotli_quality)
+            else:
+                body = gzip.compress(body, compresslevel=self.gzip_level)
+            headers["content-encoding"] = coding
+
+        headers["content-length"] = str(len(body))
+        return body
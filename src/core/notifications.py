@@ -0,0 +1,156 @@
+import asyncio
+import inspect
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Set, Tuple, Union
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel used by the ingestor to announce committed price changes
+PRICE_UPDATES_CHANNEL = "price_updates"
+
+# NOTIFY payload is limited to 8000 bytes, keep a safe margin per message
+MAX_IDS_PER_NOTIFICATION = 500
+
+
+@dataclass(frozen=True)
+class PriceUpdate:
+    """Set of items whose prices changed in one location."""
+    location_id: int
+    item_ids: Tuple[int, ...]
+
+
+def encode_price_updates(location_id: int, item_ids: Iterable[int]) -> List[str]:
+    """
+    Builds NOTIFY payloads for changed items.
+    Large sets are split into several messages to respect the payload limit.
+    """
+    ids = sorted(set(item_ids))
+    return [
+        json.dumps({"l": location_id, "i": ids[i: i + MAX_IDS_PER_NOTIFICATION]}, separators=(",", ":"))
+        for i in range(0, len(ids), MAX_IDS_PER_NOTIFICATION)
+    ]
+
+
+def decode_price_update(payload: str) -> PriceUpdate:
+    data = json.loads(payload)
+    return PriceUpdate(location_id=int(data["l"]), item_ids=tuple(int(i) for i in data["i"]))
+
+
+UpdateHandler = Callable[[PriceUpdate], Union[None, Awaitable[None]]]
+StateHandler = Callable[[bool], Union[None, Awaitable[None]]]
+
+
+class PriceUpdateListener:
+    """
+    Background LISTEN on PRICE_UPDATES_CHANNEL with automatic reconnect.
+
+    Subscribers get every PriceUpdate. State handlers are told when the
+    connection goes up or down: while it is down notifications are lost,
+    so anything caching prices must drop its state.
+    """
+
+    def __init__(self, dsn: str, channel: str = PRICE_UPDATES_CHANNEL, reconnect_delay: float = 5.0):
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+
+        self._update_handlers: List[UpdateHandler] = []
+        self._state_handlers: List[StateHandler] = []
+        self._pending: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._connected_event = asyncio.Event()
+        self.connected = False
+
+    def subscribe(self, handler: UpdateHandler) -> None:
+        self._update_handlers.append(handler)
+
+    def on_state_change(self, handler: StateHandler) -> None:
+        self._state_handlers.append(handler)
+
+    async def wait_connected(self, timeout: float) -> bool:
+        """Waits until LISTEN is active. Returns False on timeout."""
+        try:
+            await asyncio.wait_for(self._connected_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run(), name="price-update-listener")
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._set_state(False)
+
+    # --- Internals ---
+    def _dispatch(self, handlers: List[Callable[..., Any]], arg: Any) -> None:
+        for handler in handlers:
+            try:
+                result = handler(arg)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self._pending.add(task)
+                    task.add_done_callback(self._handler_done)
+            except Exception as e:
+                logger.exception(f"Price update handler failed: {e}")
+
+    def _handler_done(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Price update handler failed", exc_info=task.exception())
+
+    def _set_state(self, connected: bool) -> None:
+        if self.connected != connected:
+            self.connected = connected
+            if connected:
+                self._connected_event.set()
+            else:
+                self._connected_event.clear()
+            self._dispatch(self._state_handlers, connected)
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        try:
+            update = decode_price_update(payload)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Malformed notification on '{channel}': {e}")
+            return
+        self._dispatch(self._update_handlers, update)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            conn = None
+            try:
+                conn = await asyncpg.connect(self.dsn)
+                terminated = asyncio.Event()
+                conn.add_termination_listener(lambda _: terminated.set())
+                await conn.add_listener(self.channel, self._on_notification)
+
+                logger.info(f"Listening for price updates on '{self.channel}'")
+                self._set_state(True)
+                await terminated.wait()
+                logger.warning("Price update listener connection lost.")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Price update listener unavailable: {e}")
+            finally:
+                self._set_state(False)
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+            await asyncio.sleep(self.reconnect_delay)
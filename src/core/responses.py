@@ -0,0 +1,22 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+# OPT_UTC_Z keeps datetimes identical to Pydantic output ("...Z" for UTC)
+JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def dump_json(content: Any) -> bytes:
+    return orjson.dumps(content, option=JSON_OPTIONS)
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    orjson-rendered response for rows from src/queries.py.
+    Returning it from an endpoint skips response_model validation,
+    the response_model is then used for OpenAPI docs only.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
@@ -1,29 +1,21 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
-from typing import Optional, List
+from sqlalchemy import select, update, delete, literal, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Optional
 
-from src.db.models import Location, Item, TrackedItem, MarketPrice
-from src.schemas import TrackedItemCreate
+from src.db.models import Location, Item, TrackedItem
+from src.schemas import TrackedItemCreate, TrackedItemsSelector
 
-# --- Locations ---
-async def get_all_locations(db: AsyncSession) -> list[Location]:
-    result = await db.execute(select(Location))
-    return result.scalars().all()
+# Write path and single-entity lookups (ORM).
+# Read-only listings for API responses live in src/queries.py.
 
+# --- Locations ---
 async def get_location_by_api_name(db: AsyncSession, api_name: str) -> Optional[Location]:
     query = select(Location).where(Location.api_name == api_name)
     result = await db.execute(query)
     return result.scalar_one_or_none()
 
 # --- Items ---
-async def search_items_by_name(db: AsyncSession, q: str, limit: int = 20) -> list[Item]:
-    query = select(Item).where(
-        Item.unique_name.ilike(f"%{q}%") | Item.display_name.ilike(f"%{q}%")
-    ).limit(limit)
-    result = await db.execute(query)
-    return result.scalars().all()
-
 async def get_item_by_unique_name(db: AsyncSession, unique_name: str) -> Optional[Item]:
     query = select(Item).where(Item.unique_name == unique_name)
     result = await db.execute(query)
@@ -47,16 +39,91 @@ async def create_tracked_item(db: AsyncSession, item: Item, location: Location)
     new_track.location = location
     return new_track
 
-async def get_all_tracked_items(db: AsyncSession) -> list[TrackedItem]:
-    query = select(TrackedItem).options(
-        joinedload(TrackedItem.item),
-        joinedload(TrackedItem.location)
+# --- Bulk Tracking ---
+def _selector_items(selector: TrackedItemsSelector):
+    """Item id subquery for a selector."""
+    query = select(Item.id)
+    if selector.unique_names:
+        query = query.where(Item.unique_name.in_(selector.unique_names))
+    if selector.base_name:
+        query = query.where(Item.base_name == selector.base_name)
+    if selector.unique_name_pattern:
+        query = query.where(Item.unique_name.regexp_match(selector.unique_name_pattern))
+    if selector.tier_min is not None:
+        query = query.where(Item.tier >= selector.tier_min)
+    if selector.tier_max is not None:
+        query = query.where(Item.tier <= selector.tier_max)
+    if selector.enchant_min is not None:
+        query = query.where(Item.enchantment_level >= selector.enchant_min)
+    if selector.enchant_max is not None:
+        query = query.where(Item.enchantment_level <= selector.enchant_max)
+    if selector.category:
+        query = query.where(Item.category == selector.category)
+    if selector.resource_family:
+        query = query.where(Item.resource_family == selector.resource_family)
+    if selector.is_refined is not None:
+        query = query.where(Item.is_refined == selector.is_refined)
+    if selector.family_key:
+        query = query.where(Item.family_key == selector.family_key)
+    return query
+
+def _selector_locations(selector: TrackedItemsSelector):
+    query = select(Location.id)
+    if selector.locations:
+        query = query.where(Location.api_name.in_(selector.locations))
+    return query
+
+async def bulk_add_tracked_items(db: AsyncSession, selector: TrackedItemsSelector, priority: int, is_active: bool) -> int:
+    """INSERT ... SELECT items x locations ON CONFLICT DO NOTHING. Returns number of new pairs."""
+    items = _selector_items(selector).subquery()
+    locations = _selector_locations(selector).subquery()
+    pairs = (
+        select(items.c.id, locations.c.id, literal(is_active), literal(priority))
+        .select_from(items)
+        .join(locations, true())
     )
-    result = await db.execute(query)
-    return result.scalars().all()
+    stmt = pg_insert(TrackedItem).from_select(
+        ["item_id", "location_id", "is_active", "priority"], pairs
+    ).on_conflict_do_nothing(index_elements=["item_id", "location_id"])
 
-# --- Prices ---
-async def get_prices_by_item_id(db: AsyncSession, item_id: int) -> list[MarketPrice]:
-    query = select(MarketPrice).where(MarketPrice.item_id == item_id)
-    result = await db.execute(query)
-    return result.scalars().all()
\ No newline at end of file
+    result = await db.execute(stmt)
+    await db.commit()
+    return result.rowcount
+
+async def bulk_update_tracked_items(
+        db: AsyncSession,
+        selector: TrackedItemsSelector,
+        priority: Optional[int] = None,
+        is_active: Optional[bool] = None
+) -> int:
+    values = {}
+    if priority is not None:
+        values["priority"] = priority
+    if is_active is not None:
+        values["is_active"] = is_active
+
+    stmt = (
+        update(TrackedItem)
+        .where(
+            TrackedItem.item_id.in_(_selector_items(selector)),
+            TrackedItem.location_id.in_(_selector_locations(selector))
+        )
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    await db.commit()
+    return result.rowcount
+
+async def bulk_remove_tracked_items(db: AsyncSession, selector: TrackedItemsSelector) -> int:
+    stmt = (
+        delete(TrackedItem)
+        .where(
+            TrackedItem.item_id.in_(_selector_items(selector)),
+            TrackedItem.location_id.in_(_selector_locations(selector))
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    await db.commit()
+    return result.rowcount
@@ -1,27 +1,55 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
 from src.config import get_settings
 
-# get settings from config
-settings = get_settings()
+# Engine and session maker are created on first use (or by init_engine() from
+# the app lifespan / worker / scripts), so importing models stays cheap and
+# does not need DB settings.
+_engine: Optional[AsyncEngine] = None
+_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
 
-# engine
-# URL from settings
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=(settings.MODE == "DEV")  # Logs SQL only in DEV mode
-)
 
-# Session Maker
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False
-)
+def init_engine(url: Optional[str] = None, **engine_kwargs) -> AsyncEngine:
+    """Creates the process-wide engine. Idempotent."""
+    global _engine, _session_maker
+
+    if _engine is None:
+        settings = get_settings()
+        engine_kwargs.setdefault("echo", settings.MODE == "DEV")  # Logs SQL only in DEV mode
+        _engine = create_async_engine(url or settings.DATABASE_URL, **engine_kwargs)
+
+        _session_maker = async_sessionmaker(
+            _engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False
+        )
+    return _engine
+
+
+async def dispose_engine() -> None:
+    """Closes pooled connections. The next use creates a fresh engine."""
+    global _engine, _session_maker
+
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_maker = None
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    if _session_maker is None:
+        init_engine()
+    return _session_maker
+
+
+def async_session_maker() -> AsyncSession:
+    """New session from the process-wide session maker."""
+    return get_session_maker()()
+
 
 # Base Model Class
 class Base(DeclarativeBase):
@@ -31,4 +59,4 @@ class Base(DeclarativeBase):
 # Dependency для FastAPI
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
-        yield session
\ No newline at end of file
+        yield session
@@ -46,6 +46,12 @@ class Item(Base):
 
     display_name: Mapped[Optional[str]] = mapped_column(String(255))
 
+    # Classification computed by ItemsSeeder (src.models.items.classify_item)
+    category: Mapped[Optional[str]] = mapped_column(String(32))
+    resource_family: Mapped[Optional[str]] = mapped_column(String(16))
+    is_refined: Mapped[bool] = mapped_column(Boolean, default=False, server_default=text("false"))
+    family_key: Mapped[Optional[str]] = mapped_column(String(100))
+
     __table_args__ = (
         Index(
             "idx_items_high_tier",
@@ -53,6 +59,24 @@ class Item(Base):
             postgresql_where=text("tier >= 4")
         ),
         Index("idx_items_lookup", "base_name", "tier", "enchantment_level"),
+        Index("idx_items_category", "category", "tier"),
+        Index("idx_items_family", "family_key", "tier", "enchantment_level"),
+        Index(
+            "idx_items_resource",
+            "resource_family", "is_refined", "tier",
+            postgresql_where=text("resource_family IS NOT NULL")
+        ),
+        # Trigram indexes (pg_trgm) for ILIKE '%q%' search
+        Index(
+            "idx_items_unique_name_trgm", "unique_name",
+            postgresql_using="gin",
+            postgresql_ops={"unique_name": "gin_trgm_ops"}
+        ),
+        Index(
+            "idx_items_display_name_trgm", "display_name",
+            postgresql_using="gin",
+            postgresql_ops={"display_name": "gin_trgm_ops"}
+        ),
     )
 
     def __repr__(self):
@@ -121,4 +145,23 @@ class TrackedItem(Base):
     location: Mapped["Location"] = relationship()
 
     def __repr__(self):
-        return f"<TrackedItem(item={self.item_id}, loc={self.location_id})>"
\ No newline at end of file
+        return f"<TrackedItem(item={self.item_id}, loc={self.location_id})>"
+
+class SeedState(Base):
+    """Last successfully seeded version of an external source (HTTP validators + content hash)."""
+    __tablename__ = "seed_state"
+
+    source: Mapped[str] = mapped_column(String(255), primary_key=True)
+    etag: Mapped[Optional[str]] = mapped_column(String(255))
+    last_modified: Mapped[Optional[str]] = mapped_column(String(64))
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    row_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return f"<SeedState(source='{self.source}', etag={self.etag})>"
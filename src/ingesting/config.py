@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -11,4 +12,6 @@ class IngestorConfig(BaseSettings):
     max_rate: float = Field(default=0.50, gt=0, description="Maximum number of requests per second")
     concurrency: int = Field(default=1, ge=1, description="Maximum number of simultaneous tasks (for asyncio.gather)")
     request_timeout: float = Field(default=10.0, gt=0, description="HTTP request timeout in seconds")
-    batch_size: int = Field(default=50, ge=1, le=100, description="Number of items in a single request (to avoid 414 URI Too Long)")
\ No newline at end of file
+    batch_size: int = Field(default=50, ge=1, le=100, description="Number of items in a single request (to avoid 414 URI Too Long)")
+    market_snapshot_path: Optional[str] = Field(default=None, description="Write a market snapshot for the API processes here")
+    market_snapshot_interval: float = Field(default=60.0, gt=0, description="Seconds between market snapshots")
@@ -1,10 +1,11 @@
 from typing import List, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, and_, or_
+from sqlalchemy import select, update, and_, or_, func
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import datetime, timezone, timedelta
 
 from src.db.models import TrackedItem, Location, MarketPrice, Item
+from src.core.notifications import PRICE_UPDATES_CHANNEL, encode_price_updates
 
 
 class IngestorRepository:
@@ -113,6 +114,12 @@ class IngestorRepository:
                 )
                 await self.session.execute(stmt_price)
 
+                # 2.1 Notify API processes. Postgres delivers NOTIFY only on commit,
+                # so listeners never see items of a rolled back batch.
+                changed_ids = [p['item_id'] for p in clean_prices]
+                for payload in encode_price_updates(location_id, changed_ids):
+                    await self.session.execute(select(func.pg_notify(PRICE_UPDATES_CHANNEL, payload)))
+
             # 3. Update Tracked Items
             # only existing items
             tracked_ids_int = [name_to_id_map[name] for name in items_checked if name in name_to_id_map]
@@ -1,7 +1,67 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from src.routers import locations, items, tracking, prices
+from src.config import get_settings
+from src.core.encoding import ResponseEncodingMiddleware
+from src.core.notifications import PriceUpdateListener
+from src.core.responses import FastJSONResponse
+from src.db.database import async_session_maker, init_engine, dispose_engine
+from src.services.crafting import CraftingService
+from src.services.price_cache import PriceCache
+from src.services.price_cube import PriceCube
+from src.services.price_feed import PriceFeed
+from src.routers import locations, items, tracking, prices, analytics, crafting
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    init_engine()
+
+    # Price cache, invalidated by ingestor notifications
+    app.state.price_cache = PriceCache(
+        max_items=settings.PRICE_CACHE_MAX_ITEMS,
+        ttl_sec=settings.PRICE_CACHE_TTL_SEC
+    )
+    # Live price feed (SSE subscribers)
+    app.state.price_feed = PriceFeed()
+    # Whole current market as arrays, kept current by notifications
+    app.state.price_cube = PriceCube(
+        snapshot_path=settings.MARKET_SNAPSHOT_PATH,
+        snapshot_max_age_sec=settings.MARKET_SNAPSHOT_MAX_AGE_SEC
+    )
+    # Craft-profit engine, recipes are loaded on first request
+    app.state.crafting = CraftingService(
+        settings.SEED_RECIPES_URL,
+        return_rate=settings.CRAFT_RETURN_RATE,
+        price_cube=app.state.price_cube
+    )
+
+    listener = PriceUpdateListener(settings.ASYNCPG_DSN)
+    listener.subscribe(lambda update: app.state.price_cache.invalidate_items(update.item_ids))
+    listener.subscribe(app.state.price_feed.handle_update)
+    listener.subscribe(app.state.crafting.handle_update)
+    listener.subscribe(app.state.price_cube.handle_update)
+    listener.on_state_change(app.state.price_cache.set_active)
+    listener.on_state_change(app.state.price_feed.handle_listener_state)
+    listener.on_state_change(app.state.crafting.handle_listener_state)
+    listener.on_state_change(app.state.price_cube.handle_listener_state)
+    app.state.price_listener = listener
+
+    await listener.start()
+    # Loaded once LISTEN is active, so no change falls between the load and the
+    # first notification. Without a listener, crafting reads market_prices instead.
+    if settings.PRICE_CUBE_PRELOAD and await listener.wait_connected(timeout=5.0):
+        async with async_session_maker() as session:
+            await app.state.price_cube.load(session)
+    yield
+    await listener.stop()
+    await dispose_engine()
+
 
-app = FastAPI(title="Albion Market API")
+app = FastAPI(title="Albion Market API", lifespan=lifespan, default_response_class=FastJSONResponse)
+# gzip / brotli and MessagePack, negotiated per request
+app.add_middleware(ResponseEncodingMiddleware, minimum_size=1024)
 
 @app.get("/")
 def read_root():
@@ -11,4 +71,6 @@ def read_root():
 app.include_router(locations.router)
 app.include_router(items.router)
 app.include_router(tracking.router)
-app.include_router(prices.router)
\ No newline at end of file
+app.include_router(prices.router)
+app.include_router(analytics.router)
+app.include_router(crafting.router)
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""Item classification columns
+
+Revision ID: 3b7e9c2d4f18
+Revises: 8d4f2b6c1a93
+Create Date: 2026-10-19 16:40:27.903155
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e9c2d4f18'
+down_revision: Union[str, None] = '8d4f2b6c1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('category', sa.String(length=32), nullable=True))
+    op.add_column('items', sa.Column('resource_family', sa.String(length=16), nullable=True))
+    op.add_column('items', sa.Column('is_refined', sa.Boolean(), server_default=sa.text('false'), nullable=False))
+    op.add_column('items', sa.Column('family_key', sa.String(length=100), nullable=True))
+    op.create_index('idx_items_category', 'items', ['category', 'tier'], unique=False)
+    op.create_index('idx_items_family', 'items', ['family_key', 'tier', 'enchantment_level'], unique=False)
+    op.create_index('idx_items_resource', 'items', ['resource_family', 'is_refined', 'tier'], unique=False, postgresql_where=sa.text('resource_family IS NOT NULL'))
+    # Values are computed by ItemsSeeder: forget the source validators so the
+    # next seed downloads items.json again and fills every row
+    op.execute("DELETE FROM seed_state")
+
+
+def downgrade() -> None:
+    op.drop_index('idx_items_resource', table_name='items', postgresql_where=sa.text('resource_family IS NOT NULL'))
+    op.drop_index('idx_items_family', table_name='items')
+    op.drop_index('idx_items_category', table_name='items')
+    op.drop_column('items', 'family_key')
+    op.drop_column('items', 'is_refined')
+    op.drop_column('items', 'resource_family')
+    op.drop_column('items', 'category')
@@ -0,0 +1,29 @@
+"""Items trigram search
+
+Revision ID: 5c1e7a9d2b40
+Revises: f37e75aead15
+Create Date: 2026-10-19 09:12:40.512733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a9d2b40'
+down_revision: Union[str, None] = 'f37e75aead15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('idx_items_unique_name_trgm', 'items', ['unique_name'], unique=False, postgresql_using='gin', postgresql_ops={'unique_name': 'gin_trgm_ops'})
+    op.create_index('idx_items_display_name_trgm', 'items', ['display_name'], unique=False, postgresql_using='gin', postgresql_ops={'display_name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('idx_items_display_name_trgm', table_name='items', postgresql_using='gin', postgresql_ops={'display_name': 'gin_trgm_ops'})
+    op.drop_index('idx_items_unique_name_trgm', table_name='items', postgresql_using='gin', postgresql_ops={'unique_name': 'gin_trgm_ops'})
+    # Extension is left installed: other objects may depend on it
@@ -1,7 +1,72 @@
 import re
-from typing import Optional, Dict
+from typing import Optional, Dict, NamedTuple
 from pydantic import BaseModel, Field
 
+TIER_PATTERN = re.compile(r"^T(\d+)_")
+ENCHANTMENT_PATTERN = re.compile(r"@(\d+)$")
+
+# Name without tier, _LEVELn and @n: "T4_METALBAR_LEVEL1@1" -> "METALBAR"
+FAMILY_PATTERN = re.compile(r"(?:T\d+_)?(.*?)(?:_LEVEL\d+)?(?:@\d+)?", re.S)
+
+CATEGORY_RESOURCE = "resource"
+CATEGORY_OTHER = "other"
+
+# Resource family key -> raw family it belongs to
+RAW_RESOURCES = {"ORE": "ORE", "WOOD": "WOOD", "HIDE": "HIDE", "FIBER": "FIBER", "ROCK": "ROCK"}
+REFINED_RESOURCES = {"METALBAR": "ORE", "PLANKS": "WOOD", "LEATHER": "HIDE", "CLOTH": "FIBER", "STONEBLOCK": "ROCK"}
+# Names counted as resources, same rule as providers.database.RESOURCE_PATTERN:
+# "T4_ORE" and "T4_ORE_LEVEL1@1" are, "T4_ORE@1" or "T9_ORE" are not
+RESOURCE_NAME_PATTERN = re.compile(rf"T[1-8]_(?:{'|'.join([*RAW_RESOURCES, *REFINED_RESOURCES])})(?:_LEVEL\d+@\d+)?")
+
+# First matching family_key prefix wins
+CATEGORY_PREFIXES = (
+    ("MAIN_", "weapon"),
+    ("2H_TOOL_", "tool"),
+    ("2H_", "weapon"),
+    ("OFF_", "offhand"),
+    ("HEAD_", "armor"),
+    ("ARMOR_", "armor"),
+    ("SHOES_", "armor"),
+    ("BAG", "bag"),
+    ("CAPE", "cape"),
+    ("MOUNT_", "mount"),
+    ("MEAL_", "consumable"),
+    ("POTION_", "consumable"),
+    ("FARM_", "farming"),
+    ("JOURNAL_", "journal"),
+    ("ARTEFACT_", "artifact"),
+    ("RUNE", "enhancement"),
+    ("SOUL", "enhancement"),
+    ("RELIC", "enhancement"),
+)
+
+
+class ItemClass(NamedTuple):
+    category: str
+    resource_family: Optional[str]
+    is_refined: bool
+    family_key: str
+
+
+def classify_item(unique_name: str) -> ItemClass:
+    """
+    Classification stored on items at seed time:
+    "T5_PLANKS_LEVEL2@2" -> ("resource", "WOOD", True, "PLANKS"),
+    "T4_MAIN_SWORD@1" -> ("weapon", None, False, "MAIN_SWORD").
+    """
+    family_key = FAMILY_PATTERN.fullmatch(unique_name).group(1)
+
+    if RESOURCE_NAME_PATTERN.fullmatch(unique_name):
+        raw = RAW_RESOURCES.get(family_key)
+        if raw is not None:
+            return ItemClass(CATEGORY_RESOURCE, raw, False, family_key)
+        return ItemClass(CATEGORY_RESOURCE, REFINED_RESOURCES[family_key], True, family_key)
+
+    for prefix, category in CATEGORY_PREFIXES:
+        if family_key.startswith(prefix):
+            return ItemClass(category, None, False, family_key)
+    return ItemClass(CATEGORY_OTHER, None, False, family_key)
+
 class ItemDTO(BaseModel):
     """
     Data Transfer Object for item from Albion Online.
@@ -19,7 +84,7 @@ class ItemDTO(BaseModel):
     @property
     def tier(self) -> int:
         """Extract tier from name (T4_... -> 4). Default to 1."""
-        match = re.search(r"^T(\d+)_", self.unique_name)
+        match = TIER_PATTERN.search(self.unique_name)
         if match:
             return int(match.group(1))
         return 1
@@ -27,7 +92,7 @@ class ItemDTO(BaseModel):
     @property
     def enchantment_level(self) -> int:
         """Extract enchantment level from name (...@1 -> 1). Default to 0."""
-        match = re.search(r"@(\d+)$", self.unique_name)
+        match = ENCHANTMENT_PATTERN.search(self.unique_name)
         if match:
             return int(match.group(1))
         return 0
@@ -40,6 +105,10 @@ class ItemDTO(BaseModel):
         """
         return None
 
+    @property
+    def classification(self) -> ItemClass:
+        return classify_item(self.unique_name)
+
     class Config:
         extra = "ignore"
         populate_by_name = True
\ No newline at end of file
@@ -0,0 +1,300 @@
+import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_, any_, bindparam, case, func, or_, tuple_, BigInteger, Integer, String, SmallInteger
+from sqlalchemy.dialects.postgresql import ARRAY
+from typing import Optional, Sequence, Tuple, AsyncIterator
+
+from src.db.models import Location, Item, TrackedItem, MarketPrice, MarketHistory
+
+# Read-only queries for API responses.
+# They select only the needed columns and return plain dicts shaped like the
+# response schemas, so routers can serialize them directly (no ORM entities,
+# no second pass through Pydantic).
+
+ITEM_COLUMNS = (Item.id, Item.unique_name, Item.base_name, Item.tier, Item.enchantment_level, Item.display_name)
+
+PRICE_COLUMNS = (
+    MarketPrice.item_id, MarketPrice.location_id, MarketPrice.quality_level,
+    MarketPrice.sell_price_min, MarketPrice.sell_price_min_date,
+    MarketPrice.sell_price_max, MarketPrice.sell_price_max_date,
+    MarketPrice.buy_price_min, MarketPrice.buy_price_min_date,
+    MarketPrice.buy_price_max, MarketPrice.buy_price_max_date,
+    MarketPrice.last_updated,
+)
+
+
+async def _fetch_dicts(db: AsyncSession, query) -> list[dict]:
+    result = await db.execute(query)
+    keys = list(result.keys())
+    return [dict(zip(keys, row)) for row in result.all()]
+
+# --- Locations ---
+async def fetch_locations(db: AsyncSession) -> list[dict]:
+    query = select(Location.id, Location.api_name, Location.display_name).order_by(Location.id)
+    return await _fetch_dicts(db, query)
+
+async def resolve_location_ids(db: AsyncSession, api_names: Sequence[str]) -> dict[str, int]:
+    query = select(Location.api_name, Location.id).where(Location.api_name.in_(list(api_names)))
+    result = await db.execute(query)
+    return {row.api_name: row.id for row in result.all()}
+
+# --- Items ---
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+async def search_items(db: AsyncSession, q: str, limit: int = 20, category: Optional[str] = None) -> list[dict]:
+    """
+    Substring search served by the pg_trgm GIN indexes (idx_items_*_trgm).
+    Ranking: exact match, then prefix match, then trigram similarity.
+    `category` narrows the result to a seeded items.category.
+    """
+    term = _escape_like(q)
+    display_name = func.coalesce(Item.display_name, "")
+
+    rank = case(
+        (or_(func.lower(Item.unique_name) == q.lower(), func.lower(display_name) == q.lower()), 0),
+        (or_(Item.unique_name.ilike(f"{term}%", escape="\\"), display_name.ilike(f"{term}%", escape="\\")), 1),
+        else_=2
+    )
+    similarity = func.greatest(func.similarity(Item.unique_name, q), func.similarity(display_name, q))
+
+    query = (
+        select(*ITEM_COLUMNS)
+        .where(
+            Item.unique_name.ilike(f"%{term}%", escape="\\") | Item.display_name.ilike(f"%{term}%", escape="\\")
+        )
+        .order_by(rank, similarity.desc(), Item.unique_name)
+        .limit(limit)
+    )
+    if category:
+        query = query.where(Item.category == category)
+    return await _fetch_dicts(db, query)
+
+async def resolve_item_ids(db: AsyncSession, unique_names: Sequence[str]) -> dict[str, int]:
+    query = select(Item.unique_name, Item.id).where(
+        Item.unique_name == any_(bindparam("names", list(unique_names), type_=ARRAY(String)))
+    )
+    result = await db.execute(query)
+    return {row.unique_name: row.id for row in result.all()}
+
+# --- Tracking ---
+def _tracked_items_query(
+        after: Optional[Tuple[int, int]] = None,
+        location_api_name: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        priority: Optional[int] = None
+):
+    """
+    Flat column select of tracked pairs ordered by the primary key (item_id, location_id),
+    so keyset pagination walks the PK index instead of OFFSET scans.
+    """
+    query = (
+        select(
+            TrackedItem.item_id, TrackedItem.location_id,
+            TrackedItem.is_active, TrackedItem.priority, TrackedItem.last_check,
+            Item.unique_name, Item.base_name, Item.tier, Item.enchantment_level,
+            Item.display_name.label("item_display_name"),
+            Location.api_name, Location.display_name.label("location_display_name"),
+        )
+        .join(Item, TrackedItem.item_id == Item.id)
+        .join(Location, TrackedItem.location_id == Location.id)
+        .order_by(TrackedItem.item_id, TrackedItem.location_id)
+    )
+    if after is not None:
+        query = query.where(tuple_(TrackedItem.item_id, TrackedItem.location_id) > tuple_(*after))
+    if location_api_name is not None:
+        query = query.where(Location.api_name == location_api_name)
+    if is_active is not None:
+        query = query.where(TrackedItem.is_active == is_active)
+    if priority is not None:
+        query = query.where(TrackedItem.priority == priority)
+    return query
+
+def _tracked_item_row_to_dict(row) -> dict:
+    """Row -> TrackedItemRead-compatible dict."""
+    return {
+        "item_id": row.item_id,
+        "location_id": row.location_id,
+        "is_active": row.is_active,
+        "priority": row.priority,
+        "last_check": row.last_check,
+        "item": {
+            "id": row.item_id,
+            "unique_name": row.unique_name,
+            "base_name": row.base_name,
+            "tier": row.tier,
+            "enchantment_level": row.enchantment_level,
+            "display_name": row.item_display_name,
+        },
+        "location": {
+            "id": row.location_id,
+            "api_name": row.api_name,
+            "display_name": row.location_display_name,
+        },
+    }
+
+async def fetch_tracked_items_page(
+        db: AsyncSession,
+        limit: int,
+        after: Optional[Tuple[int, int]] = None,
+        location_api_name: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        priority: Optional[int] = None
+) -> list[dict]:
+    query = _tracked_items_query(after, location_api_name, is_active, priority).limit(limit)
+    result = await db.execute(query)
+    return [_tracked_item_row_to_dict(row) for row in result.all()]
+
+async def stream_tracked_items(
+        db: AsyncSession,
+        after: Optional[Tuple[int, int]] = None,
+        location_api_name: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        priority: Optional[int] = None,
+        chunk_size: int = 1000
+) -> AsyncIterator[dict]:
+    """Server-side cursor: only chunk_size rows are held in memory at a time."""
+    query = _tracked_items_query(after, location_api_name, is_active, priority)
+    result = await db.stream(query.execution_options(yield_per=chunk_size))
+    async for partition in result.partitions():
+        for row in partition:
+            yield _tracked_item_row_to_dict(row)
+
+# --- Prices ---
+async def fetch_item_prices(db: AsyncSession, unique_name: str) -> Optional[Tuple[int, list[dict]]]:
+    """
+    Item lookup and its prices in one round trip (items LEFT JOIN market_prices).
+    Returns (item_id, MarketPriceRead-compatible dicts) or None for an unknown item.
+    """
+    query = (
+        select(Item.id.label("known_item_id"), *PRICE_COLUMNS)
+        .outerjoin(MarketPrice, MarketPrice.item_id == Item.id)
+        .where(Item.unique_name == unique_name)
+    )
+    result = await db.execute(query)
+    rows = result.all()
+    if not rows:
+        return None
+
+    keys = [column.key for column in PRICE_COLUMNS]
+    prices = [dict(zip(keys, row[1:])) for row in rows if row.item_id is not None]
+    return rows[0].known_item_id, prices
+
+async def fetch_price_rows(db: AsyncSession, item_ids: Sequence[int], location_id: int) -> list[dict]:
+    """Current rows of changed items in one location (live feed diffs)."""
+    query = (
+        select(Item.unique_name, *PRICE_COLUMNS)
+        .join(Item, Item.id == MarketPrice.item_id)
+        .where(
+            MarketPrice.item_id == any_(bindparam("item_ids", list(item_ids), type_=ARRAY(Integer))),
+            MarketPrice.location_id == location_id
+        )
+        .order_by(MarketPrice.item_id, MarketPrice.quality_level)
+    )
+    return await _fetch_dicts(db, query)
+
+async def fetch_item_prices_version(
+        db: AsyncSession,
+        unique_name: str
+) -> Optional[Tuple[int, int, Optional[datetime.datetime]]]:
+    """
+    Cheap aggregate for conditional GET: (item_id, row count, max last_updated).
+    Returns None for an unknown item.
+    """
+    query = (
+        select(Item.id, func.count(MarketPrice.item_id), func.max(MarketPrice.last_updated))
+        .outerjoin(MarketPrice, MarketPrice.item_id == Item.id)
+        .where(Item.unique_name == unique_name)
+        .group_by(Item.id)
+    )
+    result = await db.execute(query)
+    row = result.first()
+    return tuple(row) if row else None
+
+async def fetch_prices_for_items(
+        db: AsyncSession,
+        unique_names: Sequence[str],
+        location_api_names: Optional[Sequence[str]] = None,
+        qualities: Optional[Sequence[int]] = None
+) -> list:
+    """
+    Resolves names and fetches prices in one query (items LEFT JOIN market_prices).
+    Known items without matching prices come back as a single row with NULL price columns.
+    """
+    join_cond = [MarketPrice.item_id == Item.id]
+    if location_api_names:
+        location_ids = select(Location.id).where(
+            Location.api_name == any_(bindparam("locations", list(location_api_names), type_=ARRAY(String)))
+        )
+        join_cond.append(MarketPrice.location_id.in_(location_ids.scalar_subquery()))
+    if qualities:
+        join_cond.append(
+            MarketPrice.quality_level == any_(bindparam("qualities", list(qualities), type_=ARRAY(SmallInteger)))
+        )
+
+    query = (
+        select(
+            Item.unique_name,
+            Item.id.label("item_id"),
+            MarketPrice.location_id,
+            MarketPrice.quality_level,
+            MarketPrice.sell_price_min,
+            MarketPrice.sell_price_max,
+            MarketPrice.buy_price_min,
+            MarketPrice.buy_price_max,
+            MarketPrice.last_updated,
+        )
+        .outerjoin(MarketPrice, and_(*join_cond))
+        .where(Item.unique_name == any_(bindparam("names", list(unique_names), type_=ARRAY(String))))
+        .order_by(Item.id, MarketPrice.location_id, MarketPrice.quality_level)
+    )
+    result = await db.execute(query)
+    return result.all()
+
+# --- History ---
+async def fetch_price_history(
+        db: AsyncSession,
+        item_id: int,
+        date_from: datetime.datetime,
+        date_to: datetime.datetime,
+        bucket: datetime.timedelta,
+        location_id: Optional[int] = None,
+        quality_level: Optional[int] = None
+) -> dict[str, list]:
+    """
+    Aggregates market_history server-side into date_bin buckets (idx_history_item_time).
+    Returns columnar arrays: timestamps (unix seconds), avg, min, max, count.
+    """
+    bucket_start = func.date_bin(bucket, MarketHistory.timestamp, date_from).label("bucket_start")
+    volume = func.sum(MarketHistory.item_count)
+    weighted_avg = func.coalesce(
+        func.sum(MarketHistory.average_price * MarketHistory.item_count) / func.nullif(volume, 0),
+        func.avg(MarketHistory.average_price)
+    )
+
+    query = (
+        select(
+            func.extract("epoch", bucket_start).cast(BigInteger),
+            func.round(weighted_avg).cast(BigInteger),
+            func.min(MarketHistory.average_price),
+            func.max(MarketHistory.average_price),
+            func.coalesce(volume, 0).cast(BigInteger),
+        )
+        .where(
+            MarketHistory.item_id == item_id,
+            MarketHistory.timestamp >= date_from,
+            MarketHistory.timestamp < date_to,
+        )
+        .group_by(bucket_start)
+        .order_by(bucket_start)
+    )
+    if location_id is not None:
+        query = query.where(MarketHistory.location_id == location_id)
+    if quality_level is not None:
+        query = query.where(MarketHistory.quality_level == quality_level)
+
+    result = await db.execute(query)
+    rows = result.all()
+    columns = list(zip(*rows)) if rows else [()] * 5
+    timestamps, avg, low, high, count = (list(column) for column in columns)
+    return {"timestamps": timestamps, "avg": avg, "min": low, "max": high, "count": count}
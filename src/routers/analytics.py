@@ -0,0 +1,42 @@
+import datetime
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.db.database import get_db
+from src.core.responses import FastJSONResponse
+from src.services.arbitrage import ArbitrageService
+from src import schemas
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["Analytics"]
+)
+
+
+@router.get("/arbitrage", response_model=list[schemas.ArbitrageOpportunity])
+async def get_arbitrage(
+        min_margin: float = Query(0.05, ge=0, description="Minimal profit / buy price"),
+        tax_rate: float = Query(0.04, ge=0, lt=1, description="Market tax and fees on the sell side"),
+        mode: Literal["instant", "order"] = Query("instant", description="Sell to buy orders or list a sell order"),
+        max_age_minutes: int = Query(120, ge=1, description="Ignore prices older than this"),
+        tier_min: Optional[int] = Query(None, ge=1, le=8),
+        tier_max: Optional[int] = Query(None, ge=1, le=8),
+        quality: Optional[int] = Query(None, ge=1, le=5),
+        order_by: Literal["profit", "margin"] = "profit",
+        limit: int = Query(50, ge=1, le=500),
+        db: AsyncSession = Depends(get_db)
+):
+    """Top-K buy-low / sell-high opportunities between cities, across all items."""
+    service = ArbitrageService(db)
+    opportunities = await service.find_opportunities(
+        min_margin=min_margin,
+        tax_rate=tax_rate,
+        mode=mode,
+        max_age=datetime.timedelta(minutes=max_age_minutes),
+        tier_min=tier_min,
+        tier_max=tier_max,
+        quality=quality,
+        limit=limit,
+        order_by=order_by
+    )
+    return FastJSONResponse(opportunities)
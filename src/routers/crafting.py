@@ -0,0 +1,77 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.db.database import get_db
+from src.api.dependencies import get_crafting_service
+from src.core.responses import FastJSONResponse
+from src.services.crafting import CraftingService
+from src.services.crafting.engine import ScenarioGrid
+from src import queries, schemas
+
+router = APIRouter(
+    prefix="/crafting",
+    tags=["Crafting"]
+)
+
+
+@router.get("/stats", response_model=schemas.CraftGraphStats)
+async def get_craft_graph_stats(crafting: CraftingService = Depends(get_crafting_service)):
+    """Incremental recomputation counters of the chain cost graph."""
+    return crafting.stats()
+
+
+@router.get("/profit", response_model=list[schemas.CraftProfitRead])
+async def get_craft_profit(
+        locations: Optional[str] = Query(None, description="Comma-separated location api_names, all if omitted"),
+        return_rate: Optional[float] = Query(None, ge=0, lt=1, description="Resource return rate, CRAFT_RETURN_RATE if omitted"),
+        tax_rate: float = Query(0.065, ge=0, lt=1, description="Market tax and setup fee on the sell side"),
+        min_profit: float = Query(0, description="Minimal profit per crafted unit"),
+        limit: int = Query(50, ge=1, le=1000),
+        chain: bool = Query(False, description="Price materials at min(buy, craft) through refining chains"),
+        db: AsyncSession = Depends(get_db),
+        crafting: CraftingService = Depends(get_crafting_service)
+):
+    """Most profitable craft-and-sell options over current prices, every recipe x city in one pass."""
+    location_ids = None
+    if locations:
+        names = [name.strip() for name in locations.split(",") if name.strip()]
+        found = await queries.resolve_location_ids(db, names)
+        missing = [name for name in names if name not in found]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Unknown locations: {', '.join(missing)}")
+        location_ids = [found[name] for name in names]
+
+    rows = await crafting.top_profits(
+        db,
+        location_ids=location_ids,
+        return_rate=return_rate,
+        tax_rate=tax_rate,
+        min_profit=min_profit,
+        limit=limit,
+        chain=chain
+    )
+    return FastJSONResponse(rows)
+
+
+@router.post("/scenarios", response_model=schemas.CraftScenarioResponse)
+async def sweep_craft_scenarios(
+        payload: schemas.CraftScenarioRequest,
+        db: AsyncSession = Depends(get_db),
+        crafting: CraftingService = Depends(get_crafting_service)
+):
+    """
+    Profit of the given items for every combination of return rate, focus, station fee
+    and market tax, computed in one batched pass. Unknown prices come back as null.
+    """
+    location_ids = await queries.resolve_location_ids(db, [payload.location])
+    if payload.location not in location_ids:
+        raise HTTPException(status_code=404, detail="Location not found")
+
+    grid = ScenarioGrid.product(
+        payload.grid.return_rates,
+        payload.grid.focus,
+        payload.grid.station_fees,
+        payload.grid.tax_rates
+    )
+    result = await crafting.scenario_sweep(db, payload.unique_names, location_ids[payload.location], grid)
+    return FastJSONResponse(result)
@@ -1,7 +1,9 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.database import get_db
-from src import crud, schemas
+from src.core.responses import FastJSONResponse
+from src import queries, schemas
 
 router = APIRouter(
     prefix="/items",
@@ -12,7 +14,8 @@ router = APIRouter(
 async def search_items(
     q: str = Query(..., min_length=2, description="Search items by name ('BAG')"),
     limit: int = Query(20, le=100),
+    category: Optional[str] = Query(None, description="Item category ('resource', 'weapon', 'bag', ...)"),
     db: AsyncSession = Depends(get_db)
 ):
     """Search items by name"""
-    return await crud.search_items_by_name(db, q, limit)
\ No newline at end of file
+    return FastJSONResponse(await queries.search_items(db, q, limit, category))
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.database import get_db
-from src import crud, schemas
+from src.core.responses import FastJSONResponse
+from src import queries, schemas
 
 # Create router for locations
 router = APIRouter(
@@ -12,4 +13,4 @@ router = APIRouter(
 @router.get("", response_model=list[schemas.LocationRead])
 async def get_locations(db: AsyncSession = Depends(get_db)):
     """Get all locations"""
-    return await crud.get_all_locations(db)
\ No newline at end of file
+    return FastJSONResponse(await queries.fetch_locations(db))
@@ -1,7 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import datetime
+import math
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.db.database import get_db
-from src import crud, schemas
+from src.api.dependencies import get_price_cache, get_price_cube, get_price_feed
+from src.core.conditional import has_validators, is_not_modified, make_etag, validator_headers
+from src.core.responses import FastJSONResponse, dump_json
+from src.services.price_cache import PriceCache
+from src.services.price_cube import PriceCube
+from src.services.price_feed import PriceFeed, Subscription
+from src import queries, schemas
 
 router = APIRouter(
     prefix="/prices",
@@ -9,15 +20,195 @@ router = APIRouter(
 )
 
 
+@router.get("/cache/stats", response_model=schemas.PriceCacheStats)
+async def get_price_cache_stats(cache: PriceCache = Depends(get_price_cache)):
+    """Hit/miss statistics of the price response cache."""
+    return cache.stats()
+
+
+@router.get("/cube/stats", response_model=schemas.PriceCubeStats)
+async def get_price_cube_stats(cube: PriceCube = Depends(get_price_cube)):
+    """Size and freshness of the in-memory price cube."""
+    return cube.stats()
+
+
+@router.post("/bulk", response_model=schemas.BulkPricesResponse)
+async def get_bulk_prices(
+        payload: schemas.BulkPricesRequest,
+        db: AsyncSession = Depends(get_db)
+):
+    """Get prices for many items in one request, grouped per item."""
+    rows = await queries.fetch_prices_for_items(db, payload.unique_names, payload.locations, payload.qualities)
+
+    items: dict[str, dict] = {}
+    for row in rows:
+        group = items.get(row.unique_name)
+        if group is None:
+            group = items[row.unique_name] = {"item_id": row.item_id, "prices": []}
+        # LEFT JOIN: known item without matching prices
+        if row.location_id is not None:
+            group["prices"].append([
+                row.location_id, row.quality_level,
+                row.sell_price_min, row.sell_price_max,
+                row.buy_price_min, row.buy_price_max,
+                row.last_updated,
+            ])
+
+    missing = [name for name in dict.fromkeys(payload.unique_names) if name not in items]
+    return FastJSONResponse({"columns": schemas.BULK_PRICE_COLUMNS, "items": items, "missing": missing})
+
+
+@router.get("/stream")
+async def stream_prices(
+        request: Request,
+        items: Optional[str] = Query(None, description="Comma separated unique_names"),
+        locations: Optional[str] = Query(None, description="Comma separated location api_names"),
+        db: AsyncSession = Depends(get_db),
+        feed: PriceFeed = Depends(get_price_feed)
+):
+    """
+    Server-Sent Events feed of price changes, pushed as soon as the ingestor commits.
+    Events: "prices" (changed MarketPriceRead rows + unique_name), "resync" (re-read
+    current prices, updates may have been missed), "overflow" (client too slow, reconnect).
+    """
+    item_names = _split_names(items)
+    location_names = _split_names(locations)
+
+    if not item_names and not location_names:
+        raise HTTPException(status_code=400, detail="Subscribe to at least one item or location")
+    if len(item_names) > 500:
+        raise HTTPException(status_code=400, detail="Too many items (max 500)")
+
+    item_ids = await queries.resolve_item_ids(db, item_names) if item_names else {}
+    location_ids = await queries.resolve_location_ids(db, location_names) if location_names else {}
+
+    unknown = [n for n in item_names if n not in item_ids] + [n for n in location_names if n not in location_ids]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Unknown items or locations: {', '.join(unknown)}")
+
+    sub = feed.subscribe(set(item_ids.values()), set(location_ids.values()))
+    return StreamingResponse(
+        _sse_events(request, feed, sub),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _split_names(value: Optional[str]) -> list[str]:
+    return list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip())) if value else []
+
+
+async def _sse_events(request: Request, feed: PriceFeed, sub: Subscription, keepalive_sec: float = 15.0):
+    try:
+        yield b": subscribed\n\n"
+        while not sub.closed or not sub.queue.empty():
+            try:
+                message = await asyncio.wait_for(sub.queue.get(), timeout=keepalive_sec)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield b": keepalive\n\n"
+                continue
+            yield b"event: " + message["event"].encode() + b"\ndata: " + dump_json(message["data"]) + b"\n\n"
+    finally:
+        feed.unsubscribe(sub)
+
+
 @router.get("/{item_unique_name}", response_model=list[schemas.MarketPriceRead])
 async def get_item_prices(
         item_unique_name: str,
+        request: Request,
+        db: AsyncSession = Depends(get_db),
+        cache: PriceCache = Depends(get_price_cache)
+):
+    """
+    Get prices for a specific item.
+    Supports conditional GET: If-None-Match / If-Modified-Since answer 304.
+    """
+    cached = cache.get(item_unique_name)
+    if cached:
+        headers = validator_headers(cached.etag, cached.last_modified)
+        if is_not_modified(request.headers, cached.etag, cached.last_modified):
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached.body, media_type="application/json", headers=headers)
+
+    # Generation must be taken before reading, see PriceCache
+    generation = cache.generation
+
+    # Revalidation: answer from the aggregate, without loading the rows
+    if has_validators(request.headers):
+        version = await queries.fetch_item_prices_version(db, item_unique_name)
+        if not version:
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        item_id, count, last_modified = version
+        etag = make_etag(item_id, count, last_modified)
+        if is_not_modified(request.headers, etag, last_modified):
+            return Response(status_code=304, headers=validator_headers(etag, last_modified))
+
+    found = await queries.fetch_item_prices(db, item_unique_name)
+
+    if not found:
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    item_id, prices = found
+    last_modified = max((p["last_updated"] for p in prices), default=None)
+    etag = make_etag(item_id, len(prices), last_modified)
+    body = dump_json(prices)
+    cache.set(item_unique_name, item_id, body, generation, etag, last_modified)
+
+    return Response(content=body, media_type="application/json", headers=validator_headers(etag, last_modified))
+
+
+BUCKET_UNITS = {"m": 60, "h": 3600, "d": 86400}
+
+
+@router.get("/{item_unique_name}/history", response_model=schemas.PriceHistoryRead)
+async def get_item_price_history(
+        item_unique_name: str,
+        location: Optional[str] = Query(None, description="Location api_name, all locations if omitted"),
+        quality: Optional[int] = Query(None, ge=1, le=5),
+        date_from: Optional[datetime.datetime] = Query(None, alias="from", description="Default: 30 days before 'to'"),
+        date_to: Optional[datetime.datetime] = Query(None, alias="to", description="Default: now"),
+        bucket: Optional[str] = Query(None, pattern=r"^\d{1,4}[mhd]$", description="Bucket width: 15m, 1h, 1d... (up to 4 digits)"),
+        points: int = Query(200, ge=1, le=1000, description="Max number of buckets"),
         db: AsyncSession = Depends(get_db)
 ):
-    """Get prices for a specific item."""
-    item = await crud.get_item_by_unique_name(db, item_unique_name)
+    """
+    Price history aggregated server-side with date_bin, as columnar arrays.
+    The bucket is widened if needed so that the range fits into `points` buckets.
+    """
+    date_to = _as_utc(date_to) if date_to else datetime.datetime.now(datetime.timezone.utc)
+    date_from = _as_utc(date_from) if date_from else date_to - datetime.timedelta(days=30)
+    if date_from >= date_to:
+        raise HTTPException(status_code=400, detail="'from' must be earlier than 'to'")
 
-    if not item:
+    range_sec = (date_to - date_from).total_seconds()
+    bucket_sec = max(int(bucket[:-1]) * BUCKET_UNITS[bucket[-1]] if bucket else 60, math.ceil(range_sec / points))
+
+    item_ids = await queries.resolve_item_ids(db, [item_unique_name])
+    if not item_ids:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    return await crud.get_prices_by_item_id(db, item.id)
\ No newline at end of file
+    location_id = None
+    if location:
+        location_ids = await queries.resolve_location_ids(db, [location])
+        if not location_ids:
+            raise HTTPException(status_code=404, detail="Location not found")
+        location_id = location_ids[location]
+
+    item_id = item_ids[item_unique_name]
+    series = await queries.fetch_price_history(
+        db, item_id, date_from, date_to, datetime.timedelta(seconds=bucket_sec), location_id, quality
+    )
+    return FastJSONResponse({
+        "item_id": item_id,
+        "location_id": location_id,
+        "quality_level": quality,
+        "bucket_seconds": bucket_sec,
+        **series,
+    })
+
+
+def _as_utc(value: datetime.datetime) -> datetime.datetime:
+    return value.replace(tzinfo=datetime.timezone.utc) if value.tzinfo is None else value
@@ -1,13 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.db.database import get_db
-from src import crud, schemas
+from src.db.database import get_db, async_session_maker
+from src.core.responses import FastJSONResponse, dump_json
+from src import crud, queries, schemas
 
 router = APIRouter(
     prefix="/tracked-items",
     tags=["Tracking"]
 )
 
+# SQLSTATE invalid_regular_expression
+INVALID_REGEX_SQLSTATE = "2201B"
+
+
+async def _bulk(db: AsyncSession, operation) -> dict:
+    """Runs a bulk operation; a pattern Postgres rejects is a client error."""
+    try:
+        return {"affected": await operation}
+    except DBAPIError as e:
+        if getattr(e.orig, "sqlstate", None) != INVALID_REGEX_SQLSTATE:
+            raise
+        await db.rollback()
+        message = str(e.orig).split(": ", 1)[-1]  # drop the driver exception class
+        raise HTTPException(status_code=400, detail=f"Invalid unique_name_pattern: {message}")
+
 @router.post("", response_model=schemas.TrackedItemRead)
 async def add_tracked_item(
     payload: schemas.TrackedItemCreate,
@@ -27,7 +46,62 @@ async def add_tracked_item(
 
     return await crud.create_tracked_item(db, item, location)
 
+@router.post("/bulk", response_model=schemas.TrackedItemsBulkResult)
+async def bulk_add_tracked_items(
+    payload: schemas.TrackedItemsBulkAdd,
+    db: AsyncSession = Depends(get_db)
+):
+    """Track every item x location pair matching the pattern (already tracked pairs are kept)."""
+    return await _bulk(db, crud.bulk_add_tracked_items(db, payload, payload.priority, payload.is_active))
+
+@router.patch("/bulk", response_model=schemas.TrackedItemsBulkResult)
+async def bulk_update_tracked_items(
+    payload: schemas.TrackedItemsBulkUpdate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Change priority and/or is_active of tracked pairs matching the pattern."""
+    return await _bulk(db, crud.bulk_update_tracked_items(db, payload, payload.priority, payload.is_active))
+
+@router.post("/bulk/remove", response_model=schemas.TrackedItemsBulkResult)
+async def bulk_remove_tracked_items(
+    payload: schemas.TrackedItemsSelector,
+    db: AsyncSession = Depends(get_db)
+):
+    """Stop tracking pairs matching the pattern."""
+    return await _bulk(db, crud.bulk_remove_tracked_items(db, payload))
+
 @router.get("", response_model=list[schemas.TrackedItemRead])
-async def get_tracked_items(db: AsyncSession = Depends(get_db)):
-    """Get all tracked items"""
-    return await crud.get_all_tracked_items(db)
\ No newline at end of file
+async def get_tracked_items(
+    limit: int = Query(100, ge=1, le=1000),
+    after: Optional[str] = Query(None, pattern=r"^\d{1,9}:\d{1,9}$", description="Cursor 'item_id:location_id' from X-Next-Cursor"),
+    location: Optional[str] = Query(None, description="Location api_name"),
+    is_active: Optional[bool] = None,
+    priority: Optional[int] = None,
+    format: Literal["json", "ndjson"] = Query("json", description="'ndjson' streams every matching row"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get tracked items, keyset-paginated on (item_id, location_id).
+    The next page cursor is returned in the X-Next-Cursor header.
+    """
+    cursor = tuple(int(part) for part in after.split(":")) if after else None
+
+    if format == "ndjson":
+        return StreamingResponse(
+            _ndjson_export(cursor, location, is_active, priority),
+            media_type="application/x-ndjson"
+        )
+
+    page = await queries.fetch_tracked_items_page(db, limit, cursor, location, is_active, priority)
+    response = FastJSONResponse(page)
+    if len(page) == limit:
+        last = page[-1]
+        response.headers["X-Next-Cursor"] = f"{last['item_id']}:{last['location_id']}"
+    return response
+
+
+async def _ndjson_export(cursor, location, is_active, priority):
+    # Own session: it has to outlive the request handler while the body streams
+    async with async_session_maker() as session:
+        async for row in queries.stream_tracked_items(session, cursor, location, is_active, priority):
+            yield dump_json(row) + b"\n"
\ No newline at end of file
@@ -0,0 +1,272 @@
+import datetime
+import re
+from typing import Annotated, Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+
+# --- Locations ---
+class LocationRead(BaseModel):
+    id: int
+    api_name: str
+    display_name: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# --- Items ---
+class ItemRead(BaseModel):
+    id: int
+    unique_name: str
+    base_name: str
+    tier: int
+    enchantment_level: int
+    display_name: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# --- Tracking ---
+class TrackedItemCreate(BaseModel):
+    item_unique_name: str
+    location_api_name: str
+
+
+class TrackedItemsSelector(BaseModel):
+    """
+    Pattern over items x locations for bulk tracking changes.
+    Item criteria are combined with AND, at least one name or
+    classification criterion is required.
+    """
+    unique_names: Optional[list[str]] = Field(default=None, max_length=5000)
+    base_name: Optional[str] = None
+    unique_name_pattern: Optional[str] = Field(default=None, max_length=200, description="Postgres regex, e.g. '^T[4-8]_BAG'")
+    tier_min: Optional[int] = Field(default=None, ge=1, le=8)
+    tier_max: Optional[int] = Field(default=None, ge=1, le=8)
+    enchant_min: Optional[int] = Field(default=None, ge=0, le=4)
+    enchant_max: Optional[int] = Field(default=None, ge=0, le=4)
+    category: Optional[str] = Field(default=None, description="e.g. 'resource', 'weapon', 'bag'")
+    resource_family: Optional[str] = Field(default=None, description="ORE, WOOD, HIDE, FIBER or ROCK")
+    is_refined: Optional[bool] = None
+    family_key: Optional[str] = Field(default=None, description="Name without tier/enchant, e.g. 'MAIN_SWORD'")
+    locations: Optional[list[str]] = Field(default=None, description="Location api_names, all if omitted")
+
+    @field_validator("unique_name_pattern")
+    @classmethod
+    def check_pattern(cls, value: Optional[str]) -> Optional[str]:
+        # Catches most syntax errors before Postgres sees the pattern
+        if value is not None:
+            try:
+                re.compile(value)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression: {e}")
+        return value
+
+    @model_validator(mode="after")
+    def require_item_criteria(self):
+        # Tier / enchant bounds and is_refined only narrow a selection:
+        # alone they would match almost the whole catalog
+        if not (self.unique_names or self.base_name or self.unique_name_pattern
+                or self.category or self.resource_family or self.family_key):
+            raise ValueError(
+                "At least one name or classification criterion is required "
+                "(unique_names, base_name, unique_name_pattern, category, resource_family or family_key)"
+            )
+        return self
+
+
+class TrackedItemsBulkAdd(TrackedItemsSelector):
+    # tracked_items.priority is a SMALLINT
+    priority: int = Field(default=1, ge=0, le=32767)
+    is_active: bool = True
+
+
+class TrackedItemsBulkUpdate(TrackedItemsSelector):
+    priority: Optional[int] = Field(default=None, ge=0, le=32767)
+    is_active: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def require_changes(self):
+        if self.priority is None and self.is_active is None:
+            raise ValueError("Nothing to update: set priority and/or is_active")
+        return self
+
+
+class TrackedItemsBulkResult(BaseModel):
+    affected: int
+
+
+class TrackedItemRead(BaseModel):
+    item_id: int
+    location_id: int
+    is_active: bool
+    priority: int
+    last_check: Optional[datetime.datetime] = None
+
+    item: ItemRead
+    location: LocationRead
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# --- Prices ---
+class MarketPriceRead(BaseModel):
+    item_id: int
+    location_id: int
+    quality_level: int
+
+    sell_price_min: Optional[int] = None
+    sell_price_min_date: Optional[datetime.datetime] = None
+    sell_price_max: Optional[int] = None
+    sell_price_max_date: Optional[datetime.datetime] = None
+
+    buy_price_min: Optional[int] = None
+    buy_price_min_date: Optional[datetime.datetime] = None
+    buy_price_max: Optional[int] = None
+    buy_price_max_date: Optional[datetime.datetime] = None
+
+    last_updated: datetime.datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Compact row layout of the bulk prices response
+BULK_PRICE_COLUMNS = [
+    "location_id", "quality_level",
+    "sell_price_min", "sell_price_max",
+    "buy_price_min", "buy_price_max",
+    "last_updated",
+]
+
+
+class BulkPricesRequest(BaseModel):
+    unique_names: list[str] = Field(..., min_length=1, max_length=500)
+    locations: Optional[list[str]] = Field(default=None, description="Location api_names, all if omitted")
+    qualities: Optional[list[Annotated[int, Field(ge=1, le=5)]]] = Field(
+        default=None, max_length=5, description="Quality levels 1-5, all if omitted"
+    )
+
+
+class BulkItemPrices(BaseModel):
+    item_id: int
+    prices: list[list[Any]] = Field(description="Rows in BULK_PRICE_COLUMNS order")
+
+
+class BulkPricesResponse(BaseModel):
+    columns: list[str] = BULK_PRICE_COLUMNS
+    items: dict[str, BulkItemPrices]
+    missing: list[str]
+
+
+class PriceHistoryRead(BaseModel):
+    """Columnar time series: the i-th element of every array belongs to timestamps[i]."""
+    item_id: int
+    location_id: Optional[int] = None
+    quality_level: Optional[int] = None
+    bucket_seconds: int
+    timestamps: list[int] = Field(description="Bucket start, unix seconds (UTC)")
+    avg: list[int] = Field(description="Volume-weighted average price")
+    min: list[int]
+    max: list[int]
+    count: list[int] = Field(description="Items sold in the bucket")
+
+
+# --- Analytics ---
+class ArbitrageOpportunity(BaseModel):
+    item_id: int
+    unique_name: str
+    quality_level: int
+    buy_location_id: int
+    sell_location_id: int
+    buy_price: int
+    sell_price: int
+    profit: int = Field(description="Per unit, after tax")
+    margin: float = Field(description="profit / buy_price")
+    buy_price_date: Optional[datetime.datetime] = None
+    sell_price_date: Optional[datetime.datetime] = None
+
+
+# --- Crafting ---
+CRAFT_SCENARIO_MAX_CELLS = 250_000
+
+
+class CraftProfitRead(BaseModel):
+    """Per crafted unit, crafting and selling in the same city."""
+    item_id: int
+    unique_name: str
+    location_id: int
+    material_cost: int = Field(description="Materials after resource return + silver fee")
+    output_value: int = Field(description="Sell price after tax")
+    profit: int
+    margin: Optional[float] = Field(default=None, description="profit / material_cost")
+
+
+class CraftScenarioGrid(BaseModel):
+    """Axes of the what-if grid, every combination is evaluated."""
+    return_rates: list[float] = Field(default=[0.152], min_length=1, max_length=50)
+    focus: list[bool] = Field(default=[False], min_length=1, max_length=2)
+    station_fees: list[float] = Field(default=[0.0], min_length=1, max_length=50,
+                                      description="Share of material market value")
+    tax_rates: list[float] = Field(default=[0.065], min_length=1, max_length=50)
+
+    @model_validator(mode="after")
+    def check_rates(self):
+        for value in self.return_rates + self.station_fees + self.tax_rates:
+            if not 0 <= value < 1:
+                raise ValueError("Rates and fees must be in [0, 1)")
+        return self
+
+    @property
+    def size(self) -> int:
+        return len(self.return_rates) * len(self.focus) * len(self.station_fees) * len(self.tax_rates)
+
+
+class CraftScenarioRequest(BaseModel):
+    unique_names: list[str] = Field(..., min_length=1, max_length=1000)
+    location: str = Field(..., description="Location api_name")
+    grid: CraftScenarioGrid = CraftScenarioGrid()
+
+    @model_validator(mode="after")
+    def limit_cells(self):
+        if len(self.unique_names) * self.grid.size > CRAFT_SCENARIO_MAX_CELLS:
+            raise ValueError(f"Grid too large: at most {CRAFT_SCENARIO_MAX_CELLS} item x scenario cells")
+        return self
+
+
+class CraftScenarioResponse(BaseModel):
+    """Row i of every matrix belongs to items[i], column j to the j-th scenario."""
+    items: list[str]
+    missing: list[str] = Field(description="Unknown or uncraftable items")
+    scenarios: dict[str, list[Any]] = Field(description="Scenario parameters, column-wise")
+    material_cost: list[list[Optional[float]]]
+    profit: list[list[Optional[float]]]
+
+
+class CraftGraphStats(BaseModel):
+    loaded: bool
+    recipes: int
+    batches: int = Field(description="Ingest batches applied incrementally")
+    last_recomputed: int = Field(description="Recipes recomputed for the last batch")
+    recomputed_total: int
+
+
+class PriceCacheStats(BaseModel):
+    active: bool
+    size: int
+    max_items: int
+    hits: int
+    misses: int
+    invalidations: int
+    evictions: int
+    hit_ratio: float
+
+
+class PriceCubeStats(BaseModel):
+    ready: bool
+    items: int
+    locations: int
+    prices: int = Field(description="Filled item x location x quality cells")
+    memory_bytes: int
+    updates: int = Field(description="Notifications applied incrementally")
+    cells_updated: int
+    reloads: int
+    snapshot_generation: Optional[int] = Field(default=None, description="Mapped market snapshot, None if loaded from the database")
@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import logging
 import sys
@@ -9,9 +10,10 @@ logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
-from src.db.database import async_session_maker
+from src.db.database import get_session_maker, init_engine, dispose_engine
 from src.config import get_settings
 from src.seeding.manager import SeedingManager
+from src.seeding.seeders.items_snapshot import export_items_snapshot
 
 
 logging.basicConfig(
@@ -21,22 +23,40 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def main():
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Seed the database")
+    parser.add_argument("--items-snapshot", help="Seed items from this snapshot file (no download)")
+    parser.add_argument("--export-items", help="Only write the seeded item catalog to this snapshot file")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace):
     settings = get_settings()
+    if args.items_snapshot:
+        settings.SEED_ITEMS_SNAPSHOT = args.items_snapshot
 
     logger.info("Initializing database session...")
+    init_engine()
+
+    try:
+        if args.export_items:
+            async with get_session_maker()() as session:
+                rows = await export_items_snapshot(session, args.export_items)
+            logger.info(f"Exported {rows} items to {args.export_items}")
+            return
 
-    async with async_session_maker() as session:
-        try:
-            manager = SeedingManager(session, settings)
-            await manager.seed()
-        except Exception as e:
-            logger.error(f"Seeding failed: {e}")
-            sys.exit(1)
+        # Each seeder opens its own session, independent ones run concurrently
+        manager = SeedingManager(get_session_maker(), settings)
+        await manager.seed()
+    except Exception as e:
+        logger.error(f"Seeding failed: {e}")
+        sys.exit(1)
+    finally:
+        await dispose_engine()
 
 
 if __name__ == "__main__":
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(parse_args()))
\ No newline at end of file
@@ -1,8 +1,13 @@
+from typing import Optional
 from pydantic import BaseModel, HttpUrl
 
 class SeedingConfig(BaseModel):
     items_source_url: HttpUrl
+    # gzip CSV from export_items_snapshot, used instead of items_source_url (must exist when set)
+    items_snapshot_path: Optional[str] = None
     batch_size: int = 1000
     enable_tracking_seeding: bool = True
+    # Generate tracked pairs inside Postgres (no rows over the wire)
+    tracking_server_side: bool = True
     seed_min_tier: int = 4
     seed_max_tier: int = 8
\ No newline at end of file
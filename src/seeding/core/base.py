@@ -1,22 +1,42 @@
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Dict, Any, Type
+from typing import AsyncIterator, Generic, Optional, Tuple, TypeVar, List, Dict, Any, Type
+from sqlalchemy import column, select, values
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 T = TypeVar("T")
 
 
-class BaseSeeder(ABC, Generic[T]):
-    def __init__(self, session: AsyncSession, batch_size: int = 1000):
+class Seeder(ABC):
+    """What SeedingManager runs: a named step with dependencies and its own session."""
+    # Names of seeders that must finish first; SeedingManager runs the rest concurrently
+    depends_on: Tuple[str, ...] = ()
+
+    def __init__(self, session: AsyncSession):
         self.session = session
-        self.batch_size = batch_size
         self.logger = logging.getLogger(f"seeding.{self.name}")
 
     @property
     def name(self) -> str:
         return self.__class__.__name__
 
+    @abstractmethod
+    async def run(self):
+        pass
+
+
+class BaseSeeder(Seeder, Generic[T]):
+    # Set to emit rows as tuples in this column order instead of dicts
+    row_columns: Optional[Tuple[str, ...]] = None
+
+    def __init__(self, session: AsyncSession, batch_size: int = 1000, queue_size: int = 2):
+        super().__init__(session)
+        self.batch_size = batch_size
+        # Batches buffered between the transform and write stages
+        self.queue_size = queue_size
+
     @abstractmethod
     async def _fetch_data(self) -> T:
         pass
@@ -25,6 +45,36 @@ class BaseSeeder(ABC, Generic[T]):
     def transform_data(self, raw_data: T) -> List[Dict[str, Any]]:
         pass
 
+    async def stream_data(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Clean rows, one by one. Default: fetch everything, then transform.
+        Seeders with a streaming source override it to keep memory bounded by batch_size.
+
+        Runs concurrently with batch writes: the session may only be used
+        before the first row is yielded.
+        """
+        for row in self.transform_data(await self._fetch_data()):
+            yield row
+
+    async def batches(self) -> AsyncIterator[List[Any]]:
+        """stream_data grouped into batch_size lists."""
+        batch = []
+        async for row in self.stream_data():
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def on_batch_written(self, batch: List[Any], result) -> None:
+        """Called with the result of each batch statement, before commit."""
+        pass
+
+    async def on_complete(self, written: int):
+        """Called after the last batch is committed."""
+        pass
+
     @abstractmethod
     def get_model(self) -> Type:
         pass
@@ -34,35 +84,67 @@ class BaseSeeder(ABC, Generic[T]):
         pass
 
     async def run(self):
+        """
+        Pipeline: fetch -> transform (batches) -> write. The next batch is
+        prepared while the current one is written; at most queue_size batches
+        wait in between, so memory stays bounded.
+        """
         self.logger.info(f"Start seeding {self.name}")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        producer = asyncio.create_task(self._produce(queue), name=f"{self.name}-transform")
         try:
-            data = await self._fetch_data()
-            clean_data = self.transform_data(data)
-            total = len(clean_data)
+            total = 0
+            while (batch := await queue.get()) is not None:
+                if isinstance(batch, BaseException):
+                    raise batch
+                await self._write_batch(batch, total)
+                total += len(batch)
+
+            await self.on_complete(total)
 
             if total == 0:
                 self.logger.info(f"No data to seed for {self.name}")
                 return
 
-            for i in range(0, total, self.batch_size):
-                batch = clean_data[i: i + self.batch_size]
-                if not batch:
-                    continue
-
-                # Create insert statement
-                model = self.get_model()
-                stmt = pg_insert(model).values(batch)
-
-                stmt = self.get_conflict_statement(stmt)
-
-                await self.session.execute(stmt)
-                await self.session.commit()
-
-                self.logger.info(f"Inserted/Updated batch {i}-{min(i + self.batch_size, total)} of {total}")
-
-            self.logger.info(f"Finished seeding {self.name}")
+            self.logger.info(f"Finished seeding {self.name}: {total} rows")
 
         except Exception as e:
             await self.session.rollback()
             self.logger.error(f"Seeding failed for {self.name}: {e}", exc_info=True)
-            raise e
\ No newline at end of file
+            raise e
+        finally:
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+
+    async def _produce(self, queue: asyncio.Queue):
+        # Errors are handed to the writer, None marks the end of the stream
+        try:
+            async for batch in self.batches():
+                await queue.put(batch)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
+    async def _write_batch(self, batch: List[Any], offset: int):
+        # Create insert statement
+        model = self.get_model()
+        if self.row_columns:
+            # Tuples: INSERT ... SELECT FROM (VALUES ...), no per-row dicts
+            table = model.__table__
+            rows = values(*(column(c, table.c[c].type) for c in self.row_columns), name="rows").data(batch)
+            stmt = pg_insert(model).from_select(self.row_columns, select(rows))
+        else:
+            stmt = pg_insert(model).values(batch)
+
+        stmt = self.get_conflict_statement(stmt)
+
+        result = await self.session.execute(stmt)
+        self.on_batch_written(batch, result)
+        await self.session.commit()
+
+        self.logger.info(f"Inserted/Updated batch {offset}-{offset + len(batch)}")
\ No newline at end of file
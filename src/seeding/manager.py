@@ -1,61 +1,128 @@
+import asyncio
 import logging
-from sqlalchemy.ext.asyncio import AsyncSession
+import os
+import time
+from typing import Callable, Dict, List, Tuple, Type
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.config import Settings
 from src.seeding.config import SeedingConfig
-from src.seeding.providers.albion_api import AlbionApiProvider
+from src.seeding.core.base import Seeder
+from src.seeding.providers.albion_stream import AlbionStreamProvider
+from src.models.items import CATEGORY_RESOURCE
 from src.seeding.providers.database import DatabaseProvider
 from src.seeding.seeders.items import ItemsSeeder
+from src.seeding.seeders.items_snapshot import ItemsSnapshotSeeder
 from src.seeding.seeders.tracking import TrackedItemsSeeder
 from src.seeding.seeders.locations import LocationsSeeder
 
+SeederFactory = Callable[[AsyncSession], Seeder]
+
 
 class SeedingManager:
-    def __init__(self, session: AsyncSession, settings: Settings):
-        self.session = session
+    """
+    Runs seeders as a dependency graph (Seeder.depends_on): every seeder
+    starts as soon as its dependencies are done, independent ones run
+    concurrently, each with its own session.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession], settings: Settings):
+        self.session_maker = session_maker
         self.settings = settings
         self.logger = logging.getLogger(__name__)
+        self.timings: Dict[str, float] = {}
 
         # Initializing the seating configuration from the basic settings
         self.config = SeedingConfig(
             items_source_url=settings.SEED_ITEMS_URL,
             seed_min_tier=settings.SEED_MIN_TIER,
-            seed_max_tier=settings.SEED_MAX_TIER
+            seed_max_tier=settings.SEED_MAX_TIER,
+            items_snapshot_path=settings.SEED_ITEMS_SNAPSHOT
         )
 
+    def get_seeders(self) -> Dict[str, Tuple[Type[Seeder], SeederFactory]]:
+        """Seeder name -> (class, factory(session)); the class carries depends_on."""
+        seeders: Dict[str, Tuple[Type[Seeder], SeederFactory]] = {
+            ItemsSeeder.__name__: self._items_seeder(),
+            LocationsSeeder.__name__: (LocationsSeeder, LocationsSeeder),
+        }
+        if self.config.enable_tracking_seeding:
+            seeders[TrackedItemsSeeder.__name__] = (TrackedItemsSeeder, self._tracked_items_seeder)
+        return seeders
+
     async def seed(self):
         self.logger.info("Starting seeding process...")
+        seeders = self.get_seeders()
+        dependencies = {name: list(cls.depends_on) for name, (cls, _) in seeders.items()}
 
-        try:
-            # 1. Seed Items
-            await self._seed_items()
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in self._topological_order(dependencies):
+            deps = [tasks[d] for d in dependencies[name]]
+            factory = seeders[name][1]
+            tasks[name] = asyncio.create_task(self._run_seeder(name, factory, deps), name=f"seed-{name}")
 
-            # 2. Seed Locations
-            await self._seed_locations()
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        self._report_timings()
 
-            # 3. Seed Tracked Items
-            if self.config.enable_tracking_seeding:
-                await self._seed_tracked_items()
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            self.logger.error("seeding process aborted due to error.")
+            raise errors[0]
+        self.logger.info("seeding completed successfully.")
 
-            self.logger.info("seeding completed successfully.")
+    async def _run_seeder(self, name: str, factory: SeederFactory, dependencies: List[asyncio.Task]):
+        if dependencies:
+            # A failed dependency fails this seeder too
+            await asyncio.gather(*dependencies)
 
-        except Exception as e:
-            self.logger.error("seeding process aborted due to error.")
-            raise e
-
-    async def _seed_items(self):
-        self.logger.info("Initializing ItemsSeeder...")
-        provider = AlbionApiProvider(str(self.config.items_source_url))
-        seeder = ItemsSeeder(self.session, self.config, provider)
-        await seeder.run()
-
-    async def _seed_locations(self):
-        self.logger.info("Initializing LocationsSeeder...")
-        seeder = LocationsSeeder(self.session)
-        await seeder.run()
-
-    async def _seed_tracked_items(self):
-        self.logger.info("Initializing TrackedItemsSeeder...")
-        provider = DatabaseProvider(self.session, resource_only=True)
-        seeder = TrackedItemsSeeder(self.session, provider)
-        await seeder.run()
\ No newline at end of file
+        self.logger.info(f"Initializing {name}...")
+        start = time.perf_counter()
+        async with self.session_maker() as session:
+            await factory(session).run()
+        self.timings[name] = time.perf_counter() - start
+
+    def _items_seeder(self) -> Tuple[Type[Seeder], SeederFactory]:
+        snapshot = self.config.items_snapshot_path
+        if snapshot:
+            # Configured explicitly: a missing file is an error, not a silent download
+            if not os.path.exists(snapshot):
+                raise FileNotFoundError(f"Items snapshot not found: {snapshot}")
+            self.logger.info(f"Items are seeded from snapshot {snapshot}")
+            return ItemsSnapshotSeeder, lambda session: ItemsSnapshotSeeder(
+                session, snapshot, items_source=str(self.config.items_source_url)
+            )
+        return ItemsSeeder, lambda session: ItemsSeeder(
+            session, self.config, AlbionStreamProvider(str(self.config.items_source_url))
+        )
+
+    def _tracked_items_seeder(self, session: AsyncSession) -> TrackedItemsSeeder:
+        if self.config.tracking_server_side:
+            return TrackedItemsSeeder(session, category=CATEGORY_RESOURCE)
+        return TrackedItemsSeeder(session, DatabaseProvider(session, resource_only=True))
+
+    @staticmethod
+    def _topological_order(dependencies: Dict[str, List[str]]) -> List[str]:
+        order: List[str] = []
+        visiting = set()
+
+        def visit(name: str):
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"Seeder dependency cycle at {name}")
+            visiting.add(name)
+            for dependency in dependencies[name]:
+                if dependency not in dependencies:
+                    raise ValueError(f"{name} depends on {dependency}, which is not scheduled")
+                visit(dependency)
+            visiting.discard(name)
+            order.append(name)
+
+        for name in dependencies:
+            visit(name)
+        return order
+
+    def _report_timings(self):
+        if self.timings:
+            summary = ", ".join(f"{name} {sec:.2f}s" for name, sec in self.timings.items())
+            self.logger.info(f"Seeder timings: {summary}")
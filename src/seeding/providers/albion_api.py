@@ -1,20 +1,23 @@
+import asyncio
 import httpx
 import logging
 from typing import List, Any
 from src.seeding.core.interfaces import IDataProvider
 
 class AlbionApiProvider(IDataProvider):
-    def __init__(self, url: str):
+    def __init__(self, url: str, timeout: float = 60.0):
         self.url = url
+        self.timeout = timeout
         self.logger = logging.getLogger(__name__)
 
     async def fetch(self) -> List[Any]:
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
             for attempt in range(3):
                 try:
                     response = await client.get(self.url)
                     response.raise_for_status()
-                    return response.json()
+                    # Large dumps: decode off the event loop
+                    return await asyncio.to_thread(response.json)
                 except httpx.HTTPStatusError as e:
                     if 500 <= e.response.status_code < 600:
                         self.logger.warning(f"Server error {e.response.status_code}, retrying ({attempt+1}/3)...")
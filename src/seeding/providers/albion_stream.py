@@ -0,0 +1,90 @@
+import hashlib
+import httpx
+import ijson
+import logging
+from typing import Any, AsyncIterator, List, Optional
+from src.seeding.core.interfaces import IDataProvider
+
+
+class AlbionStreamProvider(IDataProvider):
+    """
+    Streams a JSON array (ao-bin-dumps formatted/items.json) and yields its
+    elements one by one while the body is still downloading, so the whole
+    document is never held in memory.
+
+    Conditional: with etag / last_modified of the previously seeded version,
+    a 304 answer yields nothing and sets `not_modified`. After a full read
+    etag, last_modified and content_hash (sha256) describe the new version.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            prefix: str = "item",
+            chunk_size: int = 64 * 1024,
+            timeout: float = 60.0,
+            etag: Optional[str] = None,
+            last_modified: Optional[str] = None
+    ):
+        self.url = url
+        self.prefix = prefix  # ijson path of the elements: "item" = top-level array
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash: Optional[str] = None
+        self.not_modified = False
+
+    def _conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    async def fetch(self) -> List[Any]:
+        return [entry async for entry in self.stream()]
+
+    async def stream(self) -> AsyncIterator[Any]:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            for attempt in range(3):
+                yielded = False
+                try:
+                    async with client.stream("GET", self.url, headers=self._conditional_headers()) as response:
+                        if response.status_code == 304:
+                            self.not_modified = True
+                            return
+                        response.raise_for_status()
+                        self.etag = response.headers.get("etag")
+                        self.last_modified = response.headers.get("last-modified")
+
+                        digest = hashlib.sha256()
+                        parsed = ijson.sendable_list()
+                        parser = ijson.items_coro(parsed, self.prefix, use_float=True)
+                        async for chunk in response.aiter_bytes(self.chunk_size):
+                            digest.update(chunk)
+                            parser.send(chunk)
+                            for entry in parsed:
+                                yielded = True
+                                yield entry
+                            del parsed[:]
+                        parser.close()
+                        for entry in parsed:
+                            yield entry
+                        self.content_hash = digest.hexdigest()
+                    return
+
+                except httpx.HTTPStatusError as e:
+                    if 500 <= e.response.status_code < 600 and attempt < 2:
+                        self.logger.warning(f"Server error {e.response.status_code}, retrying ({attempt+1}/3)...")
+                        continue
+                    raise
+                except httpx.RequestError as e:
+                    # Rows already handed out cannot be taken back: only retry a clean start
+                    if yielded or attempt == 2:
+                        raise
+                    self.logger.warning(f"Request error {e}, retrying ({attempt+1}/3)...")
+                    continue
@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.seeding.core.interfaces import IDataProvider
 from src.db.models import Item, Location
+from src.models.items import CATEGORY_RESOURCE
 
 
 RESOURCE_TYPES = [
@@ -11,8 +12,10 @@ RESOURCE_TYPES = [
     "METALBAR", "PLANKS", "LEATHER", "CLOTH", "STONEBLOCK"  # Materials
 ]
 
-# Regular expression for resource names
-RESOURCE_PATTERN = re.compile(rf"^T[1-8]_({'|'.join(RESOURCE_TYPES)})(_LEVEL\d+@\d+)?$")
+# Regular expression for resource names (same syntax in Python and Postgres "~").
+# Seeded items carry it as items.category = 'resource', prefer that indexed column.
+RESOURCE_REGEX = rf"^T[1-8]_({'|'.join(RESOURCE_TYPES)})(_LEVEL\d+@\d+)?$"
+RESOURCE_PATTERN = re.compile(RESOURCE_REGEX)
 
 
 class DatabaseProvider(IDataProvider):
@@ -20,31 +23,21 @@ class DatabaseProvider(IDataProvider):
         """
         :param session: Database session
         :param resource_only: If True, provider will return only items
-                              that are resources (by regex).
+                              that are resources (items.category).
                               If False, will return ALL items from the database.
         """
         self.session = session
         self.resource_only = resource_only
 
     async def fetch(self) -> Dict[str, List[int]]:
-        # 1. Request ID and UniqueName
-        # unique_name is needed for regular expression verification
-        items_stmt = select(Item.id, Item.unique_name)
+        # 1. Request item IDs, resources are filtered by the indexed category column
+        items_stmt = select(Item.id)
+        if self.resource_only:
+            items_stmt = items_stmt.where(Item.category == CATEGORY_RESOURCE)
         items_result = await self.session.execute(items_stmt)
-        all_items = items_result.all()  # List of tuples (id, unique_name)
+        item_ids = list(items_result.scalars().all())
 
-        #2. Filtering items
-        if self.resource_only:
-            # We only keep the IDs whose unique_name matches the resource template
-            item_ids = [
-                row.id for row in all_items
-                if row.unique_name and RESOURCE_PATTERN.match(row.unique_name)
-            ]
-        else:
-            # Old behavior: we take absolutely everything
-            item_ids = [row.id for row in all_items]
-
-        # 3. Request locations (all cities are needed here)
+        # 2. Request locations (all cities are needed here)
         locations_result = await self.session.execute(select(Location.id))
         location_ids = locations_result.scalars().all()
 
@@ -1,62 +1,155 @@
 import re
-from typing import List, Dict, Any, Type
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Type
+from sqlalchemy import literal_column, or_
 from src.seeding.core.base import BaseSeeder
 from src.seeding.config import SeedingConfig
 from src.seeding.core.interfaces import IDataProvider
-from src.db.models import Item
-from src.models.items import ItemDTO
+from src.db.models import Item, SeedState
+from src.models.items import ItemDTO, classify_item
+
+# Columns written by the seeder, compared against current rows
+DIFF_COLUMNS = (
+    "display_name", "base_name", "tier", "enchantment_level",
+    "category", "resource_family", "is_refined", "family_key",
+)
+# Row tuple layout
+ITEM_COLUMNS = ("unique_name", *DIFF_COLUMNS)
+
+# Tier and enchantment in one match: "T4_MAIN_SWORD@2" -> ("4", "2")
+NAME_PATTERN = re.compile(r"(?:T(\d+)_)?(?:.*@(\d+)$)?", re.S)
+_STR_ONLY = {str}
+
+
+def upsert_items(stmt):
+    """ON CONFLICT (unique_name) DO UPDATE, only rows that really differ."""
+    return stmt.on_conflict_do_update(
+        index_elements=["unique_name"],
+        set_={c: getattr(stmt.excluded, c) for c in DIFF_COLUMNS},
+        where=or_(*(getattr(Item, c).is_distinct_from(getattr(stmt.excluded, c)) for c in DIFF_COLUMNS))
+    )
+
 
 class ItemsSeeder(BaseSeeder[List[Dict[str, Any]]]):
+    """
+    Incremental: the source is requested conditionally (ETag / Last-Modified
+    from seed_state), and the upsert only touches rows that really differ.
+    New / changed / unchanged counts come from the rows it returns.
+    """
+
+    row_columns = ITEM_COLUMNS
+
     def __init__(self, session, config: SeedingConfig, provider: IDataProvider):
         super().__init__(session, config.batch_size)
         self.config = config
         self.provider = provider
+        self.source = str(config.items_source_url)
+        self.stats = {"new": 0, "changed": 0, "unchanged": 0}
 
     async def _fetch_data(self) -> List[Dict[str, Any]]:
         return await self.provider.fetch()
 
-    def transform_data(self, raw_data: list[dict]) -> list[dict]:
-        cleaned_items = []
+    async def stream_data(self) -> AsyncIterator[Tuple]:
+        state = await self.session.get(SeedState, self.source)
+        if state is not None and hasattr(self.provider, "etag"):
+            self.provider.etag = state.etag
+            self.provider.last_modified = state.last_modified
+
+        async for row in self._source_rows():
+            yield row
+
+    def on_batch_written(self, batch: List[Tuple], result) -> None:
+        # One row per insert or real update (see upsert_items), True when inserted
+        inserted = result.scalars().all()
+        new = sum(inserted)
+        self.stats["new"] += new
+        self.stats["changed"] += len(inserted) - new
+        self.stats["unchanged"] += len(batch) - len(inserted)
 
-        for entry in raw_data:
-            try:
-                # 1. Pydantic validation
-                item_model = ItemDTO.model_validate(entry)
+    async def on_complete(self, written: int):
+        if getattr(self.provider, "not_modified", False):
+            self.logger.info("Source not modified since last seed (304), skipping.")
+            return
 
-                # --- LOGIC FOR DETERMINING THE NAME ---
-                # If base_name is not present (it is None from DTO), we take display_name, otherwise unique_name
-                final_base_name = item_model.base_name
-                if not final_base_name:
-                    final_base_name = item_model.display_name or item_model.unique_name
+        self.logger.info(
+            f"Items diff: {self.stats['new']} new, {self.stats['changed']} changed, "
+            f"{self.stats['unchanged']} unchanged"
+        )
 
-                # 2. Create a dictionary. IMPORTANT: the ‘tier’ field is mandatory for the database!
-                clean_item = {
-                    "unique_name": item_model.unique_name,
-                    "display_name": item_model.display_name,
-                    "base_name": final_base_name,
-                    "tier": item_model.tier,
-                    "enchantment_level": item_model.enchantment_level,
-                }
+        await self.session.merge(SeedState(
+            source=self.source,
+            etag=getattr(self.provider, "etag", None),
+            last_modified=getattr(self.provider, "last_modified", None),
+            content_hash=getattr(self.provider, "content_hash", None),
+            row_count=sum(self.stats.values()),
+        ))
+        await self.session.commit()
 
-                cleaned_items.append(clean_item)
+    async def _source_rows(self) -> AsyncIterator[Tuple]:
+        # Streaming provider: rows are validated while items.json is still downloading
+        if not hasattr(self.provider, "stream"):
+            async for row in super().stream_data():
+                yield row
+            return
 
-            except (AttributeError, ValueError) as e:
-                self.logger.warning(f"Skipping invalid item {entry.get('UniqueName', 'UNKNOWN')}: {e}")
-                continue
+        async for entry in self.provider.stream():
+            row = self.transform_row(entry)
+            if row is not None:
+                yield row
 
-        return cleaned_items
+    def transform_data(self, raw_data: list[dict]) -> list[tuple]:
+        transform = self.transform_row
+        return [row for row in map(transform, raw_data) if row is not None]
+
+    def transform_row(self, entry: dict) -> Optional[Tuple]:
+        """
+        Fast path: same result as transform_item, as an ITEM_COLUMNS tuple,
+        without building a model. Entries with unexpected types go through
+        the validating path.
+        """
+        unique_name = entry.get("UniqueName")
+        names = entry.get("LocalizedNames")
+        if type(unique_name) is not str or not (
+                names is None or (type(names) is dict and _STR_ONLY.issuperset(map(type, names.values())))):
+            item = self.transform_item(entry)
+            return None if item is None else tuple(item[c] for c in ITEM_COLUMNS)
+
+        display_name = (names.get("EN-US") if names else None) or unique_name
+        tier, enchantment = NAME_PATTERN.match(unique_name).groups()
+        # base_name: ItemDTO has none, so display_name (never empty) is used
+        return (
+            unique_name, display_name, display_name, int(tier) if tier else 1, int(enchantment) if enchantment else 0,
+            *classify_item(unique_name)
+        )
+
+    def transform_item(self, entry: dict) -> Optional[Dict[str, Any]]:
+        """Validating path (ItemDTO), reference for transform_row."""
+        try:
+            # 1. Pydantic validation
+            item_model = ItemDTO.model_validate(entry)
+
+            # --- LOGIC FOR DETERMINING THE NAME ---
+            # If base_name is not present (it is None from DTO), we take display_name, otherwise unique_name
+            final_base_name = item_model.base_name
+            if not final_base_name:
+                final_base_name = item_model.display_name or item_model.unique_name
+
+            # 2. Create a dictionary. IMPORTANT: the ‘tier’ field is mandatory for the database!
+            return {
+                "unique_name": item_model.unique_name,
+                "display_name": item_model.display_name,
+                "base_name": final_base_name,
+                "tier": item_model.tier,
+                "enchantment_level": item_model.enchantment_level,
+                **item_model.classification._asdict(),
+            }
+
+        except (AttributeError, ValueError) as e:
+            self.logger.warning(f"Skipping invalid item {entry.get('UniqueName', 'UNKNOWN')}: {e}")
+            return None
 
     def get_model(self) -> Type[Item]:
         return Item
 
     def get_conflict_statement(self, stmt):
-        # ON CONFLICT (unique_name) DO UPDATE
-        return stmt.on_conflict_do_update(
-            index_elements=["unique_name"],
-            set_={
-                "base_name": stmt.excluded.base_name,
-                "tier": stmt.excluded.tier,
-                "enchantment_level": stmt.excluded.enchantment_level,
-                "display_name": stmt.excluded.display_name
-            }
-        )
\ No newline at end of file
+        # xmax is 0 only for rows inserted by this statement
+        return upsert_items(stmt).returning(literal_column("xmax = 0").label("inserted"))
\ No newline at end of file
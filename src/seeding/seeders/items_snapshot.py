@@ -0,0 +1,110 @@
+import asyncio
+import gzip
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from sqlalchemy import column, select, table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import Item, SeedState
+from src.seeding.core.base import Seeder
+from src.seeding.seeders.items import ITEM_COLUMNS, upsert_items
+
+# Snapshot file: gzip'ed Postgres CSV, header row = ITEM_COLUMNS.
+# A header that does not match (older/newer column layout) is rejected.
+SNAPSHOT_HEADER = ",".join(ITEM_COLUMNS)
+STAGING_TABLE = "items_snapshot"
+
+
+async def _driver_connection(session: AsyncSession):
+    """asyncpg connection behind the session (same transaction)."""
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    return raw.driver_connection
+
+
+async def export_items_snapshot(session: AsyncSession, path: Union[str, Path]) -> int:
+    """
+    Writes the seeded item catalog to `path` with COPY TO. The file is written
+    next to the target and moved into place, readers never see a partial file.
+    Returns the number of rows.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    driver = await _driver_connection(session)
+
+    query = f"SELECT {SNAPSHOT_HEADER} FROM items ORDER BY unique_name"
+    with gzip.open(tmp_path, "wb") as output:
+        status = await driver.copy_from_query(query, output=output, format="csv", header=True)
+    os.replace(tmp_path, path)
+    return int(status.split()[-1])
+
+
+class ItemsSnapshotSeeder(Seeder):
+    """
+    Offline ItemsSeeder: COPY of a snapshot (export_items_snapshot) into a temp
+    table, then one INSERT ... SELECT with the same upsert as ItemsSeeder.
+    No network, no per-row work in Python.
+
+    The load is recorded in seed_state under the file URI (content hash, row
+    count). Validators stored for items_source are dropped: they describe a
+    download the snapshot has replaced, so the next ItemsSeeder run does a
+    full request instead of getting a 304.
+    """
+
+    def __init__(self, session, path: Union[str, Path], items_source: Optional[str] = None):
+        super().__init__(session)
+        self.path = Path(path)
+        self.source = self.path.resolve().as_uri()
+        self.items_source = items_source
+
+    async def run(self):
+        self.logger.info(f"Start seeding {self.name} from {self.path}")
+        try:
+            self._check_header()
+            content_hash = await asyncio.to_thread(self._file_hash)
+            await self.session.execute(text(
+                f"CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS "
+                f"SELECT {SNAPSHOT_HEADER} FROM items WITH NO DATA"
+            ))
+            driver = await _driver_connection(self.session)
+            with gzip.open(self.path, "rb") as source:
+                status = await driver.copy_to_table(
+                    STAGING_TABLE, source=source, columns=list(ITEM_COLUMNS), format="csv", header=True
+                )
+
+            staging = table(STAGING_TABLE, *(column(c) for c in ITEM_COLUMNS))
+            stmt = upsert_items(pg_insert(Item).from_select(ITEM_COLUMNS, select(staging)))
+            result = await self.session.execute(stmt)
+
+            await self.session.merge(SeedState(
+                source=self.source, etag=None, last_modified=None,
+                content_hash=content_hash, row_count=int(status.split()[-1]),
+            ))
+            if self.items_source:
+                await self.session.merge(SeedState(
+                    source=self.items_source, etag=None, last_modified=None, content_hash=None, row_count=0,
+                ))
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Seeding failed for {self.name}: {e}", exc_info=True)
+            raise e
+
+        self.logger.info(f"Finished seeding {self.name}: {status.split()[-1]} rows read, {result.rowcount} written")
+
+    def _check_header(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as source:
+            header = source.readline().rstrip("\r\n")
+        if header != SNAPSHOT_HEADER:
+            raise ValueError(f"Unexpected snapshot columns in {self.path}: {header!r}, expected {SNAPSHOT_HEADER!r}")
+
+    def _file_hash(self) -> str:
+        digest = hashlib.sha256()
+        with open(self.path, "rb") as source:
+            for chunk in iter(lambda: source.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -1,14 +1,65 @@
 import itertools
-from typing import List, Dict, Any, Type
+from typing import List, Dict, Any, Optional, Type
+from sqlalchemy import literal, select, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from src.seeding.core.base import BaseSeeder
 from src.seeding.core.interfaces import IDataProvider
-from src.db.models import TrackedItem
+from src.db.models import Item, Location, TrackedItem
 
 
 class TrackedItemsSeeder(BaseSeeder[Dict[str, List[int]]]):
-    def __init__(self, session, provider: IDataProvider):
+    """
+    With a provider: pairs are built in Python from the provider's ids.
+    Without one: a single INSERT ... SELECT items CROSS JOIN locations runs
+    in Postgres, `category` (indexed items.category) and/or `pattern`
+    (Postgres regex on unique_name) select the items.
+    """
+    depends_on = ("ItemsSeeder", "LocationsSeeder")
+
+    def __init__(
+            self,
+            session,
+            provider: Optional[IDataProvider] = None,
+            pattern: Optional[str] = None,
+            category: Optional[str] = None
+    ):
         super().__init__(session, batch_size=5000)
         self.provider = provider
+        self.pattern = pattern
+        self.category = category
+
+    async def run(self):
+        if self.provider is not None:
+            return await super().run()
+
+        self.logger.info(f"Start seeding {self.name} (server-side)")
+        try:
+            result = await self.session.execute(self.get_server_side_statement())
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error(f"Seeding failed for {self.name}: {e}", exc_info=True)
+            raise e
+
+        self.logger.info(f"Finished seeding {self.name}: {result.rowcount} new pairs")
+
+    def get_server_side_statement(self):
+        items = select(Item.id)
+        if self.category:
+            items = items.where(Item.category == self.category)
+        if self.pattern:
+            items = items.where(Item.unique_name.regexp_match(self.pattern))
+        items = items.subquery()
+
+        pairs = (
+            select(items.c.id, Location.id, literal(True), literal(1))
+            .select_from(items)
+            .join(Location, true())
+        )
+        stmt = pg_insert(TrackedItem).from_select(
+            ["item_id", "location_id", "is_active", "priority"], pairs
+        )
+        return self.get_conflict_statement(stmt)
 
     async def _fetch_data(self) -> Dict[str, List[int]]:
         return await self.provider.fetch()
@@ -0,0 +1,115 @@
+import datetime
+from typing import List, Literal, Optional
+from sqlalchemy import select, func, literal, and_, BigInteger, Float, Numeric
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import MarketPrice, Item, Location
+
+# Players can only sell to the Black Market, never buy from it
+SELL_ONLY_LOCATIONS = ("Black Market",)
+
+SellMode = Literal["instant", "order"]
+
+
+class ArbitrageService:
+    """
+    Cross-city spreads for the whole market in one set-based query.
+
+    Buy side: cheapest sell order (sell_price_min) in city A.
+    Sell side:
+        instant - fill the best buy order (buy_price_max) in city B,
+        order   - list at the cheapest sell order (sell_price_min) in city B.
+    profit = sell_price * (1 - tax_rate) - buy_price, margin = profit / buy_price.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def find_opportunities(
+            self,
+            min_margin: float = 0.0,
+            tax_rate: float = 0.04,
+            mode: SellMode = "instant",
+            max_age: datetime.timedelta = datetime.timedelta(hours=2),
+            tier_min: Optional[int] = None,
+            tier_max: Optional[int] = None,
+            quality: Optional[int] = None,
+            limit: int = 50,
+            order_by: Literal["profit", "margin"] = "profit"
+    ) -> List[dict]:
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - max_age
+
+        # 1. Buy side: fresh sell orders outside sell-only markets
+        buy = (
+            select(
+                MarketPrice.item_id,
+                MarketPrice.location_id,
+                MarketPrice.quality_level,
+                MarketPrice.sell_price_min.label("price"),
+                MarketPrice.sell_price_min_date.label("price_date"),
+            )
+            .join(Location, Location.id == MarketPrice.location_id)
+            .where(
+                MarketPrice.sell_price_min > 0,
+                MarketPrice.sell_price_min_date >= cutoff,
+                Location.api_name.not_in(SELL_ONLY_LOCATIONS),
+            )
+        )
+
+        # 2. Sell side
+        if mode == "instant":
+            sell_price, sell_date = MarketPrice.buy_price_max, MarketPrice.buy_price_max_date
+        else:
+            sell_price, sell_date = MarketPrice.sell_price_min, MarketPrice.sell_price_min_date
+        sell = select(
+            MarketPrice.item_id,
+            MarketPrice.location_id,
+            MarketPrice.quality_level,
+            sell_price.label("price"),
+            sell_date.label("price_date"),
+        ).where(sell_price > 0, sell_date >= cutoff)
+
+        if quality is not None:
+            buy = buy.where(MarketPrice.quality_level == quality)
+            sell = sell.where(MarketPrice.quality_level == quality)
+
+        buy = buy.subquery("buy")
+        sell = sell.subquery("sell")
+
+        # 3. Spread over every (item, quality) pair of cities
+        net = sell.c.price * (1 - literal(tax_rate, Numeric))
+        profit = (net - buy.c.price).label("profit")
+        margin = ((net - buy.c.price) / buy.c.price).label("margin")
+
+        query = (
+            select(
+                buy.c.item_id,
+                Item.unique_name,
+                buy.c.quality_level,
+                buy.c.location_id.label("buy_location_id"),
+                sell.c.location_id.label("sell_location_id"),
+                buy.c.price.label("buy_price"),
+                sell.c.price.label("sell_price"),
+                func.floor(profit).cast(BigInteger).label("profit"),
+                func.round(margin, 4).cast(Float).label("margin"),
+                buy.c.price_date.label("buy_price_date"),
+                sell.c.price_date.label("sell_price_date"),
+            )
+            .join(sell, and_(
+                sell.c.item_id == buy.c.item_id,
+                sell.c.quality_level == buy.c.quality_level,
+                sell.c.location_id != buy.c.location_id,
+            ))
+            .join(Item, Item.id == buy.c.item_id)
+            .where(net - buy.c.price > 0, margin >= min_margin)
+            .order_by((margin if order_by == "margin" else profit).desc())
+            .limit(limit)
+        )
+        if tier_min is not None:
+            query = query.where(Item.tier >= tier_min)
+        if tier_max is not None:
+            query = query.where(Item.tier <= tier_max)
+
+        result = await self.session.execute(query)
+        keys = list(result.keys())
+        return [dict(zip(keys, row)) for row in result.all()]
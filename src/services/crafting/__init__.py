@@ -0,0 +1,6 @@
+from src.services.crafting.recipes import Recipe, RecipeBook, parse_recipes
+from src.services.crafting.engine import evaluate
+from src.services.crafting.graph import CostGraph
+from src.services.crafting.service import CraftingService
+
+__all__ = ["Recipe", "RecipeBook", "parse_recipes", "evaluate", "CostGraph", "CraftingService"]
@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.services.crafting.recipes import RecipeBook
+
+
+@dataclass
+class CraftProfit:
+    """Per crafted unit, shape (recipes, locations). NaN where a price is unknown."""
+    material_cost: np.ndarray
+    output_value: np.ndarray
+    profit: np.ndarray
+
+
+def material_costs(book: RecipeBook, prices: np.ndarray, return_rate: float = 0.0) -> np.ndarray:
+    """
+    Material cost of one craft action for every recipe x location.
+    prices: (len(book.names), locations), NaN for missing prices.
+    Returned resources reduce the cost of returnable materials only.
+    """
+    if book.size == 0:
+        return np.empty((0, prices.shape[1]))
+    effective = book.material_count * np.where(book.material_returnable, 1.0 - return_rate, 1.0)
+    gathered = prices[book.material_index] * effective[:, None]
+    # Segment sums over the CSR rows (every recipe has at least one material)
+    return np.add.reduceat(gathered, book.indptr[:-1], axis=0)
+
+
+def evaluate(book: RecipeBook, prices: np.ndarray, return_rate: float = 0.0, tax_rate: float = 0.0) -> CraftProfit:
+    """
+    Profit of crafting in each city and selling there, for every recipe at once.
+    profit = product price * (1 - tax) - (materials + silver fee) / amount crafted
+    """
+    amounts = book.amounts[:, None]
+    cost = (material_costs(book, prices, return_rate) + book.silver[:, None]) / amounts
+    value = prices[book.products] * (1.0 - tax_rate)
+    return CraftProfit(material_cost=cost, output_value=value, profit=value - cost)
+
+
+# Focus adds +59% production bonus on top of the city bonus
+FOCUS_PRODUCTION_BONUS = 0.59
+
+
+def with_focus(return_rate: np.ndarray) -> np.ndarray:
+    """Return rate with focus: rate -> production bonus, + focus bonus, -> rate."""
+    bonus = 1.0 / (1.0 - np.asarray(return_rate, dtype=np.float64)) - 1.0
+    return 1.0 - 1.0 / (1.0 + bonus + FOCUS_PRODUCTION_BONUS)
+
+
+@dataclass
+class ScenarioGrid:
+    """Flattened cartesian grid, one element per scenario."""
+    return_rate: np.ndarray
+    focus: np.ndarray
+    station_fee: np.ndarray
+    tax_rate: np.ndarray
+
+    @classmethod
+    def product(cls, return_rates, focus, station_fees, tax_rates) -> "ScenarioGrid":
+        axes = np.meshgrid(
+            np.asarray(return_rates, dtype=np.float64),
+            np.asarray(focus, dtype=bool),
+            np.asarray(station_fees, dtype=np.float64),
+            np.asarray(tax_rates, dtype=np.float64),
+            indexing="ij"
+        )
+        return cls(*(axis.ravel() for axis in axes))
+
+    @property
+    def size(self) -> int:
+        return len(self.return_rate)
+
+
+def sweep(book: RecipeBook, recipes: np.ndarray, prices: np.ndarray, grid: ScenarioGrid) -> CraftProfit:
+    """
+    Profit of `recipes` under every scenario, shape (recipes, scenarios).
+    prices: (len(book.names),) for one location.
+
+    Material value is split once into its returnable and non-returnable parts,
+    the grid is then applied by broadcasting (recipes, 1) against (1, scenarios).
+    Station fee is a share of the material market value.
+    """
+    if not len(recipes):
+        empty = np.empty((0, grid.size))
+        return CraftProfit(material_cost=empty, output_value=empty, profit=empty)
+
+    starts = book.indptr[recipes]
+    lengths = book.indptr[recipes + 1] - starts
+    offsets = np.cumsum(lengths) - lengths
+    entries = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+    value = prices[book.material_index[entries]] * book.material_count[entries]
+    returnable = np.add.reduceat(np.where(book.material_returnable[entries], value, 0.0), offsets)
+    total = np.add.reduceat(value, offsets)
+
+    return_rate = np.where(grid.focus, with_focus(grid.return_rate), grid.return_rate)
+    cost = (
+        total[:, None]
+        - returnable[:, None] * return_rate[None, :]
+        + total[:, None] * grid.station_fee[None, :]
+        + book.silver[recipes][:, None]
+    ) / book.amounts[recipes][:, None]
+    output = prices[book.products[recipes]][:, None] * (1.0 - grid.tax_rate[None, :])
+    return CraftProfit(material_cost=cost, output_value=output, profit=output - cost)
@@ -0,0 +1,125 @@
+from typing import Dict, Iterable, Set
+
+import numpy as np
+
+from src.services.crafting.recipes import RecipeBook
+
+# Recipe cycles (if any) are cut at this depth
+MAX_DEPTH = 32
+
+
+class CostGraph:
+    """
+    Recipe dependency DAG with memoized per-unit costs, shape (items|recipes, locations).
+
+    cost[i, l]        cheapest way to get item i in location l: min(market price, craft cost)
+    craft_cost[r, l]  crafting one unit of recipe r's product, materials taken at `cost`
+
+    Recipes are evaluated level by level (raw materials first). A price change
+    re-evaluates only the recipes downstream of it, and stops propagating as
+    soon as an intermediate cost does not change.
+    """
+
+    def __init__(self, book: RecipeBook, return_rate: float = 0.0):
+        self.book = book
+        self.return_rate = return_rate
+        n_items = len(book.names)
+
+        self.producer = book.producer
+
+        # item -> recipes consuming it (CSR)
+        recipe_of_entry = np.repeat(np.arange(book.size), np.diff(book.indptr))
+        self.consumers = recipe_of_entry[np.argsort(book.material_index, kind="stable")]
+        self.consumers_indptr = np.concatenate(([0], np.cumsum(np.bincount(book.material_index, minlength=n_items))))
+
+        self.weights = book.material_count * np.where(book.material_returnable, 1.0 - return_rate, 1.0)
+        self.level = self._levels()
+
+        self.prices = np.empty((n_items, 0))
+        self.cost = np.empty((n_items, 0))
+        self.craft_cost = np.empty((book.size, 0))
+
+    def load(self, prices: np.ndarray) -> int:
+        """Full evaluation for a fresh price matrix. Returns number of recomputed recipes."""
+        self.prices = prices.astype(np.float64, copy=True)
+        self.cost = self.prices.copy()
+        self.craft_cost = np.full((self.book.size, prices.shape[1]), np.nan)
+
+        recipes = np.arange(self.book.size)
+        for level in np.unique(self.level):
+            self._evaluate(recipes[self.level == level], slice(None))
+        return self.book.size
+
+    def update_prices(self, items: np.ndarray, column: int, prices: np.ndarray) -> int:
+        """
+        New market prices for dense `items` in one location.
+        Returns how many recipes had to be recomputed.
+        """
+        cols = slice(column, column + 1)
+        self.prices[items, column] = prices
+
+        produced = self.producer[items]
+        crafted = np.where(produced >= 0, self.craft_cost[np.maximum(produced, 0), column], np.nan)
+        new_cost = np.fmin(self.prices[items, column], crafted)
+
+        pending: Dict[int, Set[int]] = {}
+        self._enqueue(pending, items[~self._same(self.cost[items, column], new_cost)], -1)
+        self.cost[items, column] = new_cost
+
+        recomputed = 0
+        while pending:
+            level = min(pending)
+            batch = np.fromiter(sorted(pending.pop(level)), dtype=np.int64)
+            products = self.book.products[batch]
+
+            old = self.cost[products, column].copy()
+            self._evaluate(batch, cols)
+            recomputed += len(batch)
+
+            changed = products[~self._same(old, self.cost[products, column])]
+            self._enqueue(pending, changed, level)
+        return recomputed
+
+    # --- Internals ---
+    def _levels(self) -> np.ndarray:
+        """Depth of every recipe: 0 if all materials are bought-only items."""
+        level = np.zeros(self.book.size, dtype=np.int64)
+        if not self.book.size:
+            return level
+        producers = self.producer[self.book.material_index]
+        for _ in range(MAX_DEPTH):
+            depth = np.where(producers >= 0, level[np.maximum(producers, 0)] + 1, 0)
+            new_level = np.minimum(np.maximum.reduceat(depth, self.book.indptr[:-1]), MAX_DEPTH)
+            if np.array_equal(new_level, level):
+                break
+            level = new_level
+        return level
+
+    def _evaluate(self, recipes: np.ndarray, cols: slice) -> None:
+        """craft_cost and cost for a batch of recipes of the same level."""
+        if not len(recipes):
+            return
+        book = self.book
+        starts = book.indptr[recipes]
+        lengths = book.indptr[recipes + 1] - starts
+        offsets = np.cumsum(lengths) - lengths
+        # Material entries of the batch, flattened
+        entries = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+        gathered = self.cost[book.material_index[entries], cols] * self.weights[entries][:, None]
+        craft = (np.add.reduceat(gathered, offsets, axis=0) + book.silver[recipes][:, None]) / book.amounts[recipes][:, None]
+
+        products = book.products[recipes]
+        self.craft_cost[recipes, cols] = craft
+        self.cost[products, cols] = np.fmin(self.prices[products, cols], craft)
+
+    def _enqueue(self, pending: Dict[int, Set[int]], items: Iterable[int], above_level: int) -> None:
+        for item in items:
+            for recipe in self.consumers[self.consumers_indptr[item]:self.consumers_indptr[item + 1]]:
+                level = int(self.level[recipe])
+                if level > above_level:
+                    pending.setdefault(level, set()).add(int(recipe))
+
+    @staticmethod
+    def _same(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return (a == b) | (np.isnan(a) & np.isnan(b))
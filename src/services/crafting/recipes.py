@@ -0,0 +1,201 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+# Refined/raw resources use "T4_METALBAR_LEVEL1@1" on the market,
+# the recipe dump references them as "T4_METALBAR_LEVEL1"
+LEVEL_SUFFIX = re.compile(r"_LEVEL(\d+)$")
+
+
+@dataclass(frozen=True)
+class Material:
+    unique_name: str
+    count: float
+    returnable: bool = True  # artifacts etc. have maxreturnamount="0"
+
+
+@dataclass(frozen=True)
+class Recipe:
+    """
+    One crafting recipe from ao-bin-dumps items.json.
+    product_names holds market name candidates (e.g. "T4_MAIN_SWORD@1" or
+    "T4_METALBAR_LEVEL1@1"), the first one present in the catalog is used.
+    """
+    product_names: Tuple[str, ...]
+    materials: Tuple[Material, ...]
+    amount: float = 1.0
+    silver: float = 0.0
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _market_name(name: str, enchantment: int) -> str:
+    if "@" in name:
+        return name
+    match = LEVEL_SUFFIX.search(name)
+    if match:
+        return f"{name}@{match.group(1)}"
+    return f"{name}@{enchantment}" if enchantment else name
+
+
+def _parse_requirements(requirements: Any, product_names: Tuple[str, ...]) -> Optional[Recipe]:
+    """
+    First craftingrequirements block with resources -> Recipe.
+    Material enchantment is part of its name ("T4_PLANKS_LEVEL1"), plain names are .0 items.
+    """
+    for block in _as_list(requirements):
+        if not isinstance(block, Mapping):
+            continue
+        materials = []
+        for resource in _as_list(block.get("craftresource")):
+            name = resource.get("@uniquename")
+            if not name:
+                continue
+            level = int(resource.get("@enchantmentlevel", 0) or 0)
+            materials.append(Material(
+                unique_name=_market_name(name, level),
+                count=float(resource.get("@count", 1)),
+                returnable=resource.get("@maxreturnamount") != "0",
+            ))
+        if materials:
+            return Recipe(
+                product_names=product_names,
+                materials=tuple(materials),
+                amount=float(block.get("@amountcrafted", 1)),
+                silver=float(block.get("@silver", 0)),
+            )
+    return None
+
+
+def parse_recipes(dump: Mapping[str, Any]) -> List[Recipe]:
+    """
+    Extracts recipes from the raw ao-bin-dumps items.json
+    ({"items": {"simpleitem": [...], "weapon": [...], ...}}), enchanted variants included.
+    """
+    recipes = []
+    sections = dump.get("items", dump)
+
+    for section in sections.values():
+        for entry in _as_list(section):
+            if not isinstance(entry, Mapping) or "@uniquename" not in entry:
+                continue
+            base = entry["@uniquename"]
+
+            recipe = _parse_requirements(entry.get("craftingrequirements"), (base,))
+            if recipe:
+                recipes.append(recipe)
+
+            enchantments = (entry.get("enchantments") or {}).get("enchantment")
+            for enchantment in _as_list(enchantments):
+                level = int(enchantment.get("@enchantmentlevel", 0))
+                if not level:
+                    continue
+                names = (f"{base}_LEVEL{level}@{level}", f"{base}@{level}")
+                recipe = _parse_requirements(enchantment.get("craftingrequirements"), names)
+                if recipe:
+                    recipes.append(recipe)
+
+    return recipes
+
+
+class RecipeBook:
+    """
+    Id-indexed array form of the recipe set (CSR layout).
+
+    Every item that appears in a recipe gets a dense index; item_ids[dense]
+    is its database id. Recipe r produces `products[r]` and consumes
+    materials material_index[indptr[r]:indptr[r + 1]] with material_count.
+    """
+
+    def __init__(
+            self,
+            names: List[str],
+            item_ids: np.ndarray,
+            products: np.ndarray,
+            amounts: np.ndarray,
+            silver: np.ndarray,
+            indptr: np.ndarray,
+            material_index: np.ndarray,
+            material_count: np.ndarray,
+            material_returnable: np.ndarray
+    ):
+        self.names = names
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self.item_ids = item_ids
+        self.products = products
+        self.amounts = amounts
+        self.silver = silver
+        self.indptr = indptr
+        self.material_index = material_index
+        self.material_count = material_count
+        self.material_returnable = material_returnable
+
+        # Recipe producing each item, -1 for items that can only be bought
+        self.producer = np.full(len(names), -1, dtype=np.int64)
+        self.producer[products] = np.arange(len(products))
+
+    @property
+    def size(self) -> int:
+        """Number of recipes."""
+        return len(self.products)
+
+    def recipes_for(self, unique_names: Iterable[str]) -> Tuple[List[str], np.ndarray]:
+        """(craftable names, their recipe indexes); uncraftable names are dropped."""
+        found, recipes = [], []
+        for name in unique_names:
+            dense = self.index.get(name)
+            if dense is not None and self.producer[dense] >= 0:
+                found.append(name)
+                recipes.append(self.producer[dense])
+        return found, np.array(recipes, dtype=np.int64)
+
+    @classmethod
+    def build(cls, recipes: Iterable[Recipe], item_id_map: Mapping[str, int]) -> "RecipeBook":
+        """Keeps only recipes whose product and materials all exist in the catalog."""
+        names: List[str] = []
+        index: Dict[str, int] = {}
+
+        def dense(name: str) -> int:
+            if name not in index:
+                index[name] = len(names)
+                names.append(name)
+            return index[name]
+
+        products, amounts, silver, indptr = [], [], [], [0]
+        material_index, material_count, material_returnable = [], [], []
+        seen_products = set()
+
+        for recipe in recipes:
+            product = next((n for n in recipe.product_names if n in item_id_map), None)
+            if product is None or product in seen_products:
+                continue
+            if not all(m.unique_name in item_id_map for m in recipe.materials):
+                continue
+            seen_products.add(product)
+
+            products.append(dense(product))
+            amounts.append(recipe.amount)
+            silver.append(recipe.silver)
+            for material in recipe.materials:
+                material_index.append(dense(material.unique_name))
+                material_count.append(material.count)
+                material_returnable.append(material.returnable)
+            indptr.append(len(material_index))
+
+        return cls(
+            names=names,
+            item_ids=np.array([item_id_map[n] for n in names], dtype=np.int64),
+            products=np.array(products, dtype=np.int32),
+            amounts=np.array(amounts, dtype=np.float64),
+            silver=np.array(silver, dtype=np.float64),
+            indptr=np.array(indptr, dtype=np.int64),
+            material_index=np.array(material_index, dtype=np.int32),
+            material_count=np.array(material_count, dtype=np.float64),
+            material_returnable=np.array(material_returnable, dtype=bool),
+        )
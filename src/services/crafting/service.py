@@ -0,0 +1,280 @@
+import asyncio
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.notifications import PriceUpdate
+from src.db.database import async_session_maker
+from src.db.models import Item, Location, MarketPrice
+from src.services.crafting.engine import CraftProfit, ScenarioGrid, evaluate, sweep
+from src.services.crafting.graph import CostGraph
+from src.services.crafting.recipes import RecipeBook, parse_recipes
+from src.services.price_cube import PriceCube
+
+logger = logging.getLogger(__name__)
+
+# Per-operation timeout of the recipes (raw items.json) download
+RECIPES_TIMEOUT_SEC = 60.0
+
+
+async def load_price_matrix(
+        session: AsyncSession,
+        item_ids: np.ndarray,
+        location_ids: Sequence[int],
+        quality: int = 1
+) -> np.ndarray:
+    """(len(item_ids), len(location_ids)) matrix of sell_price_min, NaN where unknown."""
+    prices = np.full((len(item_ids), len(location_ids)), np.nan)
+    if not len(item_ids) or not location_ids:
+        return prices
+
+    query = select(MarketPrice.item_id, MarketPrice.location_id, MarketPrice.sell_price_min).where(
+        MarketPrice.item_id == any_(bindparam("item_ids", np.asarray(item_ids).tolist(), type_=ARRAY(Integer))),
+        MarketPrice.location_id == any_(bindparam("location_ids", list(location_ids), type_=ARRAY(Integer))),
+        MarketPrice.quality_level == quality,
+        MarketPrice.sell_price_min > 0,
+    )
+    result = await session.execute(query)
+    rows = np.array(result.all(), dtype=np.int64).reshape(-1, 3)
+    if not len(rows):
+        return prices
+
+    # db ids -> dense rows / columns, vectorized
+    order = np.argsort(item_ids)
+    item_pos = order[np.searchsorted(item_ids, rows[:, 0], sorter=order)]
+    loc_order = np.argsort(location_ids)
+    loc_pos = loc_order[np.searchsorted(np.asarray(location_ids), rows[:, 1], sorter=loc_order)]
+    prices[item_pos, loc_pos] = rows[:, 2]
+    return prices
+
+
+async def load_location_ids(session: AsyncSession) -> List[int]:
+    return list((await session.execute(select(Location.id).order_by(Location.id))).scalars().all())
+
+
+class CraftingService:
+    """
+    Craft-profit engine over current market prices.
+    The recipe book is downloaded and indexed once, on first use.
+
+    The chain view (materials at min(buy, craft) through refining chains) is a
+    CostGraph kept up to date from ingestor notifications: every ingest batch
+    re-evaluates only the recipes downstream of the changed items.
+
+    With a PriceCube, prices are sliced from memory instead of queried.
+    """
+
+    def __init__(self, recipes_url: str, return_rate: float = 0.152, price_cube: Optional[PriceCube] = None):
+        self.recipes_url = recipes_url
+        self.return_rate = return_rate
+        self.price_cube = price_cube
+        self._book: Optional[RecipeBook] = None
+        self._lock = asyncio.Lock()
+        # Notifications are applied one at a time, in arrival order (Lock is FIFO)
+        self._update_lock = asyncio.Lock()
+
+        self._graph: Optional[CostGraph] = None
+        self._graph_location_ids: List[int] = []
+        self._graph_stale = True
+
+        self.batches = 0
+        self.last_recomputed = 0
+        self.recomputed_total = 0
+
+    async def get_book(self, session: AsyncSession) -> RecipeBook:
+        async with self._lock:
+            return await self._load_book(session)
+
+    async def get_graph(self, session: AsyncSession) -> CostGraph:
+        """Memoized cost graph, fully re-evaluated after any gap in notifications."""
+        async with self._lock:
+            if self._graph is None or self._graph_stale:
+                book = await self._load_book(session)
+                # Updates that arrive while loading make the result stale again
+                self._graph_stale = False
+                location_ids = await load_location_ids(session)
+                graph = CostGraph(book, self.return_rate)
+                graph.load(await self._price_matrix(session, book.item_ids, location_ids))
+
+                self._graph, self._graph_location_ids = graph, location_ids
+                logger.info(f"Craft cost graph loaded: {book.size} recipes x {len(location_ids)} locations.")
+            return self._graph
+
+    async def top_profits(
+            self,
+            session: AsyncSession,
+            location_ids: Optional[List[int]] = None,
+            return_rate: Optional[float] = None,
+            tax_rate: float = 0.065,
+            min_profit: float = 0.0,
+            limit: int = 50,
+            chain: bool = False
+    ) -> List[dict]:
+        return_rate = self.return_rate if return_rate is None else return_rate
+
+        if chain:
+            graph = await self.get_graph(session)
+            all_location_ids = self._graph_location_ids
+            if return_rate != graph.return_rate:
+                # One-off evaluation, the memoized graph is kept at the default rate
+                prices = graph.prices
+                graph = CostGraph(graph.book, return_rate)
+                graph.load(prices)
+
+            book = graph.book
+            location_ids = location_ids or all_location_ids
+            columns = [all_location_ids.index(loc) for loc in location_ids if loc in all_location_ids]
+            location_ids = [all_location_ids[c] for c in columns]
+
+            cost = graph.craft_cost[:, columns]
+            value = graph.prices[book.products][:, columns] * (1.0 - tax_rate)
+            result = CraftProfit(material_cost=cost, output_value=value, profit=value - cost)
+        else:
+            book = await self.get_book(session)
+            if location_ids is None:
+                location_ids = await load_location_ids(session)
+            prices = await self._price_matrix(session, book.item_ids, location_ids)
+            result = evaluate(book, prices, return_rate, tax_rate)
+
+        return self._rank(book, result, location_ids, min_profit, limit)
+
+    async def scenario_sweep(
+            self,
+            session: AsyncSession,
+            unique_names: Sequence[str],
+            location_id: int,
+            grid: ScenarioGrid
+    ) -> dict:
+        """What-if table: profit of every item under every scenario of the grid, at one location."""
+        book = await self.get_book(session)
+        names, recipes = book.recipes_for(dict.fromkeys(unique_names))
+
+        # Only the products and materials of the requested recipes are priced
+        involved = np.unique(np.concatenate([
+            book.products[recipes],
+            *(book.material_index[book.indptr[r]:book.indptr[r + 1]] for r in recipes)
+        ])) if len(recipes) else np.empty(0, dtype=np.int64)
+        prices = np.full(len(book.names), np.nan)
+        prices[involved] = (await self._price_matrix(session, book.item_ids[involved], [location_id]))[:, 0]
+
+        result = sweep(book, recipes, prices, grid)
+        return {
+            "items": names,
+            "missing": [name for name in dict.fromkeys(unique_names) if name not in set(names)],
+            "scenarios": {
+                "return_rate": grid.return_rate,
+                "focus": grid.focus,
+                "station_fee": grid.station_fee,
+                "tax_rate": grid.tax_rate,
+            },
+            "material_cost": np.round(result.material_cost),
+            "profit": np.round(result.profit),
+        }
+
+    # --- Notification hooks ---
+    async def handle_update(self, update: PriceUpdate) -> int:
+        """Applies one ingest batch to the cost graph. Returns number of recomputed recipes."""
+        async with self._update_lock:
+            return await self._apply_update(update)
+
+    async def _apply_update(self, update: PriceUpdate) -> int:
+        graph = self._graph
+        if graph is None or self._graph_stale:
+            return 0
+        if self._lock.locked() or update.location_id not in self._graph_location_ids:
+            self._graph_stale = True
+            return 0
+
+        book = graph.book
+        items = np.flatnonzero(np.isin(book.item_ids, update.item_ids))
+        if not len(items):
+            return 0
+
+        # Straight from the database: the cube applies the same notification concurrently
+        try:
+            async with async_session_maker() as session:
+                prices = await load_price_matrix(session, book.item_ids[items], [update.location_id])
+        except Exception as e:
+            logger.warning(f"Craft graph update failed, re-evaluating on next use: {e}")
+            self._graph_stale = True
+            return 0
+        if graph is not self._graph or self._graph_stale:
+            return 0
+
+        recomputed = graph.update_prices(items, self._graph_location_ids.index(update.location_id), prices[:, 0])
+        self.batches += 1
+        self.last_recomputed = recomputed
+        self.recomputed_total += recomputed
+        logger.info(
+            f"Craft graph: {recomputed} of {book.size} recipes recomputed "
+            f"for {len(items)} changed items at location {update.location_id}"
+        )
+        return recomputed
+
+    def handle_listener_state(self, connected: bool) -> None:
+        """Notifications may have been missed: re-evaluate everything on next use."""
+        self._graph_stale = True
+
+    def stats(self) -> dict:
+        return {
+            "loaded": self._graph is not None and not self._graph_stale,
+            "recipes": self._book.size if self._book is not None else 0,
+            "batches": self.batches,
+            "last_recomputed": self.last_recomputed,
+            "recomputed_total": self.recomputed_total,
+        }
+
+    # --- Internals ---
+    async def _price_matrix(self, session: AsyncSession, item_ids: np.ndarray, location_ids: Sequence[int]) -> np.ndarray:
+        if self.price_cube is not None and await self.price_cube.ensure_loaded(session):
+            return self.price_cube.matrix(item_ids, location_ids)
+        return await load_price_matrix(session, item_ids, location_ids)
+
+    async def _load_book(self, session: AsyncSession) -> RecipeBook:
+        if self._book is None:
+            # Seeding stack is only needed here, keep it out of API startup
+            from src.seeding.providers.albion_api import AlbionApiProvider
+
+            dump = await AlbionApiProvider(self.recipes_url, timeout=RECIPES_TIMEOUT_SEC).fetch()
+
+            result = await session.execute(select(Item.unique_name, Item.id))
+            item_id_map = {row.unique_name: row.id for row in result.all()}
+
+            # Parsing the full dump takes seconds: keep the event loop serving other requests
+            self._book, recipe_count = await asyncio.to_thread(self._build_book, dump, item_id_map)
+            logger.info(f"Recipe book loaded: {self._book.size} of {recipe_count} recipes, {len(self._book.names)} items.")
+        return self._book
+
+    @staticmethod
+    def _build_book(dump: dict, item_id_map: dict) -> Tuple[RecipeBook, int]:
+        recipes = parse_recipes(dump)
+        return RecipeBook.build(recipes, item_id_map), len(recipes)
+
+    @staticmethod
+    def _rank(book: RecipeBook, result: CraftProfit, location_ids: List[int], min_profit: float, limit: int) -> List[dict]:
+        # Top-K over the flattened recipe x location grid
+        profit = np.where(np.isfinite(result.profit), result.profit, -np.inf).ravel()
+        candidates = np.flatnonzero(profit >= min_profit)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-profit[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(-profit[candidates])]
+
+        rows = []
+        for flat in candidates:
+            recipe, loc = divmod(int(flat), len(location_ids))
+            product = book.products[recipe]
+            cost = result.material_cost[recipe, loc]
+            rows.append({
+                "item_id": int(book.item_ids[product]),
+                "unique_name": book.names[product],
+                "location_id": location_ids[loc],
+                "material_cost": round(float(cost)),
+                "output_value": round(float(result.output_value[recipe, loc])),
+                "profit": round(float(result.profit[recipe, loc])),
+                "margin": round(float(result.profit[recipe, loc] / cost), 4) if cost else None,
+            })
+        return rows
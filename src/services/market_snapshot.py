@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# File layout (little-endian, every block 64-byte aligned):
+#   header | item_ids int64[I] | location_ids int64[L]
+#   | prices float64[I, L, Q, F] | updated_at int64[I, L, Q]
+# Readers map the file once and use views into it. The writer builds a new
+# file next to the old one and os.replace()s it, existing mappings keep the
+# old inode, so a reader never sees a half written snapshot.
+MAGIC = b"ACFMARKT"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("n_fields", "<u4"),
+    ("generation", "<u8"),
+    ("created_at", "<f8"),   # unix seconds, writer clock
+    ("watermark", "<i8"),    # max(updated_at) in the file, for catch-up queries
+    ("n_items", "<u8"),
+    ("n_locations", "<u8"),
+    ("n_qualities", "<u8"),
+])
+HEADER_SIZE = ALIGNMENT
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _layout(n_items: int, n_locations: int, n_qualities: int, n_fields: int) -> dict:
+    """Byte offset and shape of every array."""
+    blocks = {}
+    offset = HEADER_SIZE
+    for name, dtype, shape in (
+            ("item_ids", "<i8", (n_items,)),
+            ("location_ids", "<i8", (n_locations,)),
+            ("prices", "<f8", (n_items, n_locations, n_qualities, n_fields)),
+            ("updated_at", "<i8", (n_items, n_locations, n_qualities)),
+    ):
+        blocks[name] = (offset, np.dtype(dtype), shape)
+        offset = _aligned(offset + int(np.prod(shape)) * 8)
+    blocks["size"] = offset
+    return blocks
+
+
+def write_market_snapshot(
+        path: Union[str, Path],
+        item_ids: np.ndarray,
+        location_ids,
+        prices: np.ndarray,
+        updated_at: np.ndarray,
+        generation: int
+) -> int:
+    """Writes a snapshot atomically. Returns its size in bytes."""
+    path = Path(path)
+    n_items, n_locations, n_qualities, n_fields = prices.shape
+    layout = _layout(n_items, n_locations, n_qualities, n_fields)
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header[0] = (
+        MAGIC, FORMAT_VERSION, n_fields, generation, time.time(),
+        int(updated_at.max()) if updated_at.size else 0,
+        n_items, n_locations, n_qualities,
+    )
+    arrays = {
+        "item_ids": item_ids,
+        "location_ids": np.asarray(location_ids),
+        "prices": prices,
+        "updated_at": updated_at,
+    }
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header.tobytes().ljust(HEADER_SIZE, b"\0"))
+            for name, array in arrays.items():
+                offset, dtype, _ = layout[name]
+                f.seek(offset)
+                np.ascontiguousarray(array, dtype=dtype).tofile(f)
+            f.truncate(layout["size"])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return layout["size"]
+
+
+class MarketSnapshot:
+    """
+    Zero-copy reader: one copy-on-write mapping (np.memmap mode "c") of the
+    file, arrays are views into it. Pages are shared by every process that maps
+    the same file; a process writing into the arrays (PriceCube applying
+    notifications) gets private copies of the touched pages only, the file is
+    never modified.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        # Header, size and mapping from one descriptor: a concurrent os.replace
+        # cannot pair the header of one file with the arrays of another
+        with open(self.path, "rb") as f:
+            data = f.read(HEADER_DTYPE.itemsize)
+            header = np.frombuffer(data, dtype=HEADER_DTYPE) if len(data) == HEADER_DTYPE.itemsize else []
+            if len(header) != 1 or header[0]["magic"] != MAGIC:
+                raise ValueError(f"{self.path} is not a market snapshot")
+            if header[0]["version"] != FORMAT_VERSION:
+                raise ValueError(f"{self.path}: unsupported snapshot version {header[0]['version']}")
+            self.header = header[0].copy()
+
+            layout = _layout(int(self.header["n_items"]), int(self.header["n_locations"]),
+                             int(self.header["n_qualities"]), int(self.header["n_fields"]))
+            if os.fstat(f.fileno()).st_size != layout["size"]:
+                raise ValueError(f"{self.path}: truncated snapshot")
+
+            self._map = np.memmap(f, dtype=np.uint8, mode="c")
+        for name in ("item_ids", "location_ids", "prices", "updated_at"):
+            offset, dtype, shape = layout[name]
+            size = int(np.prod(shape)) * dtype.itemsize
+            setattr(self, name, self._map[offset:offset + size].view(dtype).reshape(shape))
+
+    @property
+    def generation(self) -> int:
+        return int(self.header["generation"])
+
+    @property
+    def created_at(self) -> float:
+        return float(self.header["created_at"])
+
+    @property
+    def watermark(self) -> int:
+        return int(self.header["watermark"])
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+
+async def run_snapshot_writer(path: Union[str, Path], interval_sec: float) -> None:
+    """
+    Worker task: every interval_sec reloads current market_prices into a
+    PriceCube and writes it as a snapshot for the API processes.
+    """
+    # Local imports: the worker only needs them when snapshots are enabled
+    from src.db.database import async_session_maker
+    from src.services.price_cube import PriceCube
+
+    try:
+        generation = MarketSnapshot(path).generation
+    except (OSError, ValueError):
+        generation = 0
+
+    while True:
+        try:
+            cube = PriceCube()
+            async with async_session_maker() as session:
+                await cube.load(session)
+            generation += 1
+            size = await asyncio.to_thread(
+                write_market_snapshot, path, cube.item_ids, cube.location_ids,
+                cube.prices, cube.updated_at, generation
+            )
+            logger.info(f"Market snapshot {generation} written to {path}: {size / 1e6:.1f} MB")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Market snapshot not written: {e}")
+        await asyncio.sleep(interval_sec)
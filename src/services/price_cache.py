@@ -0,0 +1,135 @@
+import datetime
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+
+@dataclass
+class CachedPrices:
+    """Serialized price response for one item, with its HTTP validators."""
+    item_id: int
+    body: bytes
+    etag: str
+    last_modified: Optional[datetime.datetime]
+    stored_at: float
+
+
+class PriceCache:
+    """
+    In-memory LRU of serialized price responses keyed by item unique_name.
+
+    Freshness is driven by ingestor notifications (invalidate_items).
+    The cache only serves while the notification listener is connected,
+    and ttl_sec is a safety net on top of that.
+
+    Every invalidation bumps a generation counter. A reader takes
+    `generation` before querying the database and passes it to `set`,
+    so a result that raced with a newer write is never stored.
+    """
+
+    def __init__(self, max_items: int = 5000, ttl_sec: float = 300.0):
+        self.max_items = max_items
+        self.ttl_sec = ttl_sec
+
+        self._entries: "OrderedDict[str, CachedPrices]" = OrderedDict()
+        self._names_by_id: Dict[int, str] = {}
+        self._invalidated_at: Dict[int, int] = {}
+        self._cleared_at = 0
+        self.generation = 0
+        self.active = False
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(self, unique_name: str) -> Optional[CachedPrices]:
+        entry = self._entries.get(unique_name) if self.active else None
+
+        if entry is not None and time.monotonic() - entry.stored_at > self.ttl_sec:
+            self._drop(unique_name)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(unique_name)
+        self.hits += 1
+        return entry
+
+    def set(
+            self,
+            unique_name: str,
+            item_id: int,
+            body: bytes,
+            generation: int,
+            etag: str = "",
+            last_modified: Optional[datetime.datetime] = None
+    ) -> bool:
+        """Stores a response read at `generation`. Returns False if it is already stale."""
+        if not self.active or generation < self._cleared_at:
+            return False
+        if self._invalidated_at.get(item_id, -1) > generation:
+            return False
+
+        self._entries[unique_name] = CachedPrices(
+            item_id=item_id,
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=time.monotonic()
+        )
+        self._entries.move_to_end(unique_name)
+        self._names_by_id[item_id] = unique_name
+
+        while len(self._entries) > self.max_items:
+            _, oldest = self._entries.popitem(last=False)
+            self._names_by_id.pop(oldest.item_id, None)
+            self.evictions += 1
+        return True
+
+    def invalidate_items(self, item_ids: Iterable[int]) -> int:
+        """Drops cached responses for changed items. Returns number of dropped entries."""
+        self.generation += 1
+        dropped = 0
+        for item_id in item_ids:
+            self._invalidated_at[item_id] = self.generation
+            name = self._names_by_id.get(item_id)
+            if name is not None and self._drop(name):
+                dropped += 1
+        self.invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._cleared_at = self.generation
+        self._entries.clear()
+        self._names_by_id.clear()
+        self._invalidated_at.clear()
+
+    def set_active(self, active: bool) -> None:
+        """Listener state hook: any gap in notifications makes cached data untrustworthy."""
+        self.clear()
+        self.active = active
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "active": self.active,
+            "size": len(self._entries),
+            "max_items": self.max_items,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _drop(self, unique_name: str) -> bool:
+        entry = self._entries.pop(unique_name, None)
+        if entry is None:
+            return False
+        self._names_by_id.pop(entry.item_id, None)
+        return True
@@ -0,0 +1,295 @@
+import asyncio
+import hashlib
+import itertools
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import select, any_, bindparam, func, literal, Integer, Text
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.notifications import PriceUpdate
+from src.db.database import async_session_maker
+from src.db.models import Item, Location, MarketPrice
+from src.services.market_snapshot import MarketSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Last axis of PriceCube.prices
+PRICE_FIELDS = ("sell_price_min", "sell_price_max", "buy_price_min", "buy_price_max")
+QUALITY_LEVELS = 5
+
+# Rows committed out of order around the snapshot watermark are re-read
+SNAPSHOT_CATCH_UP_MARGIN_SEC = 120
+
+
+def _positions(ids: np.ndarray, values: np.ndarray):
+    """Positions of `values` in sorted `ids`, and a mask of the ones present."""
+    if not len(ids):
+        return np.zeros(len(values), dtype=np.int64), np.zeros(len(values), dtype=bool)
+    pos = np.searchsorted(ids, values).clip(0, len(ids) - 1)
+    return pos, ids[pos] == values
+
+
+def _ids_digest(ids: Iterable[int]) -> str:
+    """md5 of "id,id,...", as computed by _catalog_digest_query."""
+    return hashlib.md5(",".join(map(str, ids)).encode()).hexdigest()
+
+
+def _catalog_digest_query():
+    ids = func.string_agg(Item.id.cast(Text), aggregate_order_by(literal(","), Item.id))
+    return select(func.md5(func.coalesce(ids, "")))
+
+
+class PriceCube:
+    """
+    Current market as dense arrays:
+    prices[item, location, quality - 1, field] (float64, NaN = no price; the
+    ingestor stores 0 for "no orders") and updated_at[item, location, quality - 1]
+    (unix seconds, 0 = never).
+
+    item_ids / location_ids map dense positions to database ids. The cube is
+    loaded once and kept current by ingestor notifications (handle_update
+    reloads the changed cells). After a gap in notifications, or when an
+    unknown item shows up, it is marked stale and reloaded on the next
+    ensure_loaded(). Like PriceCache, it is only used while the listener is
+    connected (`active`): without notifications nothing would refresh it.
+    Readers must check `ready`.
+
+    With snapshot_path (written by the ingestor worker, see market_snapshot),
+    a load maps the snapshot instead of reading all of market_prices, and
+    only rows changed after its watermark are queried. The arrays are then
+    copy-on-write views shared with every other process mapping the file.
+    """
+
+    def __init__(self, snapshot_path: Optional[str] = None, snapshot_max_age_sec: float = 3600.0):
+        self.snapshot_path = snapshot_path
+        self.snapshot_max_age_sec = snapshot_max_age_sec
+        self.snapshot_generation: Optional[int] = None
+
+        self.item_ids = np.empty(0, dtype=np.int64)
+        self.location_ids: List[int] = []
+        self.prices = np.empty((0, 0, QUALITY_LEVELS, len(PRICE_FIELDS)))
+        self.updated_at = np.empty((0, 0, QUALITY_LEVELS), dtype=np.int64)
+
+        self._item_index: Dict[int, int] = {}
+        self._location_index: Dict[int, int] = {}
+        self._lock = asyncio.Lock()
+        # Notifications are applied one at a time, in arrival order (Lock is FIFO)
+        self._update_lock = asyncio.Lock()
+        self.active = False
+        self._loaded = False
+        self._stale = True
+
+        self.updates = 0
+        self.cells_updated = 0
+        self.reloads = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.active and self._loaded and not self._stale
+
+    # --- Loading ---
+    async def load(self, session: AsyncSession) -> None:
+        """Full load: every item and location, all of market_prices."""
+        async with self._lock:
+            await self._load(session)
+
+    async def ensure_loaded(self, session: AsyncSession) -> bool:
+        """Reloads a stale cube while active. Returns `ready`."""
+        if self.active and not self.ready:
+            async with self._lock:
+                if self.active and not self.ready:
+                    await self._load(session)
+        return self.ready
+
+    async def _load(self, session: AsyncSession) -> None:
+        # Updates that arrive while loading make the result stale again
+        self._stale = False
+        if self.snapshot_path and await self._load_snapshot(session):
+            return
+
+        item_ids = np.array((await session.execute(select(Item.id).order_by(Item.id))).scalars().all(), dtype=np.int64)
+        location_ids = list((await session.execute(select(Location.id).order_by(Location.id))).scalars().all())
+
+        self.item_ids = item_ids
+        self.location_ids = location_ids
+        self._item_index = {int(item_id): i for i, item_id in enumerate(item_ids)}
+        self._location_index = {loc: i for i, loc in enumerate(location_ids)}
+        self.prices = np.full((len(item_ids), len(location_ids), QUALITY_LEVELS, len(PRICE_FIELDS)), np.nan)
+        self.updated_at = np.zeros((len(item_ids), len(location_ids), QUALITY_LEVELS), dtype=np.int64)
+
+        cells = self._apply(await self._fetch_rows(session))
+        self._loaded = True
+        self.reloads += 1
+        self.snapshot_generation = None
+        logger.info(f"Price cube loaded: {len(item_ids)} items x {len(location_ids)} locations, {cells} prices.")
+
+    async def _load_snapshot(self, session: AsyncSession) -> bool:
+        """Maps the snapshot and catches up from the database. False: load from the database instead."""
+        try:
+            snapshot = MarketSnapshot(self.snapshot_path)
+        except (OSError, ValueError) as e:
+            logger.info(f"Price cube snapshot unavailable: {e}")
+            return False
+        if snapshot.age > self.snapshot_max_age_sec or snapshot.prices.shape[2:] != (QUALITY_LEVELS, len(PRICE_FIELDS)):
+            logger.info(f"Price cube snapshot {self.snapshot_path} is outdated, loading from the database.")
+            return False
+
+        # Same ids in the same order, or every dense position would point at the wrong item
+        item_digest = (await session.execute(_catalog_digest_query())).scalar_one()
+        location_ids = (await session.execute(select(Location.id).order_by(Location.id))).scalars().all()
+        if item_digest != _ids_digest(snapshot.item_ids.tolist()) or list(location_ids) != snapshot.location_ids.tolist():
+            logger.info("Price cube snapshot has a different item catalog or locations, loading from the database.")
+            return False
+
+        self.item_ids = snapshot.item_ids
+        self.location_ids = snapshot.location_ids.tolist()
+        self._item_index = {int(item_id): i for i, item_id in enumerate(self.item_ids)}
+        self._location_index = {loc: i for i, loc in enumerate(self.location_ids)}
+        self.prices = snapshot.prices
+        self.updated_at = snapshot.updated_at
+
+        rows = await self._fetch_rows(session, since=snapshot.watermark - SNAPSHOT_CATCH_UP_MARGIN_SEC)
+        cells = self._apply(rows)
+        self._loaded = True
+        self.reloads += 1
+        self.snapshot_generation = snapshot.generation
+        logger.info(
+            f"Price cube mapped from snapshot {snapshot.generation} ({snapshot.age:.0f}s old): "
+            f"{len(self.item_ids)} items x {len(self.location_ids)} locations, {cells} prices caught up."
+        )
+        return True
+
+    @staticmethod
+    async def _fetch_rows(session: AsyncSession, item_ids: Optional[Sequence[int]] = None,
+                          location_id: Optional[int] = None, since: Optional[int] = None) -> np.ndarray:
+        query = select(
+            MarketPrice.item_id, MarketPrice.location_id, MarketPrice.quality_level,
+            *(func.coalesce(getattr(MarketPrice, f), 0) for f in PRICE_FIELDS),
+            func.coalesce(func.extract("epoch", MarketPrice.last_updated), 0).cast(Integer),
+        )
+        if item_ids is not None:
+            query = query.where(MarketPrice.item_id == any_(bindparam("item_ids", list(item_ids), type_=ARRAY(Integer))))
+        if location_id is not None:
+            query = query.where(MarketPrice.location_id == location_id)
+        if since is not None:
+            query = query.where(MarketPrice.last_updated > func.to_timestamp(since))
+
+        rows = (await session.execute(query)).all()
+        # fromiter over flat values: np.array() on Row objects is ~30x slower
+        width = 4 + len(PRICE_FIELDS)
+        return np.fromiter(itertools.chain.from_iterable(rows), dtype=np.int64, count=len(rows) * width).reshape(-1, width)
+
+    def _apply(self, rows: np.ndarray) -> int:
+        """Writes (item_id, location_id, quality, *PRICE_FIELDS, updated) rows. Returns cells written."""
+        # db ids -> dense positions, vectorized; rows outside the cube are dropped
+        item_pos, item_found = _positions(self.item_ids, rows[:, 0])
+        loc_pos, loc_found = _positions(np.asarray(self.location_ids, dtype=np.int64), rows[:, 1])
+        quality = rows[:, 2] - 1
+        known = item_found & loc_found & (quality >= 0) & (quality < QUALITY_LEVELS)
+        rows, item_pos, loc_pos, quality = rows[known], item_pos[known], loc_pos[known], quality[known]
+
+        values = rows[:, 3:3 + len(PRICE_FIELDS)].astype(np.float64)
+        values[values <= 0] = np.nan
+        self.prices[item_pos, loc_pos, quality] = values
+        self.updated_at[item_pos, loc_pos, quality] = rows[:, -1]
+        return len(rows)
+
+    # --- Notification hooks ---
+    async def handle_update(self, update: PriceUpdate) -> int:
+        """Reloads the changed (item, location) cells. Returns number of rows applied."""
+        async with self._update_lock:
+            return await self._apply_update(update)
+
+    async def _apply_update(self, update: PriceUpdate) -> int:
+        if not self.ready:
+            return 0
+        if self._lock.locked() or update.location_id not in self._location_index:
+            self._stale = True
+            return 0
+        if any(item_id not in self._item_index for item_id in update.item_ids):
+            # New items: the dense layout has to be rebuilt
+            self._stale = True
+            return 0
+
+        try:
+            async with async_session_maker() as session:
+                rows = await self._fetch_rows(session, update.item_ids, update.location_id)
+        except Exception as e:
+            logger.warning(f"Price cube update failed, reloading on next use: {e}")
+            self._stale = True
+            return 0
+        if not self.ready:
+            return 0
+
+        # Cells without a row anymore become empty
+        items = np.array([self._item_index[i] for i in update.item_ids], dtype=np.int64)
+        loc = self._location_index[update.location_id]
+        self.prices[items, loc] = np.nan
+        self.updated_at[items, loc] = 0
+
+        applied = self._apply(rows)
+        self.updates += 1
+        self.cells_updated += applied
+        return applied
+
+    def handle_listener_state(self, connected: bool) -> None:
+        """Notifications may have been missed: reload on next use, unused while disconnected."""
+        self._stale = True
+        self.active = connected
+
+    # --- Reads ---
+    def item_position(self, item_id: int) -> Optional[int]:
+        return self._item_index.get(item_id)
+
+    def location_position(self, location_id: int) -> Optional[int]:
+        return self._location_index.get(location_id)
+
+    def get(self, item_id: int, location_id: int, quality: int = 1) -> Optional[Dict[str, Optional[float]]]:
+        """O(1) lookup of one cell, None if the item or location is unknown."""
+        item, loc = self._item_index.get(item_id), self._location_index.get(location_id)
+        if item is None or loc is None or not 1 <= quality <= QUALITY_LEVELS:
+            return None
+        values = self.prices[item, loc, quality - 1]
+        return {f: (None if np.isnan(v) else float(v)) for f, v in zip(PRICE_FIELDS, values)}
+
+    def field(self, name: str) -> np.ndarray:
+        """(items, locations, qualities) view of one price field, no copy."""
+        return self.prices[..., PRICE_FIELDS.index(name)]
+
+    def matrix(
+            self,
+            item_ids: Iterable[int],
+            location_ids: Sequence[int],
+            quality: int = 1,
+            field: str = "sell_price_min"
+    ) -> np.ndarray:
+        """
+        (len(item_ids), len(location_ids)) slice, NaN where unknown.
+        Same contract as crafting.service.load_price_matrix, without a query.
+        """
+        item_ids = np.fromiter(item_ids, dtype=np.int64)
+        result = np.full((len(item_ids), len(location_ids)), np.nan)
+
+        item_pos, item_found = _positions(self.item_ids, item_ids)
+        loc_pos, loc_found = _positions(np.asarray(self.location_ids, dtype=np.int64), np.asarray(location_ids))
+        if item_found.any() and loc_found.any():
+            values = self.prices[item_pos[item_found]][:, loc_pos[loc_found], quality - 1, PRICE_FIELDS.index(field)]
+            result[np.ix_(item_found, loc_found)] = values
+        return result
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "ready": self.ready,
+            "items": len(self.item_ids),
+            "locations": len(self.location_ids),
+            "prices": int(np.count_nonzero(self.updated_at)),
+            "memory_bytes": int(self.prices.nbytes + self.updated_at.nbytes),
+            "updates": self.updates,
+            "cells_updated": self.cells_updated,
+            "reloads": self.reloads,
+            "snapshot_generation": self.snapshot_generation,
+        }
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional, Set
+
+from src.core.notifications import PriceUpdate
+from src.db.database import async_session_maker
+from src import queries
+
+logger = logging.getLogger(__name__)
+
+# (item_ids, location_id) -> changed price rows
+RowsFetcher = Callable[[List[int], int], Awaitable[List[dict]]]
+
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    One connected client. Empty item_ids means "every item" (location feed),
+    empty location_ids means "every location".
+    """
+    item_ids: FrozenSet[int]
+    location_ids: FrozenSet[int]
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=100))
+    closed: bool = False
+
+    def wants_location(self, location_id: int) -> bool:
+        return not self.location_ids or location_id in self.location_ids
+
+
+async def load_price_rows(item_ids: List[int], location_id: int) -> List[dict]:
+    async with async_session_maker() as session:
+        return await queries.fetch_price_rows(session, item_ids, location_id)
+
+
+class PriceFeed:
+    """
+    Fan-out of ingestor notifications to live subscribers.
+
+    Subscriptions are indexed by item id (and by location for item-less
+    subscriptions), so a notification only touches interested clients.
+    Changed rows are read once per notification, whatever the number of
+    subscribers. A client that does not drain its queue is disconnected
+    with an "overflow" event instead of blocking the others.
+    """
+
+    def __init__(self, fetch_rows: RowsFetcher = load_price_rows):
+        self.fetch_rows = fetch_rows
+        self._by_item: Dict[int, Set[Subscription]] = {}
+        self._by_location: Dict[Optional[int], Set[Subscription]] = {}
+
+    @property
+    def subscribers(self) -> int:
+        subs = set().union(*self._by_item.values(), *self._by_location.values())
+        return len(subs)
+
+    def subscribe(self, item_ids: Set[int], location_ids: Set[int]) -> Subscription:
+        sub = Subscription(item_ids=frozenset(item_ids), location_ids=frozenset(location_ids))
+        if sub.item_ids:
+            for item_id in sub.item_ids:
+                self._by_item.setdefault(item_id, set()).add(sub)
+        else:
+            for location_id in sub.location_ids or {None}:
+                self._by_location.setdefault(location_id, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        sub.closed = True
+        for index, keys in ((self._by_item, sub.item_ids), (self._by_location, sub.location_ids or {None})):
+            for key in keys:
+                bucket = index.get(key)
+                if bucket is not None:
+                    bucket.discard(sub)
+                    if not bucket:
+                        del index[key]
+
+    async def handle_update(self, update: PriceUpdate) -> None:
+        # 1. Interested subscribers only (index lookups, no DB)
+        targets: Set[Subscription] = set(self._by_location.get(None, ()))
+        targets |= self._by_location.get(update.location_id, set())
+        for item_id in update.item_ids:
+            targets |= self._by_item.get(item_id, set())
+        targets = {sub for sub in targets if sub.wants_location(update.location_id)}
+        if not targets:
+            return
+
+        # 2. One read for all of them
+        wanted = set(update.item_ids)
+        if all(sub.item_ids for sub in targets):
+            wanted &= set().union(*(sub.item_ids for sub in targets))
+        rows = await self.fetch_rows(sorted(wanted), update.location_id)
+        if not rows:
+            return
+
+        # 3. Fan-out
+        for sub in targets:
+            diff = [row for row in rows if not sub.item_ids or row["item_id"] in sub.item_ids]
+            if diff:
+                self._push(sub, {"event": "prices", "data": diff})
+
+    def handle_listener_state(self, connected: bool) -> None:
+        """Notifications may have been missed while disconnected: ask clients to re-read."""
+        if connected:
+            subs = set().union(*self._by_item.values(), *self._by_location.values())
+            for sub in subs:
+                self._push(sub, {"event": "resync", "data": None})
+
+    def _push(self, sub: Subscription, message: dict) -> None:
+        try:
+            sub.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("Price feed subscriber is too slow, disconnecting.")
+            self.unsubscribe(sub)
+            # Make room for the final event so the client learns why it was dropped
+            while not sub.queue.empty():
+                sub.queue.get_nowait()
+            sub.queue.put_nowait({"event": "overflow", "data": None})
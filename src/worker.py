@@ -19,7 +19,7 @@ try:
     from src.ingesting.repository import IngestorRepository
     from src.ingesting.processor import PriceProcessor
     from src.ingesting.service import IngestorService
-    from src.db.database import async_session_maker
+    from src.db.database import async_session_maker, init_engine, dispose_engine
 except ImportError as e:
     logger.critical(f"Import Error: {e}. Make sure you run this with 'python -m src.worker'")
     sys.exit(1)
@@ -45,6 +45,7 @@ async def main():
     config = IngestorConfig()
 
     logger.info(f"Config loaded. Max Rate: {config.max_rate}/s, Concurrency: {config.concurrency}")
+    init_engine()
 
     # 2. Initiating RateLimiter (Singleton)
     if config.max_rate < 1:
@@ -60,6 +61,16 @@ async def main():
     client = AlbionApiClient(config)
     processor = PriceProcessor()
 
+    # Market snapshot for the API processes, written in the background
+    snapshot_task = None
+    if config.market_snapshot_path:
+        # NumPy is only loaded when snapshots are enabled
+        from src.services.market_snapshot import run_snapshot_writer
+        snapshot_task = asyncio.create_task(
+            run_snapshot_writer(config.market_snapshot_path, config.market_snapshot_interval),
+            name="market-snapshot-writer"
+        )
+
     logger.info("Worker initialized. Entering main loop...")
 
     while running:
@@ -104,6 +115,14 @@ async def main():
             # Pause before retry
             await asyncio.sleep(5)
 
+    if snapshot_task is not None:
+        snapshot_task.cancel()
+        try:
+            await snapshot_task
+        except asyncio.CancelledError:
+            pass
+
+    await dispose_engine()
     logger.info("Worker process finished successfully.")
 
 
@@ -0,0 +1,30 @@
+import datetime
+from src.core.conditional import make_etag, http_date, is_not_modified
+
+LAST_MODIFIED = datetime.datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc)
+ETAG = make_etag(7, 15, LAST_MODIFIED)
+
+
+def test_etag_changes_with_data():
+    assert make_etag(7, 15, LAST_MODIFIED) == ETAG
+    assert make_etag(7, 16, LAST_MODIFIED) != ETAG
+    assert make_etag(7, 15, LAST_MODIFIED + datetime.timedelta(microseconds=1)) != ETAG
+
+
+def test_if_none_match():
+    assert is_not_modified({"if-none-match": ETAG}, ETAG, LAST_MODIFIED)
+    assert is_not_modified({"if-none-match": f'"other", {ETAG[2:]}'}, ETAG, LAST_MODIFIED)
+    assert not is_not_modified({"if-none-match": '"other"'}, ETAG, LAST_MODIFIED)
+
+
+def test_if_none_match_takes_precedence():
+    headers = {"if-none-match": '"other"', "if-modified-since": http_date(LAST_MODIFIED)}
+    assert not is_not_modified(headers, ETAG, LAST_MODIFIED)
+
+
+def test_if_modified_since_second_resolution():
+    assert is_not_modified({"if-modified-since": http_date(LAST_MODIFIED)}, ETAG, LAST_MODIFIED)
+
+    older = http_date(LAST_MODIFIED - datetime.timedelta(seconds=1))
+    assert not is_not_modified({"if-modified-since": older}, ETAG, LAST_MODIFIED)
+    assert not is_not_modified({"if-modified-since": "garbage"}, ETAG, LAST_MODIFIED)
@@ -0,0 +1,86 @@
+import gzip
+
+import brotli
+import httpx
+import msgpack
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from src.core.encoding import ResponseEncodingMiddleware, negotiate_encoding, wants_msgpack
+from src.core.responses import FastJSONResponse
+
+ROWS = [{"item_id": i, "location_id": 3, "sell_price_min": 1000 + i, "last_updated": "2026-10-19T12:00:00Z"} for i in range(200)]
+
+
+@pytest.fixture
+def client():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(ResponseEncodingMiddleware, minimum_size=100)
+
+    @app.get("/rows")
+    async def rows():
+        return FastJSONResponse(ROWS)
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield b'{"a":1}\n'
+            yield b'{"a":2}\n'
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def test_negotiation():
+    assert negotiate_encoding("gzip, deflate, br") == "br"
+    assert negotiate_encoding("br;q=0.5, gzip") == "gzip"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("*;q=0") is None
+
+    assert wants_msgpack("application/msgpack")
+    assert wants_msgpack("application/x-msgpack, application/json")
+    assert not wants_msgpack("application/json, application/msgpack;q=0.5")
+    assert not wants_msgpack("*/*")
+
+
+async def test_compression_above_threshold(client):
+    async with client:
+        for coding, decompress in (("br", brotli.decompress), ("gzip", gzip.decompress)):
+            r = await client.get("/rows", headers={"Accept-Encoding": coding})
+            assert r.headers["content-encoding"] == coding
+            assert "Accept-Encoding" in r.headers["vary"]
+            assert int(r.headers["content-length"]) < len(r.content) / 3  # httpx decodes transparently
+            assert r.json() == ROWS
+
+        r = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in r.headers
+
+
+async def test_msgpack_round_trip(client):
+    async with client:
+        r = await client.get("/rows", headers={"Accept": "application/msgpack", "Accept-Encoding": "identity"})
+        assert r.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(r.content) == ROWS
+
+        r = await client.get("/rows")
+        assert r.headers["content-type"] == "application/json"
+
+
+@pytest.mark.parametrize("url, accept_encoding", [("/rows", "identity"), ("/rows", ""), ("/small", "gzip")])
+async def test_plain_responses_still_vary(client, url, accept_encoding):
+    async with client:
+        r = await client.get(url, headers={"Accept-Encoding": accept_encoding})
+        assert "content-encoding" not in r.headers
+        assert r.headers["vary"] == "Accept, Accept-Encoding"
+
+
+async def test_streaming_responses_pass_through(client):
+    async with client:
+        r = await client.get("/stream", headers={"Accept-Encoding": "br", "Accept": "application/msgpack"})
+        assert "content-encoding" not in r.headers
+        assert r.content == b'{"a":1}\n{"a":2}\n'
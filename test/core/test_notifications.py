@@ -0,0 +1,19 @@
+import asyncio
+import logging
+
+from src.core.notifications import PriceUpdate, PriceUpdateListener
+
+
+async def test_async_handler_errors_are_logged(caplog):
+    async def failing(update):
+        raise RuntimeError("boom")
+
+    listener = PriceUpdateListener("postgresql://unused")
+    listener.subscribe(failing)
+    with caplog.at_level(logging.ERROR, logger="src.core.notifications"):
+        listener._dispatch(listener._update_handlers, PriceUpdate(location_id=1, item_ids=(3,)))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    assert not listener._pending
+    assert "Price update handler failed" in caplog.text and "boom" in caplog.text
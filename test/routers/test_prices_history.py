@@ -0,0 +1,29 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.db.database import get_db
+from src.routers import prices
+
+
+@pytest.fixture
+def db():
+    return MagicMock(execute=AsyncMock())
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(prices.router)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("bucket", ["99999999999d", "10000h", "15s", "h"])
+def test_invalid_bucket_is_rejected(client, db, bucket):
+    response = client.get("/prices/T4_BAG/history", params={"bucket": bucket})
+
+    assert response.status_code == 422
+    db.execute.assert_not_awaited()
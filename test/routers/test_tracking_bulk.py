@@ -0,0 +1,80 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import DBAPIError
+
+from src.db.database import get_db
+from src.routers import tracking
+
+
+@pytest.fixture
+def db():
+    return MagicMock(execute=AsyncMock(return_value=MagicMock(rowcount=14)), commit=AsyncMock(), rollback=AsyncMock())
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(tracking.router)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("method, url, extra", [
+    ("POST", "/tracked-items/bulk", {}),
+    ("PATCH", "/tracked-items/bulk", {"priority": 3}),
+    ("POST", "/tracked-items/bulk/remove", {}),
+])
+def test_bulk_endpoints(client, db, method, url, extra):
+    response = client.request(method, url, json={"category": "resource", "tier_min": 4, **extra})
+
+    assert response.status_code == 200
+    assert response.json() == {"affected": 14}
+    db.execute.assert_awaited_once()
+
+
+@pytest.mark.parametrize("payload", [
+    {"tier_min": 1},
+    {"tier_min": 4, "tier_max": 8, "enchant_max": 2},
+    {"is_refined": True},
+])
+def test_bounds_alone_are_rejected(client, db, payload):
+    response = client.post("/tracked-items/bulk/remove", json=payload)
+
+    assert response.status_code == 422
+    db.execute.assert_not_awaited()
+
+
+def test_invalid_pattern_is_rejected(client, db):
+    assert client.post("/tracked-items/bulk", json={"unique_name_pattern": "T4_("}).status_code == 422
+    assert client.post("/tracked-items/bulk", json={"unique_name_pattern": "A" * 201}).status_code == 422
+    db.execute.assert_not_awaited()
+
+
+def test_pattern_rejected_by_postgres_is_a_client_error(client, db):
+    orig = Exception("invalid regular expression: invalid embedded option")
+    orig.sqlstate = "2201B"
+    db.execute.side_effect = DBAPIError("SELECT ...", {}, orig)
+
+    response = client.post("/tracked-items/bulk", json={"unique_name_pattern": "(?P<x>BAG)"})
+
+    assert response.status_code == 400
+    db.rollback.assert_awaited_once()
+
+
+@pytest.mark.parametrize("after", ["99999999999:1", "1:9999999999", "1-2"])
+def test_cursor_out_of_range_is_rejected(client, db, after):
+    response = client.get("/tracked-items", params={"after": after})
+
+    assert response.status_code == 422
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.parametrize("method, url", [("POST", "/tracked-items/bulk"), ("PATCH", "/tracked-items/bulk")])
+def test_priority_beyond_smallint_is_rejected(client, db, method, url):
+    response = client.request(method, url, json={"category": "resource", "priority": 32768})
+
+    assert response.status_code == 422
+    db.execute.assert_not_awaited()
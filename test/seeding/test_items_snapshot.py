@@ -0,0 +1,38 @@
+import gzip
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.seeding.manager import SeedingManager
+from src.seeding.seeders.items import ItemsSeeder
+from src.seeding.seeders.items_snapshot import SNAPSHOT_HEADER, ItemsSnapshotSeeder
+
+
+def settings(snapshot=None):
+    return MagicMock(SEED_ITEMS_URL="https://dumps.test/items.json", SEED_MIN_TIER=4, SEED_MAX_TIER=8,
+                     SEED_ITEMS_SNAPSHOT=snapshot)
+
+
+def test_manager_uses_configured_snapshot(tmp_path):
+    snapshot = tmp_path / "items.csv.gz"
+
+    assert SeedingManager(MagicMock(), settings()).get_seeders()["ItemsSeeder"][0] is ItemsSeeder
+
+    with pytest.raises(FileNotFoundError, match="Items snapshot not found"):
+        SeedingManager(MagicMock(), settings(str(snapshot))).get_seeders()
+
+    snapshot.write_bytes(gzip.compress(f"{SNAPSHOT_HEADER}\n".encode()))
+    seeders = SeedingManager(MagicMock(), settings(str(snapshot))).get_seeders()
+    assert seeders["ItemsSeeder"][0] is ItemsSnapshotSeeder
+
+
+async def test_snapshot_with_other_columns_is_rejected(tmp_path):
+    snapshot = tmp_path / "items.csv.gz"
+    snapshot.write_bytes(gzip.compress(b"unique_name,display_name,base_name,tier,enchantment_level\nT4_BAG,,,4,0\n"))
+    session = MagicMock(execute=AsyncMock(), rollback=AsyncMock())
+
+    with pytest.raises(ValueError, match="Unexpected snapshot columns"):
+        await ItemsSnapshotSeeder(session, snapshot).run()
+
+    session.execute.assert_not_awaited()
+    session.rollback.assert_awaited_once()
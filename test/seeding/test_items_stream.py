@@ -0,0 +1,82 @@
+import httpx
+import json
+import respx
+from unittest.mock import AsyncMock, MagicMock
+from src.seeding.config import SeedingConfig
+from src.seeding.providers.albion_stream import AlbionStreamProvider
+from src.seeding.seeders.items import ItemsSeeder
+
+URL = "https://dumps.test/items.json"
+
+ITEMS = [
+    {"UniqueName": "T4_BAG", "LocalizedNames": {"EN-US": "Adept's Bag", "DE-DE": "Tasche des Adepten"}, "Index": "1"},
+    {"UniqueName": "T5_MAIN_SWORD@2", "LocalizedNames": None},
+    {"LocalizedNames": {"EN-US": "broken entry"}},
+    {"UniqueName": "T8_ORE_LEVEL3@3", "LocalizedNames": {"EN-US": "Elder's Ore"}, "Weight": 1.5},
+]
+
+
+def chunked(body: bytes, size: int):
+    async def stream():
+        for i in range(0, len(body), size):
+            yield body[i: i + size]
+    return stream()
+
+
+@respx.mock
+async def test_stream_yields_items_across_chunk_boundaries():
+    body = json.dumps(ITEMS).encode()
+    respx.get(URL).mock(return_value=httpx.Response(200, content=chunked(body, 7)))
+
+    provider = AlbionStreamProvider(URL, chunk_size=7)
+    assert [entry async for entry in provider.stream()] == ITEMS
+
+
+@respx.mock
+async def test_stream_retries_server_errors_before_first_item():
+    route = respx.get(URL)
+    route.side_effect = [httpx.Response(503), httpx.Response(200, json=ITEMS)]
+
+    assert await AlbionStreamProvider(URL).fetch() == ITEMS
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_items_seeder_validates_rows_while_streaming():
+    respx.get(URL).mock(return_value=httpx.Response(200, json=ITEMS))
+    session = MagicMock(get=AsyncMock(return_value=None))
+    seeder = ItemsSeeder(session, SeedingConfig(items_source_url=URL), AlbionStreamProvider(URL))
+
+    rows = [row async for row in seeder.stream_data()]
+
+    assert [r[0] for r in rows] == ["T4_BAG", "T5_MAIN_SWORD@2", "T8_ORE_LEVEL3@3"]
+    assert rows[1] == ("T5_MAIN_SWORD@2", "T5_MAIN_SWORD@2", "T5_MAIN_SWORD@2", 5, 2, "weapon", None, False, "MAIN_SWORD")
+
+
+@respx.mock
+async def test_conditional_request_and_content_hash():
+    route = respx.get(URL)
+    route.side_effect = [
+        httpx.Response(200, json=ITEMS, headers={"ETag": '"v1"', "Last-Modified": "Mon, 19 Oct 2026 06:00:00 GMT"}),
+        httpx.Response(304),
+    ]
+
+    provider = AlbionStreamProvider(URL)
+    assert len(await provider.fetch()) == len(ITEMS)
+    assert provider.etag == '"v1"' and len(provider.content_hash) == 64
+
+    again = AlbionStreamProvider(URL, etag=provider.etag, last_modified=provider.last_modified)
+    assert await again.fetch() == []
+    assert again.not_modified
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+def test_items_seeder_counts_diff_from_upsert_result():
+    seeder = ItemsSeeder(MagicMock(), SeedingConfig(items_source_url=URL), MagicMock())
+    # Upsert returned one inserted and one updated row, the third was unchanged
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [True, False]
+
+    seeder.on_batch_written([("T4_BAG",), ("T5_MAIN_SWORD@2",), ("T8_ORE_LEVEL3@3",)], result)
+
+    assert seeder.stats == {"new": 1, "changed": 1, "unchanged": 1}
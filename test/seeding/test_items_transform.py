@@ -0,0 +1,65 @@
+import pytest
+from unittest.mock import MagicMock
+from src.seeding.config import SeedingConfig
+from src.models.items import CATEGORY_RESOURCE, classify_item
+from src.seeding.providers.database import RESOURCE_PATTERN
+from src.seeding.seeders.items import ITEM_COLUMNS, ItemsSeeder
+
+ENTRIES = [
+    {"UniqueName": "T4_BAG", "LocalizedNames": {"EN-US": "Adept's Bag", "DE-DE": "Tasche"}},
+    {"UniqueName": "T8_MAIN_SWORD@3", "LocalizedNames": {"DE-DE": "Schwert"}},
+    {"UniqueName": "T5_ORE_LEVEL2@2", "LocalizedNames": None},
+    {"UniqueName": "T12_X@10"},
+    {"UniqueName": "UNIQUE_HIDEOUT", "LocalizedNames": {}},
+    {"UniqueName": "QUESTITEM_TOKEN@1", "LocalizedNames": {"EN-US": ""}},
+    {"UniqueName": "T4_@", "LocalizedNames": {"EN-US": "Odd"}},
+    {"UniqueName": "T4_NEWLINE@2\n"},
+    {"UniqueName": "T3_A@1_B@2"},
+    {"UniqueName": "t4_lower"},
+    # invalid: skipped by both paths
+    {"LocalizedNames": {"EN-US": "no unique name"}},
+    {"UniqueName": 42},
+    {"UniqueName": "T4_BAD_NAMES", "LocalizedNames": {"EN-US": None}},
+    {"UniqueName": "T4_LIST_NAMES", "LocalizedNames": ["Bag"]},
+]
+
+
+@pytest.fixture
+def seeder():
+    return ItemsSeeder(MagicMock(), SeedingConfig(items_source_url="https://dumps.test/items.json"), MagicMock())
+
+
+@pytest.mark.parametrize("entry", ENTRIES)
+def test_fast_transform_matches_validating_path(seeder, entry):
+    expected = seeder.transform_item(entry)
+    expected = None if expected is None else tuple(expected[c] for c in ITEM_COLUMNS)
+
+    assert seeder.transform_row(entry) == expected
+
+
+def test_transform_data_skips_invalid_entries(seeder):
+    rows = seeder.transform_data(ENTRIES)
+    assert len(rows) == len(ENTRIES) - 4
+    assert rows[1] == ("T8_MAIN_SWORD@3", "T8_MAIN_SWORD@3", "T8_MAIN_SWORD@3", 8, 3, "weapon", None, False, "MAIN_SWORD")
+    assert rows[2][5:] == ("resource", "ORE", False, "ORE")
+
+
+@pytest.mark.parametrize("unique_name, expected", [
+    ("T4_ORE", ("resource", "ORE", False, "ORE")),
+    ("T5_PLANKS_LEVEL2@2", ("resource", "WOOD", True, "PLANKS")),
+    ("T8_2H_BOW@1", ("weapon", None, False, "2H_BOW")),
+    ("T6_2H_TOOL_PICK@1", ("tool", None, False, "2H_TOOL_PICK")),
+    ("T4_BAG_INSIGHT", ("bag", None, False, "BAG_INSIGHT")),
+    ("UNIQUE_HIDEOUT", ("other", None, False, "UNIQUE_HIDEOUT")),
+])
+def test_classify_item(unique_name, expected):
+    assert classify_item(unique_name) == expected
+
+
+@pytest.mark.parametrize("unique_name", [
+    "T1_ROCK", "T4_ORE", "T8_CLOTH", "T4_ORE_LEVEL1@1", "T5_PLANKS_LEVEL2@2", "T7_STONEBLOCK_LEVEL3@3",
+    "T4_ORE@1", "T9_ORE", "T0_WOOD", "ORE", "T4_ORE_LEVEL1", "T4_METALBAR_X", "T4_MAIN_SWORD", "T4_2H_TOOL_SICKLE",
+])
+def test_resource_category_matches_resource_pattern(unique_name):
+    is_resource = classify_item(unique_name).category == CATEGORY_RESOURCE
+    assert is_resource == bool(RESOURCE_PATTERN.match(unique_name))
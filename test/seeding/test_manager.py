@@ -0,0 +1,75 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.seeding.manager import SeedingManager
+
+
+def make_seeder(name, events, depends_on=(), delay=0.05, fail=False):
+    class FakeSeeder:
+        def __init__(self, session):
+            self.session = session
+
+        async def run(self):
+            events.append(("start", name))
+            await asyncio.sleep(delay)
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            events.append(("end", name))
+
+    FakeSeeder.__name__ = name
+    FakeSeeder.depends_on = depends_on
+    return FakeSeeder
+
+
+def make_manager(seeders):
+    sessions = []
+
+    def session_maker():
+        session = MagicMock()
+        session.__aenter__ = lambda s: asyncio.sleep(0, result=s)
+        session.__aexit__ = lambda s, *exc: asyncio.sleep(0, result=False)
+        sessions.append(session)
+        return session
+
+    settings = MagicMock(SEED_ITEMS_URL="http://example.com/items.json", SEED_MIN_TIER=4, SEED_MAX_TIER=8,
+                         SEED_ITEMS_SNAPSHOT=None)
+    manager = SeedingManager(session_maker, settings)
+    manager.get_seeders = lambda: {cls.__name__: (cls, cls) for cls in seeders}
+    return manager, sessions
+
+
+async def test_independent_seeders_overlap_and_dependents_wait():
+    events = []
+    manager, sessions = make_manager([
+        make_seeder("Tracked", events, depends_on=("Items", "Locations"), delay=0),
+        make_seeder("Items", events),
+        make_seeder("Locations", events),
+    ])
+    await manager.seed()
+
+    assert events[:2] == [("start", "Items"), ("start", "Locations")]
+    assert events.index(("start", "Tracked")) > max(events.index(("end", "Items")), events.index(("end", "Locations")))
+    assert len(sessions) == 3
+    assert set(manager.timings) == {"Items", "Locations", "Tracked"}
+
+
+async def test_failed_dependency_skips_dependents():
+    events = []
+    manager, _ = make_manager([
+        make_seeder("Items", events, fail=True),
+        make_seeder("Locations", events),
+        make_seeder("Tracked", events, depends_on=("Items", "Locations")),
+    ])
+    with pytest.raises(RuntimeError, match="Items failed"):
+        await manager.seed()
+
+    assert ("end", "Locations") in events
+    assert ("start", "Tracked") not in events
+
+
+async def test_unknown_dependency_is_rejected():
+    manager, _ = make_manager([make_seeder("Tracked", [], depends_on=("Items",))])
+    with pytest.raises(ValueError, match="not scheduled"):
+        await manager.seed()
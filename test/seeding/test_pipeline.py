@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.seeding.core.base import BaseSeeder
+
+
+class PipelineSeeder(BaseSeeder[list]):
+    def __init__(self, rows, fail_at=None):
+        super().__init__(MagicMock(rollback=AsyncMock()), batch_size=10, queue_size=1)
+        self.rows = rows
+        self.fail_at = fail_at
+        self.events = []
+        self.written = []
+
+    async def stream_data(self):
+        for i in range(self.rows):
+            if i == self.fail_at:
+                raise ValueError("bad row")
+            if i % self.batch_size == 0:
+                self.events.append(("transform", i))
+                await asyncio.sleep(0)
+            yield i
+
+    async def _write_batch(self, batch, offset):
+        self.events.append(("write", offset))
+        await asyncio.sleep(0.01)
+        self.written.extend(batch)
+
+    async def _fetch_data(self):
+        return []
+
+    def transform_data(self, raw_data):
+        return raw_data
+
+    def get_model(self):
+        return None
+
+    def get_conflict_statement(self, stmt):
+        return stmt
+
+
+async def test_transform_overlaps_writes_with_bounded_queue():
+    seeder = PipelineSeeder(rows=50)
+    await seeder.run()
+
+    assert seeder.written == list(range(50))
+    # Batch 20 is transformed while batch 0 is still being written
+    assert seeder.events.index(("transform", 20)) < seeder.events.index(("write", 10))
+    # ...but the producer never runs more than queue_size + 1 batches ahead
+    assert seeder.events.index(("transform", 40)) > seeder.events.index(("write", 10))
+
+
+async def test_transform_error_stops_the_pipeline():
+    seeder = PipelineSeeder(rows=50, fail_at=25)
+    with pytest.raises(ValueError, match="bad row"):
+        await seeder.run()
+
+    assert seeder.written == list(range(20))
+    seeder.session.rollback.assert_awaited_once()
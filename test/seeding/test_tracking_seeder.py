@@ -0,0 +1,29 @@
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from src.seeding.providers.database import RESOURCE_PATTERN, RESOURCE_REGEX
+from src.seeding.seeders.tracking import TrackedItemsSeeder
+
+
+def test_resource_pattern():
+    assert RESOURCE_PATTERN.match("T4_ORE")
+    assert RESOURCE_PATTERN.match("T8_METALBAR_LEVEL3@3")
+    assert not RESOURCE_PATTERN.match("T4_MAIN_SWORD")
+    assert not RESOURCE_PATTERN.match("T4_ORE@1")
+
+
+def test_server_side_statement_is_a_single_insert_select():
+    seeder = TrackedItemsSeeder(MagicMock(), pattern=RESOURCE_REGEX)
+    sql = str(seeder.get_server_side_statement().compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("INSERT INTO tracked_items (item_id, location_id, is_active, priority) SELECT")
+    assert "JOIN locations ON true" in sql
+    assert "items.unique_name ~" in sql
+    assert sql.endswith("ON CONFLICT (item_id, location_id) DO NOTHING")
+
+
+async def test_server_side_run_sends_no_rows():
+    session = MagicMock(execute=AsyncMock(return_value=MagicMock(rowcount=70)), commit=AsyncMock())
+    await TrackedItemsSeeder(session, pattern=RESOURCE_REGEX).run()
+
+    session.execute.assert_awaited_once()
+    session.commit.assert_awaited_once()
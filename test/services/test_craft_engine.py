@@ -0,0 +1,129 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import numpy as np
+import pytest
+import respx
+from src.services.crafting import RecipeBook, evaluate, parse_recipes
+from src.services.crafting.service import CraftingService
+from src.services.crafting.engine import ScenarioGrid, sweep, with_focus
+
+DUMP = {
+    "items": {
+        "simpleitem": [
+            {
+                "@uniquename": "T4_METALBAR",
+                "craftingrequirements": {
+                    "@silver": "0",
+                    "@amountcrafted": "1",
+                    "craftresource": [
+                        {"@uniquename": "T4_ORE", "@count": "2"},
+                        {"@uniquename": "T3_METALBAR", "@count": "1"},
+                    ],
+                },
+                "enchantments": {
+                    "enchantment": {
+                        "@enchantmentlevel": "1",
+                        "craftingrequirements": {
+                            "craftresource": [
+                                {"@uniquename": "T4_ORE_LEVEL1", "@count": "2"},
+                                {"@uniquename": "T3_METALBAR", "@count": "1"},
+                            ],
+                        },
+                    },
+                },
+            },
+            {"@uniquename": "T4_ORE"},
+        ],
+        "weapon": [
+            {
+                "@uniquename": "T4_MAIN_SWORD",
+                "craftingrequirements": [
+                    {
+                        "@silver": "100",
+                        "craftresource": [
+                            {"@uniquename": "T4_METALBAR", "@count": "16"},
+                            {"@uniquename": "T4_ARTEFACT_SWORD", "@count": "1", "@maxreturnamount": "0"},
+                        ],
+                    },
+                ],
+            },
+            {
+                # material missing from the catalog -> recipe skipped
+                "@uniquename": "T4_MAIN_AXE",
+                "craftingrequirements": {"craftresource": {"@uniquename": "T4_UNKNOWN", "@count": "1"}},
+            },
+        ],
+    }
+}
+
+CATALOG = ["T4_METALBAR", "T4_METALBAR_LEVEL1@1", "T4_ORE", "T4_ORE_LEVEL1@1",
+           "T3_METALBAR", "T4_MAIN_SWORD", "T4_ARTEFACT_SWORD", "T4_MAIN_AXE"]
+
+
+@pytest.fixture
+def book():
+    return RecipeBook.build(parse_recipes(DUMP), {name: i + 1 for i, name in enumerate(CATALOG)})
+
+
+def test_recipes_resolve_market_names(book):
+    products = [book.names[p] for p in book.products]
+    assert products == ["T4_METALBAR", "T4_METALBAR_LEVEL1@1", "T4_MAIN_SWORD"]
+
+    enchanted = book.material_index[book.indptr[1]:book.indptr[2]]
+    assert [book.names[m] for m in enchanted] == ["T4_ORE_LEVEL1@1", "T3_METALBAR"]
+    assert book.item_ids[book.products[0]] == 1
+
+
+def test_evaluate_matches_hand_calculation(book):
+    prices = np.full((len(book.names), 2), np.nan)
+    price = {"T4_METALBAR": 300, "T4_ORE": 100, "T3_METALBAR": 50, "T4_MAIN_SWORD": 6000, "T4_ARTEFACT_SWORD": 500}
+    for name, value in price.items():
+        prices[book.index[name], 0] = value
+
+    result = evaluate(book, prices, return_rate=0.5, tax_rate=0.1)
+
+    # bar: (2 * 100 + 50) * 0.5 = 125, sold for 300 * 0.9
+    assert result.material_cost[0, 0] == pytest.approx(125)
+    assert result.profit[0, 0] == pytest.approx(270 - 125)
+    # sword: 16 bars with return, artefact without, plus silver fee
+    assert result.material_cost[2, 0] == pytest.approx(16 * 300 * 0.5 + 500 + 100)
+    # unknown prices propagate as NaN instead of fake profit
+    assert np.isnan(result.profit[1, 0])
+    assert np.isnan(result.profit[:, 1]).all()
+
+
+def test_sweep_matches_evaluate_per_scenario(book):
+    rng = np.random.default_rng(3)
+    prices = rng.integers(10, 1000, size=len(book.names)).astype(float)
+    grid = ScenarioGrid.product([0.0, 0.152, 0.248], [False, True], [0.0], [0.04, 0.065])
+    recipes = np.array([2, 0])
+
+    result = sweep(book, recipes, prices, grid)
+
+    assert result.profit.shape == (2, 12)
+    for s in range(grid.size):
+        rate = with_focus(grid.return_rate[s]) if grid.focus[s] else grid.return_rate[s]
+        expected = evaluate(book, prices[:, None], rate, grid.tax_rate[s]).profit[recipes, 0]
+        np.testing.assert_allclose(result.profit[:, s], expected)
+
+
+def test_focus_return_rate_matches_game_values():
+    np.testing.assert_allclose(with_focus([0.152, 0.248]), [0.435, 0.479], atol=1e-3)
+
+
+@respx.mock
+async def test_service_loads_book_off_the_event_loop(monkeypatch):
+    respx.get("https://dumps.test/items.json").mock(return_value=httpx.Response(200, json=DUMP))
+    catalog = MagicMock()
+    catalog.all.return_value = [MagicMock(unique_name=name, id=i + 1) for i, name in enumerate(CATALOG)]
+    session = MagicMock(execute=AsyncMock(return_value=catalog))
+    to_thread = AsyncMock(side_effect=lambda fn, *args: fn(*args))
+    monkeypatch.setattr(asyncio, "to_thread", to_thread)
+
+    book = await CraftingService("https://dumps.test/items.json").get_book(session)
+
+    assert book.size == 3
+    # JSON decoding and recipe parsing both ran through to_thread
+    assert to_thread.await_count == 2
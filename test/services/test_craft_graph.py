@@ -0,0 +1,106 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import numpy as np
+import pytest
+from src.core.notifications import PriceUpdate
+from src.services.crafting import CostGraph, RecipeBook, Recipe
+from src.services.crafting import service as service_module
+from src.services.crafting.recipes import Material
+from src.services.crafting.service import CraftingService
+
+# ORE -> BAR -> SWORD, and an unrelated HIDE -> LEATHER chain
+RECIPES = [
+    Recipe(("BAR",), (Material("ORE", 2),)),
+    Recipe(("SWORD",), (Material("BAR", 4), Material("ARTEFACT", 1, returnable=False)), silver=10),
+    Recipe(("LEATHER",), (Material("HIDE", 2),)),
+]
+PRICES = {"ORE": 10, "BAR": 100, "SWORD": 500, "ARTEFACT": 50, "HIDE": 5, "LEATHER": 20}
+
+
+@pytest.fixture
+def graph():
+    book = RecipeBook.build(RECIPES, {name: i + 1 for i, name in enumerate(PRICES)})
+    prices = np.empty((len(book.names), 2))
+    for name, value in PRICES.items():
+        prices[book.index[name]] = value
+    graph = CostGraph(book, return_rate=0.0)
+    graph.load(prices)
+    return graph
+
+
+def cost(graph, name, col=0):
+    return graph.cost[graph.book.index[name], col]
+
+
+def test_chain_uses_cheaper_of_buy_or_craft(graph):
+    assert list(graph.level) == [0, 1, 0]
+    assert cost(graph, "BAR") == 20  # crafted from 2 ore instead of buying at 100
+    assert graph.craft_cost[1, 0] == 4 * 20 + 50 + 10
+
+
+def test_update_recomputes_only_downstream(graph):
+    ore = np.array([graph.book.index["ORE"]])
+
+    assert graph.update_prices(ore, 0, np.array([15.0])) == 2  # BAR and SWORD, not LEATHER
+    assert cost(graph, "BAR") == 30
+    assert cost(graph, "BAR", col=1) == 20  # other location untouched
+
+    # Bar is bought from now on: ore changes stop at BAR
+    assert graph.update_prices(ore, 0, np.array([80.0])) == 2
+    assert cost(graph, "BAR") == 100
+    assert graph.update_prices(ore, 0, np.array([90.0])) == 1
+
+
+def test_incremental_matches_full_evaluation(graph):
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        item = rng.integers(len(graph.book.names), size=1)
+        graph.update_prices(item, 0, rng.integers(1, 200, size=1).astype(float))
+
+    full = CostGraph(graph.book, return_rate=0.0)
+    full.load(graph.prices)
+    np.testing.assert_allclose(graph.cost, full.cost)
+    np.testing.assert_allclose(graph.craft_cost, full.craft_cost)
+
+
+@pytest.fixture
+def service(graph, monkeypatch):
+    @asynccontextmanager
+    async def session_maker():
+        yield None
+
+    monkeypatch.setattr(service_module, "async_session_maker", session_maker)
+    service = CraftingService("https://dumps.test/items.json")
+    service._graph, service._graph_location_ids, service._graph_stale = graph, [1, 2], False
+    return service
+
+
+async def test_updates_are_applied_in_arrival_order(service, graph, monkeypatch):
+    # The first read is slower: unserialized, its older price would land last
+    reads = iter([(0.02, 11.0), (0.0, 12.0)])
+
+    async def load_price_matrix(session, item_ids, location_ids):
+        delay, price = next(reads)
+        await asyncio.sleep(delay)
+        return np.array([[price]])
+
+    monkeypatch.setattr(service_module, "load_price_matrix", load_price_matrix)
+    ore_id = graph.book.item_ids[graph.book.index["ORE"]]
+    update = PriceUpdate(location_id=1, item_ids=(int(ore_id),))
+
+    await asyncio.gather(service.handle_update(update), service.handle_update(update))
+
+    assert graph.prices[graph.book.index["ORE"], 0] == 12.0
+    assert service.batches == 2
+
+
+async def test_failed_read_marks_graph_stale(service, graph, monkeypatch):
+    async def load_price_matrix(session, item_ids, location_ids):
+        raise ConnectionError("database went away")
+
+    monkeypatch.setattr(service_module, "load_price_matrix", load_price_matrix)
+    ore_id = graph.book.item_ids[graph.book.index["ORE"]]
+
+    assert await service.handle_update(PriceUpdate(location_id=1, item_ids=(int(ore_id),))) == 0
+    assert service.stats()["loaded"] is False
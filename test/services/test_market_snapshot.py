@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from src.services import market_snapshot as market_snapshot_module
+from src.services.market_snapshot import MarketSnapshot, write_market_snapshot
+
+
+@pytest.fixture
+def market():
+    prices = np.full((3, 2, 5, 4), np.nan)
+    prices[0, 1, 0] = [100, 120, 80, 90]
+    updated_at = np.zeros((3, 2, 5), dtype=np.int64)
+    updated_at[0, 1, 0] = 1700000000
+    return np.array([3, 7, 11]), [1, 4], prices, updated_at
+
+
+def test_round_trip_is_zero_copy(tmp_path, market):
+    path = tmp_path / "market.bin"
+    size = write_market_snapshot(path, *market, generation=5)
+
+    snapshot = MarketSnapshot(path)
+    assert path.stat().st_size == size
+    assert snapshot.generation == 5 and snapshot.watermark == 1700000000
+    assert snapshot.item_ids.tolist() == [3, 7, 11] and snapshot.location_ids.tolist() == [1, 4]
+    np.testing.assert_array_equal(snapshot.prices, market[2])
+    assert np.shares_memory(snapshot.prices, snapshot._map)
+
+    # Copy-on-write: local changes never reach the file
+    snapshot.prices[0, 1, 0, 0] = 1
+    assert MarketSnapshot(path).prices[0, 1, 0, 0] == 100
+
+
+def test_replace_keeps_open_mappings(tmp_path, market):
+    path = tmp_path / "market.bin"
+    write_market_snapshot(path, *market, generation=1)
+    old = MarketSnapshot(path)
+
+    market[2][0, 1, 0, 0] = 95
+    write_market_snapshot(path, *market, generation=2)
+
+    assert old.prices[0, 1, 0, 0] == 100
+    assert MarketSnapshot(path).prices[0, 1, 0, 0] == 95
+    assert [p.name for p in tmp_path.iterdir()] == ["market.bin"]
+
+
+def test_header_and_arrays_come_from_one_file(tmp_path, market, monkeypatch):
+    path = tmp_path / "market.bin"
+    write_market_snapshot(path, *market, generation=1)
+    newer = market[2].copy()
+    newer[0, 1, 0, 0] = 95
+    memmap = np.memmap
+
+    def replace_then_map(*args, **kwargs):
+        # The writer replaces the file between reading the header and mapping
+        write_market_snapshot(path, market[0], market[1], newer, market[3], generation=2)
+        return memmap(*args, **kwargs)
+
+    monkeypatch.setattr(market_snapshot_module.np, "memmap", replace_then_map)
+    snapshot = MarketSnapshot(path)
+
+    assert snapshot.generation == 1 and snapshot.prices[0, 1, 0, 0] == 100
+
+
+def test_rejects_foreign_or_truncated_files(tmp_path, market):
+    path = tmp_path / "market.bin"
+    for content in (b"not a snapshot" * 10, b"short", b""):
+        path.write_bytes(content)
+        with pytest.raises(ValueError, match="not a market snapshot"):
+            MarketSnapshot(path)
+
+    write_market_snapshot(path, *market, generation=1)
+    path.write_bytes(path.read_bytes()[:-64])
+    with pytest.raises(ValueError, match="truncated"):
+        MarketSnapshot(path)
@@ -0,0 +1,59 @@
+import pytest
+from src.services.price_cache import PriceCache
+
+
+@pytest.fixture
+def cache():
+    cache = PriceCache(max_items=2, ttl_sec=60)
+    cache.set_active(True)
+    return cache
+
+
+def test_hit_and_miss_statistics(cache):
+    assert cache.get("T4_BAG") is None
+
+    cache.set("T4_BAG", 1, b"[]", cache.generation)
+    assert cache.get("T4_BAG").body == b"[]"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_invalidation_drops_only_touched_items(cache):
+    cache.set("T4_BAG", 1, b"[1]", cache.generation)
+    cache.set("T5_BAG", 2, b"[2]", cache.generation)
+
+    assert cache.invalidate_items([1, 99]) == 1
+
+    assert cache.get("T4_BAG") is None
+    assert cache.get("T5_BAG") is not None
+
+
+def test_stale_read_is_not_stored(cache):
+    """A DB read that started before an invalidation must not populate the cache."""
+    generation = cache.generation
+    cache.invalidate_items([1])
+
+    assert cache.set("T4_BAG", 1, b"[]", generation) is False
+    assert cache.set("T4_BAG", 1, b"[]", cache.generation) is True
+
+
+def test_inactive_cache_never_serves(cache):
+    cache.set("T4_BAG", 1, b"[]", cache.generation)
+    cache.set_active(False)
+
+    assert cache.get("T4_BAG") is None
+    assert cache.set("T4_BAG", 1, b"[]", cache.generation) is False
+
+
+def test_lru_eviction(cache):
+    cache.set("A", 1, b"a", cache.generation)
+    cache.set("B", 2, b"b", cache.generation)
+    cache.get("A")
+    cache.set("C", 3, b"c", cache.generation)
+
+    assert cache.get("B") is None
+    assert cache.get("A") is not None
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,166 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from src.core.notifications import PriceUpdate
+from src.services import price_cube as price_cube_module
+from src.services.crafting import service as crafting_service_module
+from src.services.crafting.service import CraftingService
+from src.services.market_snapshot import MarketSnapshot, write_market_snapshot
+from src.services.price_cube import PriceCube
+
+ITEMS = [3, 7, 11]
+LOCATIONS = [1, 4]
+# item, location, quality, sell_min, sell_max, buy_min, buy_max, updated
+ROWS = [
+    (3, 1, 1, 100, 120, 80, 90, 1700000000),
+    (7, 4, 2, 0, 0, 50, 60, 1700000100),   # no sell orders
+    (99, 1, 1, 1, 1, 1, 1, 1700000000),     # unknown item, ignored
+]
+
+
+def result(scalars=None, rows=None):
+    res = MagicMock()
+    res.scalars.return_value.all.return_value = scalars
+    res.all.return_value = rows
+    return res
+
+
+def digest(item_ids):
+    res = MagicMock()
+    res.scalar_one.return_value = price_cube_module._ids_digest(item_ids)
+    return res
+
+
+@asynccontextmanager
+async def session_maker():
+    yield None
+
+
+def session_for(*results):
+    return MagicMock(execute=AsyncMock(side_effect=list(results)))
+
+
+@pytest.fixture
+async def cube():
+    cube = PriceCube()
+    cube.handle_listener_state(True)
+    await cube.load(session_for(result(ITEMS), result(LOCATIONS), result(rows=ROWS)))
+    return cube
+
+
+async def test_load_and_lookups(cube):
+    assert cube.ready
+    assert cube.prices.shape == (3, 2, 5, 4)
+    assert cube.get(3, 1) == {"sell_price_min": 100.0, "sell_price_max": 120.0, "buy_price_min": 80.0, "buy_price_max": 90.0}
+    assert cube.get(7, 4, quality=2)["sell_price_min"] is None
+    assert cube.get(99, 1) is None
+    assert cube.stats()["prices"] == 2
+
+
+async def test_matrix_matches_load_price_matrix_contract(cube):
+    matrix = cube.matrix(np.array([7, 3, 42]), [4, 1, 8])
+    assert matrix.shape == (3, 3)
+    assert matrix[1, 1] == 100
+    assert np.isnan(matrix).sum() == 8
+
+
+async def test_crafting_reads_database_while_listener_is_down(cube, monkeypatch):
+    fallback = AsyncMock(return_value=np.full((1, 1), 7.0))
+    monkeypatch.setattr(crafting_service_module, "load_price_matrix", fallback)
+    session = MagicMock(execute=AsyncMock())
+
+    # Never connected: nothing would keep the cube current, it is not even loaded
+    never = CraftingService("https://dumps.test/recipes.json", price_cube=PriceCube())
+    assert (await never._price_matrix(session, np.array([3]), [1]))[0, 0] == 7
+    session.execute.assert_not_awaited()
+
+    # Connected cube is used, until the connection drops
+    service = CraftingService("https://dumps.test/recipes.json", price_cube=cube)
+    assert (await service._price_matrix(session, np.array([3]), [1]))[0, 0] == 100
+    cube.handle_listener_state(False)
+    assert not await cube.ensure_loaded(session)
+    assert (await service._price_matrix(session, np.array([3]), [1]))[0, 0] == 7
+    assert fallback.await_count == 2
+
+
+async def test_update_reloads_changed_cells(cube, monkeypatch):
+    session = session_for(result(rows=[(3, 1, 1, 95, 120, 80, 90, 1700000200)]))
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    monkeypatch.setattr(price_cube_module, "async_session_maker", lambda: session)
+
+    assert await cube.handle_update(PriceUpdate(location_id=1, item_ids=(3, 11))) == 1
+    assert cube.get(3, 1)["sell_price_min"] == 95
+    assert cube.updated_at[0, 0, 0] == 1700000200
+
+    # Unknown item or a notification gap: reload on next use
+    assert await cube.handle_update(PriceUpdate(location_id=1, item_ids=(12,))) == 0
+    assert not cube.ready
+
+
+async def test_updates_are_applied_in_arrival_order(cube, monkeypatch):
+    # The first read is slower: unserialized, its older price would land last
+    reads = iter([(0.02, 95), (0.0, 96)])
+
+    async def fetch_rows(session, item_ids, location_id):
+        delay, price = next(reads)
+        await asyncio.sleep(delay)
+        return np.array([(3, 1, 1, price, 120, 80, 90, 1700000200 + price)], dtype=np.int64)
+
+    monkeypatch.setattr(cube, "_fetch_rows", fetch_rows)
+    monkeypatch.setattr(price_cube_module, "async_session_maker", session_maker)
+    update = PriceUpdate(location_id=1, item_ids=(3,))
+
+    await asyncio.gather(cube.handle_update(update), cube.handle_update(update))
+
+    assert cube.get(3, 1)["sell_price_min"] == 96
+    assert cube.ready and cube.updates == 2
+
+
+async def test_failed_fetch_marks_cube_stale(cube, monkeypatch):
+    async def fetch_rows(session, item_ids, location_id):
+        raise ConnectionError("database went away")
+
+    monkeypatch.setattr(cube, "_fetch_rows", fetch_rows)
+    monkeypatch.setattr(price_cube_module, "async_session_maker", session_maker)
+
+    assert await cube.handle_update(PriceUpdate(location_id=1, item_ids=(3,))) == 0
+    assert not cube.ready
+
+
+async def test_load_maps_snapshot_and_catches_up(cube, tmp_path):
+    path = tmp_path / "market.bin"
+    write_market_snapshot(path, cube.item_ids, cube.location_ids, cube.prices, cube.updated_at, generation=3)
+
+    caught_up = result(rows=[(11, 4, 1, 40, 45, 30, 35, 1700000300)])
+    mapped = PriceCube(snapshot_path=str(path))
+    mapped.handle_listener_state(True)
+    await mapped.load(session_for(digest(ITEMS), result(LOCATIONS), caught_up))
+
+    assert mapped.ready and mapped.stats()["snapshot_generation"] == 3
+    assert mapped.get(3, 1)["sell_price_min"] == 100
+    assert mapped.get(11, 4)["sell_price_min"] == 40
+    assert MarketSnapshot(path).prices[2, 1, 0, 0] != 40  # the file is untouched
+
+
+@pytest.mark.parametrize("item_ids, location_ids", [
+    ([3, 7, 12], LOCATIONS),  # same count, other items
+    (ITEMS, [1, 5]),
+])
+async def test_snapshot_of_another_catalog_is_not_mapped(cube, tmp_path, item_ids, location_ids):
+    path = tmp_path / "market.bin"
+    write_market_snapshot(path, cube.item_ids, cube.location_ids, cube.prices, cube.updated_at, generation=3)
+
+    loaded = PriceCube(snapshot_path=str(path))
+    loaded.handle_listener_state(True)
+    await loaded.load(session_for(
+        digest(item_ids), result(location_ids),
+        result(item_ids), result(location_ids), result(rows=[]),
+    ))
+
+    assert loaded.ready and loaded.stats()["snapshot_generation"] is None
+    assert loaded.item_ids.tolist() == item_ids and loaded.location_ids == location_ids
@@ -0,0 +1,57 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.core.notifications import PriceUpdate
+from src.services.price_feed import PriceFeed
+
+
+@pytest.fixture
+def fetch_rows():
+    async def fetch(item_ids, location_id):
+        return [{"item_id": i, "location_id": location_id} for i in item_ids]
+    return AsyncMock(side_effect=fetch)
+
+
+@pytest.fixture
+def feed(fetch_rows):
+    return PriceFeed(fetch_rows=fetch_rows)
+
+
+@pytest.mark.asyncio
+async def test_one_read_reaches_many_subscribers(feed, fetch_rows):
+    subs = [feed.subscribe({1}, set()) for _ in range(50)]
+
+    await feed.handle_update(PriceUpdate(location_id=3, item_ids=(1, 2)))
+
+    # Only the subscribed item is read, and only once
+    fetch_rows.assert_awaited_once_with([1], 3)
+    for sub in subs:
+        message = sub.queue.get_nowait()
+        assert message == {"event": "prices", "data": [{"item_id": 1, "location_id": 3}]}
+
+
+@pytest.mark.asyncio
+async def test_location_filters(feed, fetch_rows):
+    by_item = feed.subscribe({1}, {5})
+    by_location = feed.subscribe(set(), {3})
+
+    await feed.handle_update(PriceUpdate(location_id=3, item_ids=(1, 2)))
+
+    assert by_item.queue.empty()
+    assert [row["item_id"] for row in by_location.queue.get_nowait()["data"]] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_no_subscribers_no_query(feed, fetch_rows):
+    await feed.handle_update(PriceUpdate(location_id=3, item_ids=(1,)))
+    fetch_rows.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_dropped(feed):
+    sub = feed.subscribe({1}, set())
+    for _ in range(sub.queue.maxsize + 1):
+        await feed.handle_update(PriceUpdate(location_id=3, item_ids=(1,)))
+
+    assert sub.closed
+    assert feed.subscribers == 0
+    assert sub.queue.get_nowait()["event"] == "overflow"
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Import timings are measured by benchmarks/import_time.py, not asserted here:
+# they depend on the machine. These tests guard the lazy imports behind them.
+
+
+def _clean_env() -> dict:
+    """No DB settings: importing must not need them."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("DB_")}
+    env["PYTHONPATH"] = str(ROOT)
+    return env
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, env=_clean_env(), capture_output=True, text=True, timeout=60
+    )
+
+
+@pytest.mark.parametrize("module, forbidden", [
+    ("src.main", ["src.seeding"]),
+    ("src.worker", ["fastapi", "numpy", "src.seeding"]),
+    ("src.db.models", ["fastapi", "numpy"]),
+])
+def test_import_is_lazy(module, forbidden):
+    code = (
+        f"import sys, {module}\n"
+        "from src.db import database\n"
+        "assert database._engine is None, 'engine created at import'\n"
+        f"print([m for m in {forbidden!r} if m in sys.modules])"
+    )
+    result = _run(code)
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout.strip() == "[]"